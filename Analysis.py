@@ -0,0 +1,330 @@
+# Author: Jonathan Reuter
+# GitHub username: ReuterJo
+# Date: 10/18/2026
+# Description: Analyzes files of Othello positions in bulk. Positions are read lazily, one per line, skipping any
+# position already seen, and analyzed in chunks across a pool of worker processes using the Othello class. Each
+# position's legal moves, mobility, best move and score are written to a JSON lines file as soon as its chunk is
+# done, and a checkpoint is saved after every chunk, so that an interrupted job resumes where it stopped instead of
+# starting over.
+
+import argparse
+import collections
+import concurrent.futures
+import json
+import os
+import time
+
+from Othello import Othello
+from Bitboard import parse_board, board_to_bitboards, bitboards_to_board, count_bits
+from Search import AlphaBetaSearcher, opposite_color
+from Transposition import TranspositionTable
+
+# default search depth for the best move, and the number of empty squares at or below which positions are solved
+# exactly instead
+DEFAULT_DEPTH = 4
+DEFAULT_ENDGAME_EMPTIES = 12
+
+# number of positions sent to a worker at a time
+CHUNK_SIZE = 64
+
+# number of buckets in the transposition table of each search, small since each position is searched separately
+ANALYSIS_TABLE_SIZE = 4096
+
+
+def parse_position(text):
+    """
+    Parses a position written as a board, optionally followed by the color to move, which defaults to black. The
+    board is either 64 characters of X, O and . row by row, in which whitespace is ignored, or the JSON form of a
+    10x10 board list as returned by get_board. Returns (black, white, color). Raises ValueError if the position is
+    not valid.
+    """
+    text = text.strip()
+    color = 'black'
+    for name in ('black', 'white'):
+        if text.endswith(name):
+            color = name
+            text = text[:-len(name)].strip()
+            break
+
+    if text.startswith('['):
+        try:
+            board = json.loads(text)
+        except json.JSONDecodeError:
+            raise ValueError('A board list must be valid JSON')
+        if (not isinstance(board, list) or len(board) != 10
+                or any(not isinstance(row, list) or len(row) != 10 for row in board)):
+            raise ValueError('A board list must have 10 rows of 10 squares')
+        if any(not isinstance(square, str) for row in board for square in row):
+            raise ValueError('The squares of a board list must be strings')
+        black, white = board_to_bitboards(board)
+        if count_bits(black) + count_bits(white) != sum(row.count('X') + row.count('O') for row in board):
+            raise ValueError('A board list must only have pieces on its playable squares')
+    else:
+        black, white = parse_board(text)
+    return black, white, color
+
+
+def position_hash(black, white, color):
+    """Returns the hash under which a position is deduplicated, which is the same in every process and every run"""
+    return hash((black, white, color == 'white'))
+
+
+def read_positions(path):
+    """
+    Reads a file of positions lazily, one per line, skipping blank lines and lines starting with #. Yields
+    (line_number, position, error), where position is (black, white, color), or None if the line could not be
+    parsed, in which case error describes why.
+    """
+    with open(path) as positions_file:
+        for line_number, line in enumerate(positions_file, 1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            try:
+                yield line_number, parse_position(line), None
+            except ValueError as error:
+                yield line_number, None, str(error)
+
+
+def analyze_position(black, white, color, depth=DEFAULT_DEPTH, endgame_empties=DEFAULT_ENDGAME_EMPTIES):
+    """
+    Analyzes a position with the player of the given color to move. Returns a dictionary with the player's legal
+    moves, the mobility of the player and the opponent, the best move, or None for a pass, and the score from the
+    player's point of view. With at most endgame_empties empty squares the score is the exact final disc
+    difference; otherwise it is the result of a search to the given depth. 'exact' tells which.
+    """
+    game = Othello('bitboard')
+    game.load_board(bitboards_to_board(black, white))
+    opponent_color = opposite_color(color)
+    legal_moves = sorted(game.return_available_positions(color))
+    opponent_moves = game.return_available_positions(opponent_color)
+    empties = 64 - count_bits(black | white)
+
+    # a player without a move passes, so the position is worth the opposite of the opponent's
+    exact = empties <= endgame_empties or (not legal_moves and not opponent_moves)
+    if exact:
+        best_move, score, _ = game.solve_endgame(color)
+    elif legal_moves:
+        searcher = AlphaBetaSearcher(float('inf'), depth, table=TranspositionTable(ANALYSIS_TABLE_SIZE))
+        best_move = searcher.search(game, color)
+        score = searcher.get_statistics()['score']
+    else:
+        searcher = AlphaBetaSearcher(float('inf'), depth, table=TranspositionTable(ANALYSIS_TABLE_SIZE))
+        searcher.search(game, opponent_color)
+        best_move = None
+        score = -searcher.get_statistics()['score']
+
+    return {'legal_moves': [list(move) for move in legal_moves],
+            'mobility': len(legal_moves),
+            'opponent_mobility': len(opponent_moves),
+            'best_move': list(best_move) if best_move is not None else None,
+            'score': score,
+            'exact': exact}
+
+
+def analyze_chunk(chunk):
+    """
+    Analyzes a chunk of positions in a worker process. The chunk is a tuple (depth, endgame_empties, items), where
+    each item is (line_number, position, error) as yielded by read_positions. Returns the JSON lines for the items,
+    in order, with an error record for each position that could not be parsed.
+    """
+    depth, endgame_empties, items = chunk
+    lines = []
+    for line_number, position, error in items:
+        if position is None:
+            record = {'line': line_number, 'error': error}
+        else:
+            black, white, color = position
+            record = {'line': line_number,
+                      'board': ''.join(piece for row in bitboards_to_board(black, white)[1:9] for piece in row[1:9]),
+                      'color': color}
+            record.update(analyze_position(black, white, color, depth, endgame_empties))
+        lines.append(json.dumps(record) + '\n')
+    return lines
+
+
+def load_checkpoint(path, input_path):
+    """Returns the checkpoint saved at a path for the given input file, or None if there is none"""
+    if path is None or not os.path.exists(path):
+        return None
+    with open(path) as checkpoint_file:
+        checkpoint = json.load(checkpoint_file)
+    if checkpoint.get('input') != os.path.abspath(input_path):
+        raise ValueError('The checkpoint belongs to a different input file')
+    return checkpoint
+
+
+def save_checkpoint(path, checkpoint):
+    """Saves a checkpoint, replacing the previous one in a single step so that it is never left half written"""
+    temporary_path = path + '.tmp'
+    with open(temporary_path, 'w') as checkpoint_file:
+        json.dump(checkpoint, checkpoint_file)
+    os.replace(temporary_path, path)
+
+
+class BatchAnalyzer:
+    """
+    Analyzes every distinct position of a file, writing one JSON line per position to an output file in the order
+    of the input. Chunks of positions are analyzed by a pool of worker processes, with only a few chunks per worker
+    in flight at once, so memory use does not grow with the size of the file apart from the hashes of the positions
+    seen. If a checkpoint path is given, the progress is saved there after every chunk is written, and a later run
+    with the same files continues after the last saved chunk.
+    """
+    def __init__(self, input_path, output_path, checkpoint_path=None, workers=None, depth=DEFAULT_DEPTH,
+                 endgame_empties=DEFAULT_ENDGAME_EMPTIES, chunk_size=CHUNK_SIZE):
+        """
+        Creates an analyzer. With workers set to 1, positions are analyzed in this process; otherwise a pool of that
+        many processes is used, defaulting to one per CPU.
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+        self._input_path = input_path
+        self._output_path = output_path
+        self._checkpoint_path = checkpoint_path
+        self._workers = workers
+        self._depth = depth
+        self._endgame_empties = endgame_empties
+        self._chunk_size = chunk_size
+        self._checkpoint = None
+        self._output_file = None
+        self._executor = None
+
+        # chunks waiting to be written, in input order, as (last_line, counts, future or lines)
+        self._pending = collections.deque()
+
+    def get_checkpoint(self):
+        """
+        Returns the progress of the most recent run: the last input 'line' written, the 'output_size' in bytes, and
+        the counts of 'positions' read, positions 'analyzed', 'duplicates' skipped and lines with 'errors'
+        """
+        return self._checkpoint
+
+    def submit_chunk(self, last_line, counts, items):
+        """Starts analyzing a chunk of items, first writing older chunks if too many are in flight"""
+        chunk = (self._depth, self._endgame_empties, items)
+        if self._executor is None:
+            self._pending.append((last_line, counts, analyze_chunk(chunk)))
+        else:
+            self._pending.append((last_line, counts, self._executor.submit(analyze_chunk, chunk)))
+        while len(self._pending) > 2 * self._workers:
+            self.write_chunk()
+
+    def write_chunk(self):
+        """Writes the results of the oldest pending chunk, waiting for them if needed, and saves a checkpoint"""
+        last_line, counts, result = self._pending.popleft()
+        lines = result if self._executor is None else result.result()
+        self._output_file.writelines(lines)
+        self._output_file.flush()
+        checkpoint = self._checkpoint
+        checkpoint['line'] = last_line
+        checkpoint['output_size'] = self._output_file.tell()
+        for key, count in counts.items():
+            checkpoint[key] += count
+        if self._checkpoint_path is not None:
+            save_checkpoint(self._checkpoint_path, checkpoint)
+
+    def run(self):
+        """
+        Analyzes the file, continuing from the checkpoint if there is one. Returns a dictionary with the totals of the
+        checkpoint, the line 'resumed_from', and the 'elapsed' seconds and positions analyzed per second of this run.
+        """
+        checkpoint = load_checkpoint(self._checkpoint_path, self._input_path)
+        if checkpoint is None:
+            checkpoint = {'input': os.path.abspath(self._input_path), 'line': 0, 'output_size': 0, 'positions': 0,
+                          'analyzed': 0, 'duplicates': 0, 'errors': 0}
+        self._checkpoint = checkpoint
+        resumed_from = checkpoint['line']
+        previously_analyzed = checkpoint['analyzed']
+
+        # drop anything written after the last checkpoint, since it will be written again. The output must still hold
+        # everything written up to the checkpoint, or the results before it would be lost.
+        if resumed_from > 0:
+            if not os.path.exists(self._output_path) or os.path.getsize(self._output_path) < checkpoint['output_size']:
+                raise ValueError('The output file is missing results recorded in the checkpoint: ' + self._output_path)
+            mode = 'r+'
+        else:
+            mode = 'w'
+        self._output_file = open(self._output_path, mode)
+        self._output_file.truncate(checkpoint['output_size'])
+        self._output_file.seek(checkpoint['output_size'])
+        if self._workers != 1:
+            self._executor = concurrent.futures.ProcessPoolExecutor(max_workers=self._workers)
+        start = time.perf_counter()
+
+        try:
+            seen = set()
+            items = []
+            counts = {'positions': 0, 'analyzed': 0, 'duplicates': 0, 'errors': 0}
+            last_line = resumed_from
+            for line_number, position, error in read_positions(self._input_path):
+                # positions up to the checkpoint were already written, but are still remembered as seen
+                if line_number <= resumed_from:
+                    if position is not None:
+                        seen.add(position_hash(*position))
+                    continue
+
+                last_line = line_number
+                counts['positions'] += 1
+                if position is None:
+                    counts['errors'] += 1
+                    items.append((line_number, None, error))
+                else:
+                    key = position_hash(*position)
+                    if key in seen:
+                        counts['duplicates'] += 1
+                        continue
+                    seen.add(key)
+                    counts['analyzed'] += 1
+                    items.append((line_number, position, None))
+
+                if len(items) >= self._chunk_size:
+                    self.submit_chunk(last_line, counts, items)
+                    items = []
+                    counts = {'positions': 0, 'analyzed': 0, 'duplicates': 0, 'errors': 0}
+
+            # the last chunk may hold only duplicates, which still move the checkpoint forward
+            if counts['positions'] > 0:
+                self.submit_chunk(last_line, counts, items)
+            while self._pending:
+                self.write_chunk()
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown(cancel_futures=True)
+                self._executor = None
+            self._pending.clear()
+            self._output_file.close()
+
+        elapsed = time.perf_counter() - start
+        analyzed = checkpoint['analyzed'] - previously_analyzed
+        return {'positions': checkpoint['positions'],
+                'analyzed': checkpoint['analyzed'],
+                'duplicates': checkpoint['duplicates'],
+                'errors': checkpoint['errors'],
+                'resumed_from': resumed_from,
+                'elapsed': elapsed,
+                'positions_per_second': analyzed / elapsed if elapsed > 0 else 0.0}
+
+
+def main():
+    """Analyzes a file of positions from the command line"""
+    parser = argparse.ArgumentParser(description='Analyze a file of Othello positions into a JSON lines file')
+    parser.add_argument('input', help='file with one position per line: a board, then optionally black or white')
+    parser.add_argument('output', help='JSON lines file to write')
+    parser.add_argument('--checkpoint', help='checkpoint file, used to resume an interrupted run')
+    parser.add_argument('--workers', type=int, default=None, help='number of worker processes')
+    parser.add_argument('--depth', type=int, default=DEFAULT_DEPTH, help='search depth for the best move')
+    parser.add_argument('--endgame-empties', type=int, default=DEFAULT_ENDGAME_EMPTIES,
+                        help='solve positions with at most this many empty squares exactly')
+    args = parser.parse_args()
+
+    analyzer = BatchAnalyzer(args.input, args.output, args.checkpoint, args.workers, args.depth, args.endgame_empties)
+    results = analyzer.run()
+    if results['resumed_from']:
+        print('resumed after line %d' % results['resumed_from'])
+    print('%d positions: %d analyzed, %d duplicates, %d errors' % (results['positions'], results['analyzed'],
+                                                                    results['duplicates'], results['errors']))
+    print('%.1f positions/sec' % results['positions_per_second'])
+
+
+if __name__ == '__main__':
+    main()
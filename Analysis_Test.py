@@ -0,0 +1,129 @@
+# Author: Jonathan Reuter
+# GitHub username: ReuterJo
+# Date: 10/18/2026
+# Description: Contains test cases for Analysis.py
+
+import json
+import os
+import tempfile
+import unittest
+from Othello import Othello
+from Bitboard import START_BLACK, START_WHITE, parse_board, bitboards_to_board
+from Analysis import parse_position, position_hash, analyze_position, BatchAnalyzer
+
+# a position with 12 empty squares, and one in the middle of a game, with white to move
+ENDGAME_BOARD = 'XXXXXXXX XXXXXXXX OOOOOOOO XXXXOOOO OOOOXXXX XOXOXOXO ........ XO..O..X'
+MIDGAME_BOARD = '........ ........ ..X..... ...XXO.. ...XXX.. ..O..... ........ ........'
+
+
+class InterruptedAnalyzer(BatchAnalyzer):
+    """A BatchAnalyzer that stops with an error after writing a number of chunks, as if the job had been killed"""
+    def __init__(self, *args, chunks=1, **kwargs):
+        """Creates an analyzer that stops after writing the given number of chunks"""
+        super().__init__(*args, **kwargs)
+        self._chunks = chunks
+
+    def write_chunk(self):
+        """Writes a chunk, or stops once the number of chunks has been written"""
+        if self._chunks == 0:
+            raise KeyboardInterrupt
+        self._chunks -= 1
+        super().write_chunk()
+
+
+class TestAnalysis(unittest.TestCase):
+    """Test cases for Analysis.py"""
+
+    def setUp(self):
+        """Writes a file of positions with a duplicate and a line that cannot be parsed"""
+        self._directory = tempfile.TemporaryDirectory()
+        self._input = os.path.join(self._directory.name, 'positions.txt')
+        self._output = os.path.join(self._directory.name, 'results.jsonl')
+        self._checkpoint = os.path.join(self._directory.name, 'checkpoint.json')
+        lines = ['# start position, as compact text and as a board list',
+                 '.' * 27 + 'OX......XO' + '.' * 27,
+                 json.dumps(Othello().get_board()) + ' white',
+                 '',
+                 MIDGAME_BOARD + ' white',
+                 'not a board',
+                 ENDGAME_BOARD + ' black',
+                 '.' * 27 + 'OX......XO' + '.' * 27 + ' black']
+        with open(self._input, 'w') as input_file:
+            input_file.write('\n'.join(lines) + '\n')
+
+    def tearDown(self):
+        """Removes the temporary files"""
+        self._directory.cleanup()
+
+    def read_output(self):
+        """Returns the records of the output file"""
+        with open(self._output) as output_file:
+            return [json.loads(line) for line in output_file]
+
+    def test_case_1(self):
+        """Test parse_position with both board formats, and position_hash"""
+        self.assertEqual((START_BLACK, START_WHITE, 'black'), parse_position('.' * 27 + 'OX......XO' + '.' * 27))
+        self.assertEqual((START_BLACK, START_WHITE, 'white'), parse_position(json.dumps(Othello().get_board()) +
+                                                                             ' white'))
+        for text in ('XO', '[[1, 2]]', '[["*"', json.dumps([['X'] * 10] * 10), json.dumps(list(range(1, 11))),
+                     json.dumps([[0] * 10] * 10), '["*"]'):
+            with self.assertRaises(ValueError):
+                parse_position(text)
+        self.assertEqual(position_hash(1, 2, 'black'), position_hash(1, 2, 'black'))
+        self.assertNotEqual(position_hash(1, 2, 'black'), position_hash(1, 2, 'white'))
+
+    def test_case_2(self):
+        """Test analyze_position in the middle of a game and in an endgame solved exactly"""
+        black, white = parse_board(MIDGAME_BOARD)
+        analysis = analyze_position(black, white, 'white', 2)
+        self.assertEqual(len(analysis['legal_moves']), analysis['mobility'])
+        self.assertIn(analysis['best_move'], analysis['legal_moves'])
+        self.assertFalse(analysis['exact'])
+
+        black, white = parse_board(ENDGAME_BOARD)
+        analysis = analyze_position(black, white, 'black')
+        self.assertTrue(analysis['exact'])
+        game = Othello('bitboard')
+        game.load_board(bitboards_to_board(black, white))
+        best_move, score, _ = game.solve_endgame('black')
+        self.assertEqual(score, analysis['score'])
+        self.assertEqual(list(best_move), analysis['best_move'])
+
+    def test_case_3(self):
+        """Test a whole run, which skips the duplicate and records the error, keeping the order of the input"""
+        results = BatchAnalyzer(self._input, self._output, workers=1, depth=1).run()
+        self.assertEqual((6, 4, 1, 1, 0), (results['positions'], results['analyzed'], results['duplicates'],
+                                           results['errors'], results['resumed_from']))
+        records = self.read_output()
+        self.assertEqual([2, 3, 5, 6, 7], [record['line'] for record in records])
+        self.assertEqual('black', records[0]['color'])
+        self.assertEqual([[3, 4], [4, 3], [5, 6], [6, 5]], records[0]['legal_moves'])
+        self.assertEqual(4, records[1]['opponent_mobility'])
+        self.assertEqual('white', records[1]['color'])
+        self.assertIn('error', records[3])
+
+    def test_case_4(self):
+        """Test resuming an interrupted run from its checkpoint, and that a pool of workers gives the same output"""
+        BatchAnalyzer(self._input, self._output, workers=1, depth=1).run()
+        expected = self.read_output()
+        os.remove(self._output)
+
+        with self.assertRaises(KeyboardInterrupt):
+            InterruptedAnalyzer(self._input, self._output, self._checkpoint, workers=1, depth=1, chunk_size=2,
+                                chunks=1).run()
+        self.assertEqual(expected[:2], self.read_output())
+
+        # resuming without the results written before the checkpoint is refused, rather than padding the file
+        os.rename(self._output, self._output + '.moved')
+        with self.assertRaises(ValueError):
+            BatchAnalyzer(self._input, self._output, self._checkpoint, workers=1, depth=1).run()
+        os.rename(self._output + '.moved', self._output)
+
+        # a half-written line after the checkpoint is dropped on resuming
+        with open(self._output, 'a') as output_file:
+            output_file.write('{"line": 5, "bo')
+        results = BatchAnalyzer(self._input, self._output, self._checkpoint, workers=2, depth=1, chunk_size=2).run()
+        self.assertEqual(3, results['resumed_from'])
+        self.assertEqual((6, 4, 1, 1), (results['positions'], results['analyzed'], results['duplicates'],
+                                        results['errors']))
+        self.assertEqual(expected, self.read_output())
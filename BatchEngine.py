@@ -0,0 +1,257 @@
+# Author: Jonathan Reuter
+# GitHub username: ReuterJo
+# Date: 10/18/2026
+# Description: Implements a batched Othello engine that steps many games in lockstep using NumPy. Each game is stored
+# as a pair of packed 64-bit bitboards, using the same square numbering and rules as Bitboard.py and the Othello class,
+# so that legal moves, flips and scores are computed for every game with a handful of array operations per call.
+
+import argparse
+import random
+import time
+
+import numpy as np
+
+from Bitboard import START_BLACK, START_WHITE, board_to_bitboards, bitboards_to_board
+from Othello import Othello
+
+# masks removing bits that wrapped around to the other side of the board, see Bitboard.py
+NOT_LEFT_COLUMN = np.uint64(0xFEFEFEFEFEFEFEFE)
+NOT_RIGHT_COLUMN = np.uint64(0x7F7F7F7F7F7F7F7F)
+FULL_MASK = np.uint64(0xFFFFFFFFFFFFFFFF)
+
+LEFT_SHIFTS = ((np.uint64(1), NOT_LEFT_COLUMN), (np.uint64(7), NOT_RIGHT_COLUMN), (np.uint64(8), FULL_MASK),
+               (np.uint64(9), NOT_LEFT_COLUMN))
+RIGHT_SHIFTS = ((np.uint64(1), NOT_RIGHT_COLUMN), (np.uint64(7), NOT_LEFT_COLUMN), (np.uint64(8), FULL_MASK),
+                (np.uint64(9), NOT_RIGHT_COLUMN))
+
+ONE = np.uint64(1)
+
+
+def generate_moves(own, opponent):
+    """Returns an array of legal move bitboards, one per game, for the players owning the own bitboards"""
+    empty = ~(own | opponent)
+    moves = np.zeros_like(own)
+
+    # directions towards higher square numbers
+    for shift, mask in LEFT_SHIFTS:
+        opponent_run = opponent & mask
+        candidates = (own << shift) & opponent_run
+        # a run of opponent pieces is at most 6 long on an 8x8 board
+        for _ in range(5):
+            candidates |= (candidates << shift) & opponent_run
+        moves |= (candidates << shift) & mask & empty
+
+    # directions towards lower square numbers
+    for shift, mask in RIGHT_SHIFTS:
+        opponent_run = opponent & mask
+        candidates = (own >> shift) & opponent_run
+        for _ in range(5):
+            candidates |= (candidates >> shift) & opponent_run
+        moves |= (candidates >> shift) & mask & empty
+
+    return moves
+
+
+def compute_flips(own, opponent, moves):
+    """
+    Returns an array of bitboards of the opponent pieces captured by placing the single-bit moves, one per game. A
+    move of zero captures nothing.
+    """
+    flips = np.zeros_like(own)
+    zero = np.uint64(0)
+
+    # directions towards higher square numbers
+    for shift, mask in LEFT_SHIFTS:
+        opponent_run = opponent & mask
+        line = (moves << shift) & opponent_run
+        for _ in range(5):
+            line |= (line << shift) & opponent_run
+        bounded = ((line << shift) & mask & own) != 0
+        flips |= np.where(bounded, line, zero)
+
+    # directions towards lower square numbers
+    for shift, mask in RIGHT_SHIFTS:
+        opponent_run = opponent & mask
+        line = (moves >> shift) & opponent_run
+        for _ in range(5):
+            line |= (line >> shift) & opponent_run
+        bounded = ((line >> shift) & mask & own) != 0
+        flips |= np.where(bounded, line, zero)
+
+    return flips
+
+
+def count_bits(bits):
+    """Returns the number of squares set in each bitboard of an array"""
+    # np.bitwise_count is only available from NumPy 2.0
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(bits).astype(np.int64)
+    return unpack_squares(bits).sum(axis=1, dtype=np.int64)
+
+
+def unpack_squares(bits):
+    """Unpacks an array of N bitboards into an (N, 64) array of 0/1 values, indexed by square number"""
+    as_bytes = bits.astype('<u8').view(np.uint8).reshape(-1, 8)
+    return np.unpackbits(as_bytes, axis=1, bitorder='little')
+
+
+class BatchEngine:
+    """
+    Represents a batch of Othello games that are stepped together. Black moves first in every game, and a player with
+    no legal moves passes automatically. A game is finished once both players have passed in a row.
+    """
+    def __init__(self, count):
+        """Creates a batch of count new games, with pieces setup corresponding to their starting positions"""
+        self._own = np.full(count, START_BLACK, dtype=np.uint64)
+        self._opponent = np.full(count, START_WHITE, dtype=np.uint64)
+        self._white_to_move = np.zeros(count, dtype=bool)
+        self._passes = np.zeros(count, dtype=np.int8)
+
+    @classmethod
+    def from_games(cls, games, colors):
+        """
+        Creates a batch from existing Othello games and the color to move in each of them. The games themselves are
+        not modified.
+        """
+        engine = cls(len(games))
+        for index, (game, color) in enumerate(zip(games, colors)):
+            black, white = board_to_bitboards(game.get_board())
+            engine.set_game(index, black, white, color)
+        return engine
+
+    def get_count(self):
+        """Returns the number of games in the batch"""
+        return len(self._own)
+
+    def set_game(self, index, black, white, color):
+        """Replaces a single game of the batch with the given bitboards and color to move"""
+        if color == 'white':
+            self._own[index], self._opponent[index] = white, black
+        else:
+            self._own[index], self._opponent[index] = black, white
+        self._white_to_move[index] = color == 'white'
+        self._passes[index] = 0
+
+    def get_bitboards(self):
+        """Returns the boards as a (black, white) pair of uint64 arrays"""
+        black = np.where(self._white_to_move, self._opponent, self._own)
+        white = np.where(self._white_to_move, self._own, self._opponent)
+        return black, white
+
+    def get_board(self, index):
+        """Returns the state of a single game as a 2D list, in the same format as Othello.get_board"""
+        black, white = self.get_bitboards()
+        return bitboards_to_board(int(black[index]), int(white[index]))
+
+    def get_colors_to_move(self):
+        """Returns an array with the color to move in each game, as 'white' or 'black'"""
+        return np.where(self._white_to_move, 'white', 'black')
+
+    def get_finished(self):
+        """Returns a boolean array marking the games that are finished"""
+        return self._passes >= 2
+
+    def legal_moves(self):
+        """Returns an array of legal move bitboards for the player to move in each game"""
+        return generate_moves(self._own, self._opponent)
+
+    def apply_moves(self, moves):
+        """
+        Plays one single-bit move per game for the player to move, then passes the turn to the opponent. A move of
+        zero is a pass. Finished games are left unchanged. Moves are assumed to be legal.
+        """
+        active = self._passes < 2
+        moves = np.where(active, moves, np.uint64(0))
+        flips = compute_flips(self._own, self._opponent, moves)
+
+        # place the moves and flip captured pieces, then swap sides for every game still in progress
+        own = self._own | moves | flips
+        opponent = self._opponent ^ flips
+        self._own = np.where(active, opponent, own)
+        self._opponent = np.where(active, own, opponent)
+        self._white_to_move = np.where(active, ~self._white_to_move, self._white_to_move)
+
+        # track consecutive passes, which end the game once both players are out of moves
+        self._passes = np.where(moves != 0, 0, self._passes + active).astype(np.int8)
+
+    def choose_random_moves(self, legal, rng):
+        """Returns an array with one uniformly chosen single-bit move from each legal move bitboard, or zero if none"""
+        picks = (rng.random(len(legal)) * count_bits(legal)).astype(np.int64)
+
+        # clear the lowest set bit of each bitboard until the picked move is the lowest remaining one
+        remaining = legal.copy()
+        for index in range(int(picks.max(initial=0))):
+            clear = picks > index
+            remaining[clear] &= remaining[clear] - ONE
+        return remaining & (~remaining + ONE)
+
+    def step_random(self, rng):
+        """Plays one uniformly random legal move, or a pass, in every unfinished game"""
+        self.apply_moves(self.choose_random_moves(self.legal_moves(), rng))
+
+    def play_random_games(self, rng):
+        """Plays random moves in every game until all games are finished. Returns the number of steps taken."""
+        steps = 0
+        while not self.get_finished().all():
+            self.step_random(rng)
+            steps += 1
+        return steps
+
+    def tabulate_scores(self):
+        """Returns the scores of every game as a tuple of arrays (white_scores, black_scores)"""
+        black, white = self.get_bitboards()
+        return count_bits(white), count_bits(black)
+
+
+def play_random_game(rng):
+    """Plays a single random game through an Othello object, as a baseline for the batch engine. Returns the score."""
+    game = Othello()
+    color = 'black'
+    passes = 0
+    while passes < 2:
+        available_positions = game.return_available_positions(color)
+        if available_positions:
+            game.make_move(color, rng.choice(available_positions))
+            passes = 0
+        else:
+            passes += 1
+        color = 'white' if color == 'black' else 'black'
+    return game.tabulate_score()
+
+
+def benchmark(batch_games, single_games, seed=0):
+    """
+    Plays batch_games random games with the batch engine and single_games random games one Othello object at a time.
+    Returns a dictionary with the throughput of each in games per second and the resulting speedup.
+    """
+    start = time.perf_counter()
+    engine = BatchEngine(batch_games)
+    engine.play_random_games(np.random.default_rng(seed))
+    batch_rate = batch_games / (time.perf_counter() - start)
+
+    rng = random.Random(seed)
+    start = time.perf_counter()
+    for _ in range(single_games):
+        play_random_game(rng)
+    single_rate = single_games / (time.perf_counter() - start)
+
+    return {'batch_games_per_second': batch_rate, 'single_games_per_second': single_rate,
+            'speedup': batch_rate / single_rate}
+
+
+def main():
+    """Runs the random-game benchmark from the command line"""
+    parser = argparse.ArgumentParser(description='Benchmark the batched Othello engine against single games')
+    parser.add_argument('--games', type=int, default=10000, help='number of games played by the batch engine')
+    parser.add_argument('--single-games', type=int, default=100, help='number of games played one at a time')
+    parser.add_argument('--seed', type=int, default=0, help='random seed')
+    args = parser.parse_args()
+
+    results = benchmark(args.games, args.single_games, args.seed)
+    print('batch engine:  %.0f games/sec' % results['batch_games_per_second'])
+    print('single games:  %.0f games/sec' % results['single_games_per_second'])
+    print('speedup:       %.1fx' % results['speedup'])
+
+
+if __name__ == '__main__':
+    main()
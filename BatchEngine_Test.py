@@ -0,0 +1,70 @@
+# Author: Jonathan Reuter
+# GitHub username: ReuterJo
+# Date: 10/18/2026
+# Description: Contains test cases for BatchEngine.py
+
+import unittest
+import numpy as np
+from Othello import Othello
+from Bitboard import bitboard_to_positions
+from BatchEngine import BatchEngine
+
+
+class TestBatchEngine(unittest.TestCase):
+    """Test cases for BatchEngine.py"""
+
+    def test_case_1(self):
+        """Test init, get_bitboards and tabulate_scores"""
+        engine = BatchEngine(3)
+        self.assertEqual(3, engine.get_count())
+        self.assertEqual(Othello().get_board(), engine.get_board(2))
+        white_scores, black_scores = engine.tabulate_scores()
+        self.assertEqual([2, 2, 2], list(white_scores))
+        self.assertEqual([2, 2, 2], list(black_scores))
+        self.assertEqual(['black'] * 3, list(engine.get_colors_to_move()))
+
+    def test_case_2(self):
+        """Test legal_moves from the starting position"""
+        engine = BatchEngine(2)
+        legal = engine.legal_moves()
+        self.assertEqual(sorted(Othello().return_available_positions('black')),
+                         bitboard_to_positions(int(legal[0])))
+
+    def test_case_3(self):
+        """Test that random batch games match Othello games replayed with the same moves"""
+        count = 16
+        engine = BatchEngine(count)
+        games = [Othello() for _ in range(count)]
+        rng = np.random.default_rng(3)
+        while not engine.get_finished().all():
+            colors = engine.get_colors_to_move()
+            finished = engine.get_finished()
+            legal = engine.legal_moves()
+            moves = engine.choose_random_moves(legal, rng)
+            for index, game in enumerate(games):
+                if finished[index]:
+                    continue
+                positions = game.return_available_positions(colors[index])
+                self.assertEqual(sorted(positions), bitboard_to_positions(int(legal[index])))
+                if moves[index]:
+                    game.make_move(colors[index], bitboard_to_positions(int(moves[index]))[0])
+            engine.apply_moves(moves)
+            for index, game in enumerate(games):
+                self.assertEqual(game.get_board(), engine.get_board(index))
+
+        # every finished game has no moves left for either player
+        white_scores, black_scores = engine.tabulate_scores()
+        for index, game in enumerate(games):
+            self.assertEqual([], game.return_available_positions('white'))
+            self.assertEqual([], game.return_available_positions('black'))
+            self.assertEqual(game.tabulate_score(), (white_scores[index], black_scores[index]))
+
+    def test_case_4(self):
+        """Test from_games and play_random_games"""
+        game = Othello()
+        game.make_move('black', (6, 5))
+        engine = BatchEngine.from_games([game, Othello()], ['white', 'black'])
+        self.assertEqual(game.get_board(), engine.get_board(0))
+        self.assertEqual(['white', 'black'], list(engine.get_colors_to_move()))
+        self.assertGreater(engine.play_random_games(np.random.default_rng(0)), 0)
+        self.assertTrue(engine.get_finished().all())
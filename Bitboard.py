@@ -0,0 +1,374 @@
+# Author: Jonathan Reuter
+# GitHub username: ReuterJo
+# Date: 10/18/2026
+# Description: Implements a bitboard representation of the 8x8 Othello board. Each color is stored as a single 64-bit
+# integer, with one bit per playable square, so that move generation and flipping can be done with shifts and masks
+# instead of walking the board square by square.
+
+# every playable square set
+FULL_MASK = 0xFFFFFFFFFFFFFFFF
+
+# every square except those in the leftmost (column 1) and rightmost (column 8) columns
+NOT_LEFT_COLUMN = 0xFEFEFEFEFEFEFEFE
+NOT_RIGHT_COLUMN = 0x7F7F7F7F7F7F7F7F
+
+# starting position, matching the board created by Othello.__init__
+START_BLACK = (1 << 28) | (1 << 35)
+START_WHITE = (1 << 27) | (1 << 36)
+
+# the binary digit of each piece symbol in the bitboard of each color, used to convert a board in one pass
+BLACK_DIGITS = str.maketrans('XO.*', '1000')
+WHITE_DIGITS = str.maketrans('XO.*', '0100')
+
+# each byte with its bits in reverse order, used to mirror the rows of a bitboard
+REVERSED_BYTES = bytes(int(format(byte, '08b')[::-1], 2) for byte in range(256))
+
+# each direction as (shift, mask), where the mask removes any bits that wrapped around to the other side of the board
+# after shifting by that amount. Directions that move towards higher square numbers are left shifts, and those that
+# move towards lower square numbers are right shifts.
+LEFT_SHIFTS = ((1, NOT_LEFT_COLUMN), (7, NOT_RIGHT_COLUMN), (8, FULL_MASK), (9, NOT_LEFT_COLUMN))
+RIGHT_SHIFTS = ((1, NOT_RIGHT_COLUMN), (7, NOT_LEFT_COLUMN), (8, FULL_MASK), (9, NOT_RIGHT_COLUMN))
+
+
+def create_rays(shifts, towards_higher):
+    """
+    Returns, for each square, the tuple of the bitboards of the squares from it to the edge in each of the given
+    directions, which are left shifts if towards_higher is True and right shifts otherwise. Rays too short to hold a
+    capture are left out.
+    """
+    rays = []
+    for square in range(64):
+        square_rays = []
+        for shift, mask in shifts:
+            ray = 0
+            step = 1 << square
+            while True:
+                step = ((step << shift) if towards_higher else (step >> shift)) & mask
+                if not step:
+                    break
+                ray |= step
+            if ray & (ray - 1):
+                square_rays.append(ray)
+        rays.append(tuple(square_rays))
+    return tuple(rays)
+
+
+# the rays from each square towards higher and towards lower square numbers, used to compute flips without stepping
+# square by square
+UP_RAYS = create_rays(LEFT_SHIFTS, True)
+DOWN_RAYS = create_rays(RIGHT_SHIFTS, False)
+
+
+def position_to_square(position):
+    """Converts a (row, column) board position, with rows and columns 1 through 8, into a square number 0 to 63"""
+    return (position[0] - 1) * 8 + position[1] - 1
+
+
+def square_to_position(square):
+    """Converts a square number 0 to 63 into a (row, column) board position"""
+    return square // 8 + 1, square % 8 + 1
+
+
+def bitboard_to_squares(bits):
+    """Returns the list of square numbers set in a bitboard, in increasing order"""
+    squares = []
+    while bits:
+        lowest_bit = bits & -bits
+        squares.append(lowest_bit.bit_length() - 1)
+        bits ^= lowest_bit
+    return squares
+
+
+def bitboard_to_positions(bits):
+    """Returns the list of (row, column) board positions set in a bitboard, in increasing square order"""
+    return [square_to_position(square) for square in bitboard_to_squares(bits)]
+
+
+def count_bits(bits):
+    """Returns the number of squares set in a bitboard"""
+    return bin(bits).count('1')
+
+
+def board_to_bitboards(board):
+    """
+    Converts a 10x10 list-of-lists board, as returned by Othello.get_board, into a (black, white) bitboard pair.
+    Raises ValueError for boards of any other size, since a bitboard only holds an 8x8 board.
+    """
+    if len(board) != 10 or any(len(row) != 10 for row in board):
+        raise ValueError('Bitboards only support 8x8 boards')
+    # the playable squares are read as binary digits, with square 0 last since it is the least significant bit
+    squares = ''.join([''.join(board[row][8:0:-1]) for row in range(8, 0, -1)])
+    return int(squares.translate(BLACK_DIGITS), 2), int(squares.translate(WHITE_DIGITS), 2)
+
+
+def bitboards_to_board(black, white):
+    """Converts a (black, white) bitboard pair into a 10x10 list-of-lists board, including the edge"""
+    board = [['*'] * 10]
+    for row in range(1, 9):
+        board_row = ['*']
+        for column in range(1, 9):
+            bit = 1 << ((row - 1) * 8 + column - 1)
+            if black & bit:
+                board_row.append('X')
+            elif white & bit:
+                board_row.append('O')
+            else:
+                board_row.append('.')
+        board_row.append('*')
+        board.append(board_row)
+    board.append(['*'] * 10)
+    return board
+
+
+def parse_board(text):
+    """
+    Parses a board given as 64 characters, row by row, using 'X' for black, 'O' for white and '.' for empty squares.
+    Whitespace is ignored. Returns the (black, white) bitboards.
+    """
+    squares = ''.join(text.split())
+    if len(squares) != 64 or set(squares) - set('XO.'):
+        raise ValueError('A board must be 64 characters of X, O and .')
+    black = 0
+    white = 0
+    for square, piece in enumerate(squares):
+        if piece == 'X':
+            black |= 1 << square
+        elif piece == 'O':
+            white |= 1 << square
+    return black, white
+
+
+def generate_moves(own, opponent):
+    """
+    Returns a bitboard of every empty square where the player owning the own bitboard may move. Each direction is
+    handled at once for the whole board by shifting own pieces across runs of opponent pieces.
+    """
+    empty = ~(own | opponent) & FULL_MASK
+    moves = 0
+
+    # directions towards higher square numbers
+    for shift, mask in LEFT_SHIFTS:
+        opponent_run = opponent & mask
+        candidates = (own << shift) & opponent_run
+        # a run of opponent pieces is at most 6 long on an 8x8 board
+        candidates |= (candidates << shift) & opponent_run
+        candidates |= (candidates << shift) & opponent_run
+        candidates |= (candidates << shift) & opponent_run
+        candidates |= (candidates << shift) & opponent_run
+        candidates |= (candidates << shift) & opponent_run
+        moves |= (candidates << shift) & mask & empty
+
+    # directions towards lower square numbers
+    for shift, mask in RIGHT_SHIFTS:
+        opponent_run = opponent & mask
+        candidates = (own >> shift) & opponent_run
+        candidates |= (candidates >> shift) & opponent_run
+        candidates |= (candidates >> shift) & opponent_run
+        candidates |= (candidates >> shift) & opponent_run
+        candidates |= (candidates >> shift) & opponent_run
+        candidates |= (candidates >> shift) & opponent_run
+        moves |= (candidates >> shift) & mask & empty
+
+    return moves
+
+
+def compute_flips(own, opponent, square):
+    """
+    Returns a bitboard of the opponent pieces captured by the player owning the own bitboard placing a piece at the
+    given square. The square does not need to be a valid move; if nothing is captured, zero is returned.
+    """
+    flips = 0
+    not_opponent = ~opponent
+
+    # on each ray, the run of opponent pieces from the square ends at the nearest square without an opponent piece,
+    # which is the lowest such bit on rays towards higher square numbers
+    for ray in UP_RAYS[square]:
+        stops = ray & not_opponent
+        stop = stops & -stops
+        if stop & own:
+            flips |= ray & (stop - 1)
+
+    # and the highest such bit on rays towards lower square numbers
+    for ray in DOWN_RAYS[square]:
+        stops = ray & not_opponent
+        if stops:
+            stop = 1 << (stops.bit_length() - 1)
+            if stop & own:
+                flips |= ray & -(stop << 1)
+
+    return flips
+
+
+def mirror_horizontal(bits):
+    """Returns the bitboard mirrored left to right, so that column 1 becomes column 8"""
+    # each byte holds a row, so mirroring reverses the bits of every byte
+    return int.from_bytes(bits.to_bytes(8, 'little').translate(REVERSED_BYTES), 'little')
+
+
+def flip_vertical(bits):
+    """Returns the bitboard flipped top to bottom, so that row 1 becomes row 8"""
+    return int.from_bytes(bits.to_bytes(8, 'little'), 'big')
+
+
+def flip_diagonal(bits):
+    """Returns the bitboard transposed about the diagonal from (1, 1) to (8, 8), so that rows become columns"""
+    swap = 0x0F0F0F0F00000000 & (bits ^ (bits << 28))
+    bits ^= swap ^ (swap >> 28)
+    swap = 0x3333000033330000 & (bits ^ (bits << 14))
+    bits ^= swap ^ (swap >> 14)
+    swap = 0x5500550055005500 & (bits ^ (bits << 7))
+    return bits ^ swap ^ (swap >> 7)
+
+
+# the 8 symmetries of the board are numbered 0 to 7. Symmetry s transposes the board if s & 4, then mirrors it left
+# to right if s & 1, then flips it top to bottom if s & 2. Symmetry 0 leaves the board unchanged.
+SYMMETRY_COUNT = 8
+
+
+def transform_bitboard(bits, symmetry):
+    """Returns the bitboard transformed by one of the 8 symmetries of the board"""
+    if symmetry & 4:
+        bits = flip_diagonal(bits)
+    if symmetry & 1:
+        bits = mirror_horizontal(bits)
+    if symmetry & 2:
+        bits = flip_vertical(bits)
+    return bits
+
+
+def transform_square(square, symmetry):
+    """Returns the square number that the given square is moved to by one of the 8 symmetries of the board"""
+    row, column = divmod(square, 8)
+    if symmetry & 4:
+        row, column = column, row
+    if symmetry & 1:
+        column = 7 - column
+    if symmetry & 2:
+        row = 7 - row
+    return row * 8 + column
+
+
+# the symmetry undoing each symmetry
+INVERSE_SYMMETRIES = tuple(next(inverse for inverse in range(SYMMETRY_COUNT)
+                                if all(transform_square(transform_square(square, symmetry), inverse) == square
+                                       for square in range(64)))
+                           for symmetry in range(SYMMETRY_COUNT))
+
+
+def symmetric_bitboards(bits):
+    """
+    Returns the list of the bitboard transformed by each of the 8 symmetries, in symmetry order. Transforms are
+    shared between symmetries, so this is faster than calling transform_bitboard 8 times.
+    """
+    # reading the rows as bytes in the opposite order flips the board top to bottom
+    rows = bits.to_bytes(8, 'little')
+    mirrored_rows = rows.translate(REVERSED_BYTES)
+    transposed = flip_diagonal(bits)
+    transposed_rows = transposed.to_bytes(8, 'little')
+    transposed_mirrored_rows = transposed_rows.translate(REVERSED_BYTES)
+    from_bytes = int.from_bytes
+    return [bits, from_bytes(mirrored_rows, 'little'), from_bytes(rows, 'big'), from_bytes(mirrored_rows, 'big'),
+            transposed, from_bytes(transposed_mirrored_rows, 'little'), from_bytes(transposed_rows, 'big'),
+            from_bytes(transposed_mirrored_rows, 'big')]
+
+
+def canonical_symmetries(own, opponent):
+    """
+    Returns the representative of a position among its 8 symmetric forms, as a tuple (own, opponent, symmetries),
+    where (own, opponent) is the smallest transformed pair and symmetries is the list of every symmetry producing it,
+    in increasing order. Symmetric positions therefore share the same representative, and a position that is itself
+    symmetric has more than one symmetry producing it.
+    """
+    # the smallest own bitboard nearly always comes from a single symmetry, so the opponent bitboard only needs to be
+    # transformed by the symmetries producing it
+    own_forms = symmetric_bitboards(own)
+    best_own = min(own_forms)
+    best_opponent = None
+    symmetries = []
+    for symmetry in range(SYMMETRY_COUNT):
+        if own_forms[symmetry] == best_own:
+            opponent_form = transform_bitboard(opponent, symmetry)
+            if best_opponent is None or opponent_form < best_opponent:
+                best_opponent = opponent_form
+                symmetries = [symmetry]
+            elif opponent_form == best_opponent:
+                symmetries.append(symmetry)
+    return best_own, best_opponent, symmetries
+
+
+def canonical_bitboards(own, opponent):
+    """
+    Returns the representative of a position among its 8 symmetric forms, as a tuple (own, opponent, symmetry), where
+    symmetry is the lowest numbered symmetry producing it. See canonical_symmetries.
+    """
+    best_own, best_opponent, symmetries = canonical_symmetries(own, opponent)
+    return best_own, best_opponent, symmetries[0]
+
+
+class BitboardEngine:
+    """
+    Represents the state of an 8x8 Othello board as a pair of bitboards. Is used by the Othello class as an optional
+    backend for move generation, flipping and scoring.
+    """
+    def __init__(self):
+        """Creates a new bitboard engine, with pieces setup corresponding to their starting positions"""
+        self._black = START_BLACK
+        self._white = START_WHITE
+
+        # stack of (black, white) bitboards from before each move, so that moves can be undone
+        self._history = []
+
+    def get_bitboards(self):
+        """Returns the board as a (black, white) bitboard pair"""
+        return self._black, self._white
+
+    def set_bitboards(self, black, white):
+        """Replaces the board with the given (black, white) bitboard pair, forgetting any moves that could be undone"""
+        self._black = black
+        self._white = white
+        self._history = []
+
+    def set_board(self, board):
+        """Replaces the board with the pieces of a 2D board list, forgetting any moves that could be undone"""
+        self.set_bitboards(*board_to_bitboards(board))
+
+    def return_available_positions(self, color):
+        """Returns the available move positions for a player of a chosen color, in square order"""
+        if color == 'white':
+            moves = generate_moves(self._white, self._black)
+        else:
+            moves = generate_moves(self._black, self._white)
+        return bitboard_to_positions(moves)
+
+    def make_move(self, color, piece_position):
+        """
+        Places a piece of the chosen color at the corresponding location and flips any captured pieces. Returns the list
+        of positions that were flipped.
+        """
+        square = position_to_square(piece_position)
+        bit = 1 << square
+        self._history.append((self._black, self._white))
+
+        # place the piece, removing any piece already on that square, then flip captured pieces
+        if color == 'white':
+            own = self._white | bit
+            opponent = self._black & ~bit
+            flips = compute_flips(own, opponent, square)
+            self._white = own | flips
+            self._black = opponent ^ flips
+        else:
+            own = self._black | bit
+            opponent = self._white & ~bit
+            flips = compute_flips(own, opponent, square)
+            self._black = own | flips
+            self._white = opponent ^ flips
+
+        return bitboard_to_positions(flips)
+
+    def undo_move(self):
+        """Restores the bitboards from before the most recent move"""
+        self._black, self._white = self._history.pop()
+
+    def tabulate_score(self):
+        """Returns the score as a tuple (white_score, black_score)"""
+        return count_bits(self._white), count_bits(self._black)
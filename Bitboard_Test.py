@@ -0,0 +1,121 @@
+# Author: Jonathan Reuter
+# GitHub username: ReuterJo
+# Date: 10/18/2026
+# Description: Contains test cases for Bitboard.py
+
+import random
+import unittest
+from Othello import Othello
+from Bitboard import (BitboardEngine, generate_moves, compute_flips, position_to_square, square_to_position,
+                      bitboard_to_positions, board_to_bitboards, bitboards_to_board, START_BLACK, START_WHITE,
+                      SYMMETRY_COUNT, INVERSE_SYMMETRIES, transform_bitboard, transform_square, symmetric_bitboards,
+                      canonical_bitboards)
+
+
+class TestBitboard(unittest.TestCase):
+    """Test cases for Bitboard.py"""
+
+    def test_case_1(self):
+        """Test position_to_square and square_to_position"""
+        self.assertEqual(0, position_to_square((1, 1)))
+        self.assertEqual(63, position_to_square((8, 8)))
+        for square in range(64):
+            self.assertEqual(square, position_to_square(square_to_position(square)))
+
+    def test_case_2(self):
+        """Test generate_moves from the starting position"""
+        self.assertEqual([(3, 4), (4, 3), (5, 6), (6, 5)],
+                         bitboard_to_positions(generate_moves(START_BLACK, START_WHITE)))
+        self.assertEqual([(3, 5), (4, 6), (5, 3), (6, 4)],
+                         bitboard_to_positions(generate_moves(START_WHITE, START_BLACK)))
+
+    def test_case_3(self):
+        """Test compute_flips, including a square that captures nothing"""
+        self.assertEqual([(5, 5)], bitboard_to_positions(compute_flips(START_BLACK, START_WHITE,
+                                                                       position_to_square((6, 5)))))
+        self.assertEqual(0, compute_flips(START_BLACK, START_WHITE, position_to_square((8, 8))))
+
+    def test_case_4(self):
+        """Test board_to_bitboards and bitboards_to_board, and that ragged boards are rejected"""
+        game = Othello()
+        self.assertEqual((START_BLACK, START_WHITE), board_to_bitboards(game.get_board()))
+        self.assertEqual(game.get_board(), bitboards_to_board(START_BLACK, START_WHITE))
+        ragged = game.get_board()
+        ragged[5] = ragged[5][:9]
+        with self.assertRaises(ValueError):
+            board_to_bitboards(ragged)
+
+    def test_case_5(self):
+        """Test BitboardEngine make_move and tabulate_score"""
+        engine = BitboardEngine()
+        self.assertEqual([(5, 5)], engine.make_move('black', (6, 5)))
+        self.assertEqual((1, 4), engine.tabulate_score())
+
+    def test_case_6(self):
+        """Test that the bitboard backend matches the list backend over random games"""
+        rng = random.Random(1)
+        for _ in range(20):
+            list_game = Othello()
+            bitboard_game = Othello('bitboard')
+            color = 'black'
+            passes = 0
+            while passes < 2:
+                list_moves = list_game.return_available_positions(color)
+                self.assertEqual(sorted(list_moves), bitboard_game.return_available_positions(color))
+                if list_moves:
+                    passes = 0
+                    move = rng.choice(sorted(list_moves))
+                    self.assertEqual(list_game.make_move(color, move), bitboard_game.make_move(color, move))
+                    self.assertEqual(list_game.tabulate_score(), bitboard_game.tabulate_score())
+                else:
+                    passes += 1
+                color = 'white' if color == 'black' else 'black'
+
+    def test_case_7(self):
+        """Test the bitboard backend through play_game and return_winner"""
+        game = Othello('bitboard')
+        game.create_player('Bob', 'white')
+        game.create_player('Sarah', 'black')
+        self.assertEqual('bitboard', game.get_backend())
+        game.play_game('black', (6, 5))
+        board = game.get_board()
+        self.assertEqual('X', board[6][5])
+        self.assertEqual('X', board[5][5])
+        self.assertEqual("Invalid move", game.play_game('white', (1, 1)))
+        self.assertEqual("Winner is black player: Sarah", game.return_winner())
+
+    def test_case_8(self):
+        """Test that an unknown backend is rejected"""
+        with self.assertRaises(ValueError):
+            Othello('abacus')
+
+    def test_case_9(self):
+        """Test that the symmetry transforms match transform_square, and that moves commute with them"""
+        rng = random.Random(9)
+        for _ in range(20):
+            bits = rng.getrandbits(64)
+            for symmetry in range(SYMMETRY_COUNT):
+                expected = 0
+                for square in range(64):
+                    if bits & (1 << square):
+                        expected |= 1 << transform_square(square, symmetry)
+                self.assertEqual(expected, transform_bitboard(bits, symmetry))
+                self.assertEqual(bits, transform_bitboard(expected, INVERSE_SYMMETRIES[symmetry]))
+            self.assertEqual([transform_bitboard(bits, symmetry) for symmetry in range(SYMMETRY_COUNT)],
+                             symmetric_bitboards(bits))
+        moves = generate_moves(START_BLACK, START_WHITE)
+        for symmetry in range(SYMMETRY_COUNT):
+            black = transform_bitboard(START_BLACK, symmetry)
+            white = transform_bitboard(START_WHITE, symmetry)
+            self.assertEqual(transform_bitboard(moves, symmetry), generate_moves(black, white))
+
+    def test_case_10(self):
+        """Test that symmetric positions share a canonical form"""
+        black = START_BLACK | (1 << 19) | (1 << 27)
+        white = START_WHITE & ~(1 << 27)
+        canonical = canonical_bitboards(black, white)
+        for symmetry in range(SYMMETRY_COUNT):
+            own, opponent, canonical_symmetry = canonical_bitboards(transform_bitboard(black, symmetry),
+                                                                    transform_bitboard(white, symmetry))
+            self.assertEqual(canonical[:2], (own, opponent))
+            self.assertEqual(own, transform_bitboard(transform_bitboard(black, symmetry), canonical_symmetry))
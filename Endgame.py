@@ -0,0 +1,386 @@
+# Author: Jonathan Reuter
+# GitHub username: ReuterJo
+# Date: 10/18/2026
+# Description: Implements an exact endgame solver for Othello. Near the end of a game, the solver searches every line
+# of play to the end, and returns the best move together with the exact final disc difference, as it would be
+# counted by the Othello class's tabulate_score. In pure Python it searches about 100,000 positions per second, which
+# solves positions with up to 16 empty squares in seconds; 18 empty squares take about half a minute and 20 take
+# several minutes or more.
+
+import argparse
+import random
+import time
+
+from Bitboard import (FULL_MASK, START_BLACK, START_WHITE, LEFT_SHIFTS, RIGHT_SHIFTS, generate_moves, compute_flips,
+                      count_bits, board_to_bitboards, bitboard_to_squares, square_to_position, parse_board)
+
+# with this many empty squares or more, moves are ordered so that those leaving the opponent the fewest replies are
+# searched first. Below it, moves into regions with an odd number of empty squares are searched first instead.
+FASTEST_FIRST_EMPTIES = 7
+
+# with this many empty squares or fewer, moves are found by trying each empty square directly instead of generating
+# the full move bitboard
+FEW_EMPTIES = 4
+
+# results of positions with at least this many empty squares are kept in the solver's table
+TABLE_MIN_EMPTIES = 5
+
+# once the table holds this many positions, it is cleared to bound its memory use
+TABLE_MAX_ENTRIES = 1000000
+
+# the four quadrants of the board, used for parity ordering
+QUADRANTS = (0x000000000F0F0F0F, 0x00000000F0F0F0F0, 0x0F0F0F0F00000000, 0xF0F0F0F000000000)
+
+# corners, searched first in fastest-first ordering
+CORNER_MASK = (1 << 0) | (1 << 7) | (1 << 56) | (1 << 63)
+
+
+def create_neighbours():
+    """Returns, for each square, the bitboard of the squares next to it in any of the 8 directions"""
+    neighbours = []
+    for square in range(64):
+        bits = 1 << square
+        neighbour_bits = 0
+        for shift, mask in LEFT_SHIFTS:
+            neighbour_bits |= (bits << shift) & mask
+        for shift, mask in RIGHT_SHIFTS:
+            neighbour_bits |= (bits >> shift) & mask
+        neighbours.append(neighbour_bits)
+    return tuple(neighbours)
+
+
+# a move can only capture if an opponent piece is next to it, which rules out most empty squares near the end
+NEIGHBOURS = create_neighbours()
+
+
+class EndgameSolver:
+    """
+    Solves Othello endgames exactly with a principal variation search, a negamax search using alpha-beta pruning in
+    which every move after the first is tried with a null window before being searched in full. Scores are final disc
+    differences from the point of view of the player to move, with empty squares left at the end of the game not
+    counted.
+    """
+    def __init__(self):
+        """Creates a new endgame solver"""
+        self._nodes = 0
+        self._table = {}
+
+    def get_nodes(self):
+        """Returns the number of positions searched by the most recent solve"""
+        return self._nodes
+
+    def solve(self, game, color):
+        """
+        Solves the game for the player of the given color. Returns a tuple (best_move, score, nodes), where best_move
+        is None if the player has to pass. The game is not modified.
+        """
+        black, white = board_to_bitboards(game.get_board())
+        if color == 'white':
+            return self.solve_bitboards(white, black)
+        return self.solve_bitboards(black, white)
+
+    def solve_bitboards(self, own, opponent):
+        """
+        Solves the position given as bitboards of the player to move and the opponent. Returns (move, score, nodes).
+        """
+        self._nodes = 0
+        self._table = {}
+        empties = count_bits(~(own | opponent) & FULL_MASK)
+
+        moves = generate_moves(own, opponent)
+        if moves == 0:
+            # the player to move has to pass, so the best move is no move at all
+            score = -self.search(opponent, own, -65, 65, True, empties)
+            return None, score, self._nodes
+
+        # search the first root move in full, and check whether each later move beats it with a null window first
+        self._nodes += 1
+        best_square = None
+        alpha = -65
+        for square, flips in self.order_moves(own, opponent, moves, empties):
+            if flips is None:
+                flips = compute_flips(own, opponent, square)
+            child_own = opponent ^ flips
+            child_opponent = own | flips | (1 << square)
+            if best_square is None:
+                score = -self.search(child_own, child_opponent, -65, 65, False, empties - 1)
+            else:
+                score = -self.search(child_own, child_opponent, -alpha - 1, -alpha, False, empties - 1)
+                if score > alpha:
+                    score = -self.search(child_own, child_opponent, -65, -score, False, empties - 1)
+            if best_square is None or score > alpha:
+                alpha = score
+                best_square = square
+
+        return square_to_position(best_square), alpha, self._nodes
+
+    def order_moves(self, own, opponent, moves, empties):
+        """
+        Returns the moves in the order they should be searched, as a list of (square, flips), where flips is None if
+        the ordering did not need to compute them
+        """
+        squares = bitboard_to_squares(moves)
+        if len(squares) < 2:
+            return [(square, None) for square in squares]
+
+        if empties >= FASTEST_FIRST_EMPTIES:
+            # fastest first: moves leaving the opponent the fewest replies, with corners ahead of everything else
+            keyed_moves = []
+            for square in squares:
+                flips = compute_flips(own, opponent, square)
+                replies = count_bits(generate_moves(opponent ^ flips, own | flips | (1 << square)))
+                if (1 << square) & CORNER_MASK:
+                    replies -= 2
+                keyed_moves.append((replies, square, flips))
+            keyed_moves.sort()
+            return [(square, flips) for _, square, flips in keyed_moves]
+
+        # parity: moves into quadrants with an odd number of empty squares first
+        empty = ~(own | opponent) & FULL_MASK
+        odd_squares = []
+        even_squares = []
+        for square in squares:
+            for quadrant in QUADRANTS:
+                if (1 << square) & quadrant:
+                    if count_bits(empty & quadrant) & 1:
+                        odd_squares.append((square, None))
+                    else:
+                        even_squares.append((square, None))
+                    break
+        return odd_squares + even_squares
+
+    def search(self, own, opponent, alpha, beta, passed, empties):
+        """
+        Returns the exact score of the position for the player to move, if it lies between alpha and beta, or a bound
+        on it otherwise. The passed flag records that the previous player had to pass.
+        """
+        if empties <= FEW_EMPTIES:
+            return self.search_few_empties(own, opponent, alpha, beta, passed)
+        self._nodes += 1
+
+        # narrow the window with the bounds stored for the position, which are (lower, upper, best square)
+        key = None
+        table_square = None
+        if empties >= TABLE_MIN_EMPTIES:
+            key = (own, opponent)
+            entry = self._table.get(key)
+            if entry is not None:
+                if entry[0] >= beta:
+                    return entry[0]
+                if entry[1] <= alpha:
+                    return entry[1]
+                if entry[0] > alpha:
+                    alpha = entry[0]
+                if entry[1] < beta:
+                    beta = entry[1]
+                table_square = entry[2]
+
+        moves = generate_moves(own, opponent)
+        if moves == 0:
+            # if the opponent passed as well, the game is over
+            if passed:
+                return count_bits(own) - count_bits(opponent)
+            return -self.search(opponent, own, -beta, -alpha, True, empties)
+
+        # search the best square stored for the position first
+        ordered_moves = self.order_moves(own, opponent, moves, empties)
+        if table_square is not None:
+            for index, (square, _) in enumerate(ordered_moves):
+                if square == table_square:
+                    ordered_moves.insert(0, ordered_moves.pop(index))
+                    break
+
+        original_alpha = alpha
+        best_score = -65
+        best_square = None
+        for square, flips in ordered_moves:
+            if flips is None:
+                flips = compute_flips(own, opponent, square)
+            child_own = opponent ^ flips
+            child_opponent = own | flips | (1 << square)
+            if best_score == -65:
+                score = -self.search(child_own, child_opponent, -beta, -alpha, False, empties - 1)
+            else:
+                # a null window only proves whether the move beats alpha; if it does, search it again in full
+                score = -self.search(child_own, child_opponent, -alpha - 1, -alpha, False, empties - 1)
+                if alpha < score < beta:
+                    score = -self.search(child_own, child_opponent, -beta, -score, False, empties - 1)
+            if score > best_score:
+                best_score = score
+                best_square = square
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        break
+
+        # store what the search proved about the score
+        if key is not None:
+            if len(self._table) >= TABLE_MAX_ENTRIES:
+                self._table = {}
+            if best_score <= original_alpha:
+                self._table[key] = (-64, best_score, best_square)
+            elif best_score >= beta:
+                self._table[key] = (best_score, 64, best_square)
+            else:
+                self._table[key] = (best_score, best_score, best_square)
+
+        return best_score
+
+    def search_few_empties(self, own, opponent, alpha, beta, passed, squares=None):
+        """
+        Searches a position with only a few empty squares, like search, by trying each empty square as a move. The
+        squares are the list of empty squares in the order they are tried, in parity order if not given, and each
+        move passes the rest on in the same order. The last two empty squares are handled by solve_two_empties.
+        """
+        if squares is None:
+            squares = self.order_empty_squares(~(own | opponent) & FULL_MASK)
+        if len(squares) == 2:
+            return self.solve_two_empties(own, opponent, beta, squares[0], squares[1], passed)
+        self._nodes += 1
+        if len(squares) < 2:
+            if not squares:
+                return 2 * count_bits(own) - 64
+            return self.solve_last_empty(own, opponent, squares[0])
+
+        best_score = -65
+        for index, square in enumerate(squares):
+            if not NEIGHBOURS[square] & opponent:
+                continue
+            flips = compute_flips(own, opponent, square)
+            if flips == 0:
+                continue
+            score = -self.search_few_empties(opponent ^ flips, own | flips | (1 << square), -beta, -alpha, False,
+                                             squares[:index] + squares[index + 1:])
+            if score > best_score:
+                best_score = score
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        break
+
+        # with no move, pass, or end the game if the opponent passed as well
+        if best_score == -65:
+            if passed:
+                return count_bits(own) - count_bits(opponent)
+            return -self.search_few_empties(opponent, own, -beta, -alpha, True, squares)
+        return best_score
+
+    def order_empty_squares(self, empty):
+        """Returns the empty squares, with those in quadrants holding an odd number of empty squares first"""
+        odd_squares = []
+        even_squares = []
+        for quadrant in QUADRANTS:
+            quadrant_empty = empty & quadrant
+            if quadrant_empty:
+                if count_bits(quadrant_empty) & 1:
+                    odd_squares.extend(bitboard_to_squares(quadrant_empty))
+                else:
+                    even_squares.extend(bitboard_to_squares(quadrant_empty))
+        return odd_squares + even_squares
+
+    def solve_two_empties(self, own, opponent, beta, first, second, passed):
+        """
+        Returns the score of a position with two empty squares, the first tried before the second, like search with
+        a window ending at beta. The last empty square is then handled by solve_last_empty.
+        """
+        self._nodes += 1
+        best_score = -65
+        if NEIGHBOURS[first] & opponent:
+            flips = compute_flips(own, opponent, first)
+            if flips:
+                self._nodes += 1
+                best_score = -self.solve_last_empty(opponent ^ flips, own | flips | (1 << first), second)
+                if best_score >= beta:
+                    return best_score
+        if NEIGHBOURS[second] & opponent:
+            flips = compute_flips(own, opponent, second)
+            if flips:
+                self._nodes += 1
+                score = -self.solve_last_empty(opponent ^ flips, own | flips | (1 << second), first)
+                if score > best_score:
+                    best_score = score
+
+        # with no move, pass, or end the game if the opponent passed as well
+        if best_score == -65:
+            if passed:
+                return count_bits(own) - count_bits(opponent)
+            return -self.solve_two_empties(opponent, own, 65, first, second, True)
+        return best_score
+
+    def solve_last_empty(self, own, opponent, square=None):
+        """
+        Returns the exact score of a position with a single empty square, for the player to move. The square is found
+        from the bitboards if it is not given.
+        """
+        if square is None:
+            square = (~(own | opponent) & FULL_MASK).bit_length() - 1
+
+        # the other 63 squares are full, so the score before the last move follows from the own pieces alone
+        score = 2 * count_bits(own) - 63
+
+        # the player to move fills the square if it captures anything
+        flips = compute_flips(own, opponent, square)
+        if flips:
+            return score + 2 * count_bits(flips) + 1
+
+        # otherwise the opponent fills it if they can, and if neither can the game ends with it empty
+        flips = compute_flips(opponent, own, square)
+        if flips:
+            return score - 2 * count_bits(flips) - 1
+        return score
+
+
+def random_endgame(empties, seed=0):
+    """
+    Plays random moves from the starting position until the given number of empty squares remain. Returns the
+    bitboards (own, opponent) of the player to move and the opponent, and the color of the player to move.
+    """
+    rng = random.Random(seed)
+    while True:
+        own, opponent = START_BLACK, START_WHITE
+        color = 'black'
+        passes = 0
+        while passes < 2 and count_bits(~(own | opponent) & FULL_MASK) > empties:
+            moves = bitboard_to_squares(generate_moves(own, opponent))
+            if moves:
+                square = rng.choice(moves)
+                flips = compute_flips(own, opponent, square)
+                own, opponent = own | flips | (1 << square), opponent ^ flips
+                passes = 0
+            else:
+                passes += 1
+            own, opponent = opponent, own
+            color = 'white' if color == 'black' else 'black'
+        # start over if the game ended before reaching the endgame
+        if passes < 2 and generate_moves(own, opponent):
+            return own, opponent, color
+
+
+def main():
+    """Solves an endgame from the command line"""
+    parser = argparse.ArgumentParser(description='Solve an Othello endgame exactly')
+    parser.add_argument('--board', help='64 characters of X (black), O (white) and . (empty), row by row')
+    parser.add_argument('--color', choices=('black', 'white'), default='black', help='color of the player to move')
+    parser.add_argument('--random-empties', type=int, default=14,
+                        help='without --board, solve a random position with this many empty squares')
+    parser.add_argument('--seed', type=int, default=0, help='random seed for --random-empties')
+    args = parser.parse_args()
+
+    if args.board:
+        black, white = parse_board(args.board)
+        color = args.color
+        own, opponent = (white, black) if color == 'white' else (black, white)
+    else:
+        own, opponent, color = random_endgame(args.random_empties, args.seed)
+
+    solver = EndgameSolver()
+    start = time.perf_counter()
+    move, score, nodes = solver.solve_bitboards(own, opponent)
+    elapsed = time.perf_counter() - start
+    print('color to move: %s  empties: %d' % (color, count_bits(~(own | opponent) & FULL_MASK)))
+    print('best move: %s  score: %+d  nodes: %d  time: %.2fs  nodes/sec: %.0f'
+          % (move, score, nodes, elapsed, nodes / elapsed if elapsed > 0 else 0))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+# Author: Jonathan Reuter
+# GitHub username: ReuterJo
+# Date: 10/18/2026
+# Description: Contains test cases for Endgame.py
+
+import unittest
+from Othello import Othello
+from Bitboard import bitboards_to_board, count_bits, parse_board, FULL_MASK
+from Endgame import EndgameSolver, random_endgame
+
+
+def opposite(color):
+    """Returns the other color"""
+    return 'white' if color == 'black' else 'black'
+
+
+def brute_force(game, color, passed=False):
+    """Returns the exact final disc difference for the player to move, by trying every line of play"""
+    moves = game.return_available_positions(color)
+    if len(moves) == 0:
+        if passed:
+            white_score, black_score = game.tabulate_score()
+            return white_score - black_score if color == 'white' else black_score - white_score
+        return -brute_force(game, opposite(color), True)
+    best_score = None
+    for move in moves:
+        game.make_move(color, move)
+        score = -brute_force(game, opposite(color))
+        game.undo_move()
+        if best_score is None or score > best_score:
+            best_score = score
+    return best_score
+
+
+def game_from_bitboards(black, white):
+    """Creates an Othello game with the given board"""
+    game = Othello()
+    game.load_board(bitboards_to_board(black, white))
+    return game
+
+
+class TestEndgame(unittest.TestCase):
+    """Test cases for Endgame.py"""
+
+    def test_case_1(self):
+        """Test that the solver matches a brute force search on random endgames"""
+        for seed in range(8):
+            own, opponent, color = random_endgame(7, seed)
+            black, white = (opponent, own) if color == 'white' else (own, opponent)
+            game = game_from_bitboards(black, white)
+            move, score, nodes = game.solve_endgame(color)
+            self.assertEqual(brute_force(game, color), score)
+            self.assertGreater(nodes, 0)
+
+            # playing the best move leaves the opponent with the same score, negated
+            game.make_move(color, move)
+            self.assertEqual(-score, EndgameSolver().solve(game, opposite(color))[1])
+
+    def test_case_2(self):
+        """Test solve_last_empty, including an empty square neither player can fill"""
+        solver = EndgameSolver()
+        # one empty square in the corner, which black can fill to capture the row
+        black, white = parse_board('.' + 'O' * 6 + 'X' + 'X' * 56)
+        self.assertEqual(64, solver.solve_last_empty(black, white))
+        self.assertEqual(-64, solver.solve_last_empty(white, black))
+        # black fills the board except for an unreachable square
+        black, white = parse_board('.' + 'X' * 63)
+        self.assertEqual(63, solver.solve_last_empty(black, white))
+
+    def test_case_3(self):
+        """Test solving a position where the player to move must pass"""
+        black, white = parse_board('.' + 'X' * 9 + 'O' + 'X' * 53)
+        move, score, _ = EndgameSolver().solve_bitboards(white, black)
+        self.assertIsNone(move)
+        self.assertEqual(-61, score)
+        # white's only move fills the board, capturing the diagonal
+        black, white = parse_board('.' + 'X' * 62 + 'O')
+        self.assertEqual(((1, 1), -48, 2), EndgameSolver().solve_bitboards(white, black))
+
+    def test_case_4(self):
+        """Test random_endgame and parse_board"""
+        own, opponent, _ = random_endgame(12, 4)
+        self.assertEqual(12, count_bits(~(own | opponent) & FULL_MASK))
+        with self.assertRaises(ValueError):
+            parse_board('X' * 10)
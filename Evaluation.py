@@ -0,0 +1,304 @@
+# Author: Jonathan Reuter
+# GitHub username: ReuterJo
+# Date: 10/18/2026
+# Description: Implements a pattern-based evaluation function for Othello. The board is covered by patterns of
+# squares (edges, corner regions and diagonals) and the contents of each pattern are read as a base-3 number, which
+# indexes a table of weights learned from recorded games. Weights are kept separately for each phase of the game.
+# Patterns can be extracted from a single position or, with NumPy, from a whole batch of positions at once.
+
+import argparse
+import struct
+import time
+
+import numpy as np
+
+from Bitboard import SYMMETRY_COUNT, transform_square, board_to_bitboards, count_bits
+from Records import MappedRecordReader, iterate_bitboards
+
+# the patterns, each given by its squares in the top left of the board. The other copies of each pattern are found by
+# applying the board's symmetries, and all copies of a pattern share its weights.
+PATTERNS = (('edge', (9, 0, 1, 2, 3, 4, 5, 6, 7, 14)),
+            ('corner_3x3', (0, 1, 2, 8, 9, 10, 16, 17, 18)),
+            ('corner_2x5', (0, 1, 2, 3, 4, 8, 9, 10, 11, 12)),
+            ('diagonal_8', (0, 9, 18, 27, 36, 45, 54, 63)),
+            ('diagonal_7', (1, 10, 19, 28, 37, 46, 55)),
+            ('diagonal_6', (2, 11, 20, 29, 38, 47)),
+            ('diagonal_5', (3, 12, 21, 30, 39)),
+            ('diagonal_4', (4, 13, 22, 31)))
+
+# the game is split into this many phases by the number of pieces on the board, each with its own weights
+PHASE_COUNT = 6
+
+
+def create_instances(squares):
+    """Returns the distinct copies of a pattern under the board's symmetries, each as a tuple of squares"""
+    instances = []
+    seen = set()
+    for symmetry in range(SYMMETRY_COUNT):
+        instance = tuple(transform_square(square, symmetry) for square in squares)
+        if frozenset(instance) not in seen:
+            seen.add(frozenset(instance))
+            instances.append(instance)
+    return instances
+
+
+def create_tables():
+    """
+    Returns (instances, offsets, feature_count, square_terms). Instances lists the squares of every pattern copy, and
+    offsets the position of each copy's pattern in the weights. Square_terms lists, for each square, the
+    (instance_index, power of 3) it contributes to each copy.
+    """
+    instances = []
+    offsets = []
+    feature_count = 0
+    for _, squares in PATTERNS:
+        for instance in create_instances(squares):
+            instances.append(instance)
+            offsets.append(feature_count)
+        feature_count += 3 ** len(squares)
+
+    square_terms = [[] for _ in range(64)]
+    for instance_index, instance in enumerate(instances):
+        for digit, square in enumerate(instance):
+            square_terms[square].append((instance_index, 3 ** digit))
+    return instances, offsets, feature_count, [tuple(terms) for terms in square_terms]
+
+
+INSTANCES, INSTANCE_OFFSETS, FEATURE_COUNT, SQUARE_TERMS = create_tables()
+
+
+def create_row_tables(digit):
+    """
+    Returns a table, for each row of the board and each byte of pieces in that row, of the contribution of those
+    pieces to every feature at once. The features are packed into a single integer with FEATURE_BITS bits each, with
+    the pieces read as the given digit.
+    """
+    tables = []
+    for row in range(8):
+        row_table = []
+        for row_bits in range(256):
+            value = 0
+            for column in range(8):
+                if row_bits & (1 << column):
+                    for instance_index, power in SQUARE_TERMS[row * 8 + column]:
+                        value += digit * power << (FEATURE_BITS * instance_index)
+            row_table.append(value)
+        tables.append(row_table)
+    return tables
+
+
+# every feature index is packed into 32 bits of a single integer, so that the features of a position can be added up
+# a row of the board at a time, and then unpacked together
+FEATURE_BITS = 32
+FEATURE_STRUCT = struct.Struct('<%dI' % len(INSTANCES))
+PACKED_OFFSETS = sum(offset << (FEATURE_BITS * instance_index)
+                     for instance_index, offset in enumerate(INSTANCE_OFFSETS))
+OWN_ROW_TABLES = create_row_tables(1)
+OPPONENT_ROW_TABLES = create_row_tables(2)
+
+
+def create_power_matrix():
+    """Returns a (64, instance count) matrix of the power of 3 that each square contributes to each pattern copy"""
+    matrix = np.zeros((64, len(INSTANCES)))
+    for square, terms in enumerate(SQUARE_TERMS):
+        for instance_index, power in terms:
+            matrix[square, instance_index] = power
+    return matrix
+
+
+# used to extract features from batches of positions
+POWER_MATRIX = create_power_matrix()
+
+
+def game_phase(own, opponent):
+    """Returns the phase, from 0 to PHASE_COUNT - 1, of a position given as bitboards"""
+    return (count_bits(own | opponent) - 4) * PHASE_COUNT // 61
+
+
+def extract_features(own, opponent):
+    """
+    Returns the tuple of feature indices, one per pattern copy, for a position given as bitboards of the player to
+    move and the opponent. Each pattern copy reads an empty square as 0, a square of the player to move as 1 and a
+    square of the opponent as 2.
+    """
+    packed = PACKED_OFFSETS
+    own_rows = own.to_bytes(8, 'little')
+    opponent_rows = opponent.to_bytes(8, 'little')
+    for row in range(8):
+        packed += OWN_ROW_TABLES[row][own_rows[row]] + OPPONENT_ROW_TABLES[row][opponent_rows[row]]
+    return FEATURE_STRUCT.unpack(packed.to_bytes(FEATURE_STRUCT.size, 'little'))
+
+
+def unpack_bitboards(bitboards):
+    """Returns an (N, 64) array of 0s and 1s, indexed by square, from an array of N bitboards"""
+    bitboards = np.ascontiguousarray(bitboards, dtype='<u8')
+    return np.unpackbits(bitboards.view(np.uint8).reshape(-1, 8), axis=1, bitorder='little')
+
+
+def extract_features_batch(own, opponent):
+    """
+    Returns an (N, instance count) array of feature indices for N positions, given as arrays of bitboards of the
+    player to move and the opponent. Row i matches extract_features(own[i], opponent[i]).
+    """
+    # reading each pattern copy as a base-3 number is a product of the square digits with a matrix of powers of 3,
+    # which is done in floating point, where it is exact, to use the fast matrix product
+    digits = unpack_bitboards(own).astype(np.float64) + 2 * unpack_bitboards(opponent).astype(np.float64)
+    return (digits @ POWER_MATRIX).astype(np.int32) + np.array(INSTANCE_OFFSETS, dtype=np.int32)
+
+
+def game_phase_batch(own, opponent):
+    """Returns an array of the phase of each of N positions, given as arrays of bitboards"""
+    pieces = unpack_bitboards(np.asarray(own, dtype=np.uint64) | np.asarray(opponent, dtype=np.uint64)).sum(axis=1)
+    return (pieces.astype(np.int32) - 4) * PHASE_COUNT // 61
+
+
+class PatternEvaluator:
+    """
+    Represents a pattern-based evaluation function. Scores estimate the final disc difference from the point of view
+    of the player to move. An evaluator can be passed as the evaluate argument of AlphaBetaSearcher or AIPlayer.
+    """
+    def __init__(self, weights=None):
+        """Creates a new evaluator from a (PHASE_COUNT, FEATURE_COUNT) array of weights, by default all zero"""
+        if weights is None:
+            weights = np.zeros((PHASE_COUNT, FEATURE_COUNT))
+        if np.shape(weights) != (PHASE_COUNT, FEATURE_COUNT):
+            raise ValueError('Weights must have shape (%d, %d)' % (PHASE_COUNT, FEATURE_COUNT))
+        self._weights = np.asarray(weights, dtype=np.float64)
+
+        # weights of each phase as a list, converted when first needed, since indexing a list is much faster than
+        # indexing an array one element at a time
+        self._phase_tables = [None] * PHASE_COUNT
+
+    def __call__(self, game, color):
+        """Returns the evaluation of an Othello game from the point of view of the player of the given color"""
+        black, white = board_to_bitboards(game.get_board())
+        if color == 'white':
+            return self.evaluate_bitboards(white, black)
+        return self.evaluate_bitboards(black, white)
+
+    def get_weights(self):
+        """Returns the (PHASE_COUNT, FEATURE_COUNT) array of weights"""
+        return self._weights
+
+    def evaluate_bitboards(self, own, opponent):
+        """Returns the evaluation of a position given as bitboards of the player to move and the opponent"""
+        phase = game_phase(own, opponent)
+        table = self._phase_tables[phase]
+        if table is None:
+            table = self._weights[phase].tolist()
+            self._phase_tables[phase] = table
+        return sum(map(table.__getitem__, extract_features(own, opponent)))
+
+    def evaluate_batch(self, own, opponent):
+        """Returns an array of the evaluations of N positions, given as arrays of bitboards"""
+        features = extract_features_batch(own, opponent)
+        phases = game_phase_batch(own, opponent)
+        return self._weights[phases[:, np.newaxis], features].sum(axis=1)
+
+    def save(self, path):
+        """Saves the weights to a NumPy .npy file"""
+        np.save(path, self._weights)
+
+    @classmethod
+    def load(cls, path):
+        """Creates an evaluator from weights saved by save"""
+        return cls(np.load(path))
+
+
+def collect_positions(records, min_empties=0):
+    """
+    Returns the positions of recorded games as (own, opponent, targets) arrays, where each target is the final disc
+    difference from the point of view of the player to move. Positions before a pass, and positions with fewer than
+    min_empties empty squares, are left out.
+    """
+    own_boards = []
+    opponent_boards = []
+    targets = []
+    for record in records:
+        white_score, black_score = record.get_score()
+        for own, opponent, color, square in iterate_bitboards(record):
+            if square is None or 64 - count_bits(own | opponent) < min_empties:
+                continue
+            own_boards.append(own)
+            opponent_boards.append(opponent)
+            targets.append(white_score - black_score if color == 'white' else black_score - white_score)
+    return (np.array(own_boards, dtype=np.uint64), np.array(opponent_boards, dtype=np.uint64),
+            np.array(targets, dtype=np.float64))
+
+
+def train(own, opponent, targets, iterations=100, regularization=1.0):
+    """
+    Fits the weights of a PatternEvaluator to positions by regularized least squares, so that evaluations approximate
+    the targets. The fit uses the conjugate gradient method on the normal equations, which only needs the sparse
+    products of the features with vectors, never the full system of equations. Returns the evaluator.
+    """
+    features = extract_features_batch(own, opponent)
+    phases = game_phase_batch(own, opponent)
+    targets = np.asarray(targets, dtype=np.float64)
+    weight_count = PHASE_COUNT * FEATURE_COUNT
+
+    # index each weight by phase and feature in one flat array. The features of a position select the weights that
+    # are summed to evaluate it, and the transpose spreads a value for each position over its weights.
+    flat_features = (phases[:, np.newaxis] * FEATURE_COUNT + features).ravel()
+    pattern_count = features.shape[1]
+
+    def multiply(weights):
+        return weights[flat_features].reshape(-1, pattern_count).sum(axis=1)
+
+    def multiply_transpose(values):
+        return np.bincount(flat_features, weights=np.repeat(values, pattern_count), minlength=weight_count)
+
+    weights = np.zeros(weight_count)
+    residual = targets.copy()
+    gradient = multiply_transpose(residual)
+    direction = gradient.copy()
+    gradient_norm = gradient @ gradient
+    for _ in range(iterations):
+        if gradient_norm == 0:
+            break
+        product = multiply(direction)
+        step = gradient_norm / (product @ product + regularization * (direction @ direction))
+        weights += step * direction
+        residual -= step * product
+        gradient = multiply_transpose(residual) - regularization * weights
+        new_gradient_norm = gradient @ gradient
+        direction = gradient + (new_gradient_norm / gradient_norm) * direction
+        gradient_norm = new_gradient_norm
+
+    return PatternEvaluator(weights.reshape(PHASE_COUNT, FEATURE_COUNT))
+
+
+def main():
+    """Trains an evaluator from a game archive from the command line, and reports its error and speed"""
+    parser = argparse.ArgumentParser(description='Train a pattern evaluator from an Othello game archive')
+    parser.add_argument('archive', help='game archive written by Records.py')
+    parser.add_argument('weights', help='.npy file to save the weights to')
+    parser.add_argument('--iterations', type=int, default=100, help='training iterations')
+    args = parser.parse_args()
+
+    with MappedRecordReader(args.archive) as reader:
+        own, opponent, targets = collect_positions(reader)
+    start = time.perf_counter()
+    evaluator = train(own, opponent, targets, args.iterations)
+    elapsed = time.perf_counter() - start
+    evaluator.save(args.weights)
+
+    errors = evaluator.evaluate_batch(own, opponent) - targets
+    print('trained on %d positions in %.2fs, rms error %.2f discs' % (len(targets), elapsed,
+                                                                        np.sqrt(np.mean(errors ** 2))))
+
+    # time single and batched evaluation
+    sample = min(len(targets), 10000)
+    start = time.perf_counter()
+    for index in range(sample):
+        evaluator.evaluate_bitboards(int(own[index]), int(opponent[index]))
+    single_elapsed = time.perf_counter() - start
+    start = time.perf_counter()
+    evaluator.evaluate_batch(own, opponent)
+    batch_elapsed = time.perf_counter() - start
+    print('%.1f microseconds per position singly, %.2f microseconds per position batched'
+          % (single_elapsed / sample * 1e6, batch_elapsed / len(targets) * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+# Author: Jonathan Reuter
+# GitHub username: ReuterJo
+# Date: 10/18/2026
+# Description: Contains test cases for Evaluation.py
+
+import os
+import random
+import tempfile
+import unittest
+import numpy as np
+from Othello import Othello
+from Bitboard import board_to_bitboards
+from Records import random_record, iterate_bitboards
+from Search import AlphaBetaSearcher
+from Evaluation import (PatternEvaluator, INSTANCES, FEATURE_COUNT, PHASE_COUNT, INSTANCE_OFFSETS, extract_features,
+                        extract_features_batch, game_phase, game_phase_batch, collect_positions, train)
+
+
+def random_positions(count, seed):
+    """Returns (own, opponent) bitboards of positions from random games"""
+    rng = random.Random(seed)
+    positions = []
+    while len(positions) < count:
+        for own, opponent, _, _ in iterate_bitboards(random_record(rng)):
+            positions.append((own, opponent))
+    return positions[:count]
+
+
+class TestEvaluation(unittest.TestCase):
+    """Test cases for Evaluation.py"""
+
+    def test_case_1(self):
+        """Test the pattern copies, and that features read each copy as a base-3 number"""
+        self.assertEqual(34, len(INSTANCES))
+        self.assertEqual(2 * 3 ** 10 + 3 ** 9 + 3 ** 8 + 3 ** 7 + 3 ** 6 + 3 ** 5 + 3 ** 4, FEATURE_COUNT)
+        for own, opponent in random_positions(50, 1):
+            expected = []
+            for instance_index, instance in enumerate(INSTANCES):
+                value = 0
+                for digit, square in enumerate(instance):
+                    if own & (1 << square):
+                        value += 3 ** digit
+                    elif opponent & (1 << square):
+                        value += 2 * 3 ** digit
+                expected.append(INSTANCE_OFFSETS[instance_index] + value)
+            self.assertEqual(expected, list(extract_features(own, opponent)))
+
+    def test_case_2(self):
+        """Test that batched extraction and evaluation match a single position at a time"""
+        positions = random_positions(200, 2)
+        own = np.array([position[0] for position in positions], dtype=np.uint64)
+        opponent = np.array([position[1] for position in positions], dtype=np.uint64)
+        evaluator = PatternEvaluator(np.random.default_rng(2).normal(size=(PHASE_COUNT, FEATURE_COUNT)))
+        features = extract_features_batch(own, opponent)
+        phases = game_phase_batch(own, opponent)
+        scores = evaluator.evaluate_batch(own, opponent)
+        for index, (own_bits, opponent_bits) in enumerate(positions):
+            self.assertEqual(list(extract_features(own_bits, opponent_bits)), features[index].tolist())
+            self.assertEqual(game_phase(own_bits, opponent_bits), phases[index])
+            self.assertAlmostEqual(evaluator.evaluate_bitboards(own_bits, opponent_bits), scores[index])
+
+    def test_case_3(self):
+        """Test that training fits the distinct positions of a single game closely"""
+        records = [random_record(random.Random(3))]
+        own, opponent, targets = collect_positions(records)
+        self.assertEqual(len(targets), len(own))
+        evaluator = train(own, opponent, targets, iterations=200, regularization=1e-6)
+        errors = evaluator.evaluate_batch(own, opponent) - targets
+        self.assertLess(np.abs(errors).max(), 0.01)
+        self.assertEqual(0, collect_positions(records, min_empties=61)[2].size)
+
+    def test_case_4(self):
+        """Test evaluating an Othello game, searching with an evaluator, and saving and loading weights"""
+        weights = np.random.default_rng(4).normal(size=(PHASE_COUNT, FEATURE_COUNT))
+        evaluator = PatternEvaluator(weights)
+        game = Othello()
+        game.make_move('black', (3, 4))
+        black, white = board_to_bitboards(game.get_board())
+        self.assertEqual(evaluator.evaluate_bitboards(white, black), evaluator(game, 'white'))
+        searcher = AlphaBetaSearcher(time_limit=float('inf'), max_depth=2, evaluate=evaluator)
+        self.assertIn(searcher.search(game, 'white'), game.return_available_positions('white'))
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'weights.npy')
+            evaluator.save(path)
+            self.assertTrue(np.array_equal(weights, PatternEvaluator.load(path).get_weights()))
+        with self.assertRaises(ValueError):
+            PatternEvaluator(np.zeros(3))
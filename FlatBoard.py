@@ -0,0 +1,211 @@
+# Author: Jonathan Reuter
+# GitHub username: ReuterJo
+# Date: 10/18/2026
+# Description: Implements a flat representation of an Othello board of any supported size, as a single bytearray with
+# an edge around the board. Each row, column and diagonal of the board is also kept as an integer code of its
+# contents, and the moves and flips along a line, which depend only on its contents, are looked up by that code in a
+# table filled in as new contents are seen. Making a move only updates the codes and moves of the lines through the
+# squares it changed, and generating moves joins the moves of every line, instead of walking the board square by square.
+
+import itertools
+import operator
+
+from Geometry import DEFAULT_SIZE, get_geometry
+
+# byte stored for each kind of square
+EMPTY = 0
+BLACK = 1
+WHITE = 2
+EDGE = 3
+
+# byte stored for each symbol of a 2D board list
+PIECE_CODES = {'.': EMPTY, 'X': BLACK, 'O': WHITE, '*': EDGE}
+
+# bits used by each square in the code of a line. Above the squares of a line of length n, bit SQUARE_BITS * n is set
+# to mark the length, and the line's number and board size are held from LINE_NUMBER_SHIFT and BOARD_SIZE_SHIFT, so
+# that no two lines share a code.
+SQUARE_BITS = 2
+LINE_NUMBER_SHIFT = 40
+BOARD_SIZE_SHIFT = 48
+
+# the moves of a line are a tuple holding, indexed by BLACK and WHITE, the positions of each color's moves, followed
+# at FLIPS + BLACK and FLIPS + WHITE by dictionaries from the index of each of those moves to the indices it flips
+FLIPS = 2
+
+# most line codes whose moves are remembered, so that the table stays small on the largest boards
+MAX_CACHED_LINES = 1 << 20
+
+
+def create_line_code(size, number, pieces):
+    """Returns the code of line number of a board of the given size, holding the given sequence of piece bytes"""
+    code = (size << BOARD_SIZE_SHIFT) | (number << LINE_NUMBER_SHIFT) | (1 << (SQUARE_BITS * len(pieces)))
+    for offset, piece in enumerate(pieces):
+        code |= piece << (SQUARE_BITS * offset)
+    return code
+
+
+def find_line_moves(code):
+    """Returns the moves along the line with the given code. See FLIPS."""
+    size = code >> BOARD_SIZE_SHIFT
+    geometry = get_geometry(size)
+    line = geometry.get_lines()[(code >> LINE_NUMBER_SHIFT) & 0xFF]
+    length = len(line)
+    contents = [(code >> (SQUARE_BITS * offset)) & 3 for offset in range(length)]
+    flips = (None, {}, {})
+    for offset in range(length):
+        if contents[offset] != EMPTY:
+            continue
+        for own in (BLACK, WHITE):
+            opponent = BLACK + WHITE - own
+            flipped = []
+            for step in (-1, 1):
+                square = offset + step
+                while 0 <= square < length and contents[square] == opponent:
+                    square += step
+                if square != offset + step and 0 <= square < length and contents[square] == own:
+                    flipped.extend(line[flip] for flip in range(offset + step, square, step))
+            if flipped:
+                flips[own][line[offset]] = tuple(flipped)
+    return (None, tuple(geometry.get_position(index) for index in flips[BLACK]),
+            tuple(geometry.get_position(index) for index in flips[WHITE]), flips[BLACK], flips[WHITE])
+
+
+class LineMovesCache(dict):
+    """Represents the table of the moves along each line code seen so far, which finds the moves of a new code"""
+    def __missing__(self, code):
+        """Returns the moves of a code not in the table, adding them unless the table is full"""
+        moves = find_line_moves(code)
+        if len(self) < MAX_CACHED_LINES:
+            self[code] = moves
+        return moves
+
+
+# the moves along each line code, shared by every engine
+line_moves_cache = LineMovesCache()
+
+# the lines through each index of the flat array of each board size, as (line number, shift of the index's bits in
+# the line's code), computed the first time a size is used
+index_shifts_cache = {}
+
+
+def get_index_shifts(size):
+    """Returns the lines through each index of the flat array of a board size, as a list of (line number, shift)"""
+    index_shifts = index_shifts_cache.get(size)
+    if index_shifts is None:
+        index_shifts = [tuple((number, SQUARE_BITS * offset) for number, offset in lines)
+                        for lines in get_geometry(size).get_index_lines()]
+        index_shifts_cache[size] = index_shifts
+    return index_shifts
+
+
+class FlatEngine:
+    """
+    Represents the state of an Othello board as a flat bytearray, row by row including the edge. Is used by the
+    Othello class as an optional backend for move generation, flipping and scoring, on boards of any supported size.
+    The available moves of a color are the union of its moves along every line, and the flips of a move are those
+    along the lines through it, both kept from the line moves table.
+    """
+    def __init__(self, size=DEFAULT_SIZE):
+        """Creates a new flat engine, with pieces setup corresponding to their starting positions"""
+        geometry = get_geometry(size)
+        self._size = size
+        self._rays = geometry.get_rays()
+        self._positions = [geometry.get_position(index) for index in range(geometry.get_width() ** 2)]
+        self._indices = {position: geometry.get_index(position) for position in geometry.get_positions()}
+        self._lines = geometry.get_lines()
+        self._index_shifts = get_index_shifts(size)
+        self._board = bytearray()
+
+        # stack of (index, previous byte, flipped indices) for each move, so that moves can be undone
+        self._history = []
+
+        # the code and the moves of each line
+        self._line_codes = []
+        self._line_moves = []
+        self.set_board(geometry.create_board())
+
+    def get_board(self):
+        """Returns the board as a bytearray of EMPTY, BLACK, WHITE and EDGE"""
+        return self._board
+
+    def set_board(self, board):
+        """Replaces the board with a copy of a 2D board list, forgetting any moves that could be undone"""
+        self._board = bytearray(PIECE_CODES[piece] for row in board for piece in row)
+        self._history = []
+        self._line_codes = [create_line_code(self._size, number, [self._board[index] for index in line])
+                            for number, line in enumerate(self._lines)]
+        self._line_moves = [line_moves_cache[code] for code in self._line_codes]
+
+    def is_valid_move(self, index, own):
+        """Returns True if placing an own piece at the index would capture at least one opponent piece"""
+        return any(index in line_moves_cache[self._line_codes[number]][FLIPS + own]
+                   for number, _ in self._index_shifts[index])
+
+    def set_pieces(self, indices, piece):
+        """Sets the piece at each of the indices, updating the codes and moves of the lines through them"""
+        board = self._board
+        index_shifts = self._index_shifts
+        line_codes = self._line_codes
+        changed_lines = set()
+        for index in indices:
+            # the bits of a square are switched from the old piece to the new one
+            change = board[index] ^ piece
+            board[index] = piece
+            for number, shift in index_shifts[index]:
+                line_codes[number] ^= change << shift
+                changed_lines.add(number)
+        line_moves = self._line_moves
+        for number in changed_lines:
+            line_moves[number] = line_moves_cache[line_codes[number]]
+
+    def return_available_positions(self, color):
+        """Returns the available move positions for a player of a chosen color"""
+        own = WHITE if color == 'white' else BLACK
+        return list(set(itertools.chain.from_iterable(map(operator.itemgetter(own), self._line_moves))))
+
+    def make_move(self, color, piece_position):
+        """
+        Places a piece of the chosen color at the corresponding location and flips any captured pieces. Returns the list
+        of positions that were flipped.
+        """
+        board = self._board
+        own = WHITE if color == 'white' else BLACK
+        index = self._indices[piece_position]
+        previous_piece = board[index]
+
+        flipped = []
+        if previous_piece == EMPTY:
+            # the flips along each line through an empty square are known from the line's moves
+            line_moves = self._line_moves
+            for number, _ in self._index_shifts[index]:
+                line_flips = line_moves[number][FLIPS + own].get(index)
+                if line_flips:
+                    flipped.extend(line_flips)
+        else:
+            # a piece placed over another walks each ray across opponent pieces, and flips them if the ray then
+            # reaches an own piece
+            opponent = BLACK + WHITE - own
+            for ray in self._rays[index]:
+                if board[ray[0]] != opponent:
+                    continue
+                for count, square in enumerate(ray):
+                    piece = board[square]
+                    if piece != opponent:
+                        if piece == own:
+                            flipped.extend(ray[:count])
+                        break
+        self._history.append((index, previous_piece, flipped))
+        self.set_pieces([index] + flipped, own)
+
+        positions = self._positions
+        return [positions[square] for square in flipped]
+
+    def undo_move(self):
+        """Restores the placed piece and every flipped piece of the most recent move"""
+        index, previous_piece, flipped = self._history.pop()
+        self.set_pieces(flipped, BLACK + WHITE - self._board[index])
+        self.set_pieces((index,), previous_piece)
+
+    def tabulate_score(self):
+        """Returns the score as a tuple (white_score, black_score)"""
+        return self._board.count(WHITE), self._board.count(BLACK)
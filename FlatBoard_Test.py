@@ -0,0 +1,72 @@
+# Author: Jonathan Reuter
+# GitHub username: ReuterJo
+# Date: 10/18/2026
+# Description: Contains test cases for FlatBoard.py
+
+import random
+import unittest
+from Othello import Othello
+from Bitboard import parse_board, bitboards_to_board
+from FlatBoard import FlatEngine, EMPTY, BLACK, WHITE, EDGE
+
+
+class TestFlatBoard(unittest.TestCase):
+    """Test cases for FlatBoard.py"""
+
+    def test_case_1(self):
+        """Test the starting board, moves, flips, undo and scores of a FlatEngine"""
+        engine = FlatEngine()
+        board = engine.get_board()
+        self.assertEqual(100, len(board))
+        self.assertEqual(EDGE, board[0])
+        self.assertEqual((WHITE, BLACK), (board[44], board[45]))
+        self.assertEqual([(3, 4), (4, 3), (5, 6), (6, 5)], sorted(engine.return_available_positions('black')))
+        self.assertEqual([(5, 5)], engine.make_move('black', (6, 5)))
+        self.assertEqual((1, 4), engine.tabulate_score())
+        self.assertEqual([(4, 6), (6, 4), (6, 6)], sorted(engine.return_available_positions('white')))
+        engine.undo_move()
+        self.assertEqual((2, 2), engine.tabulate_score())
+        self.assertEqual(EMPTY, board[65])
+        self.assertEqual([(3, 5), (4, 6), (5, 3), (6, 4)], sorted(engine.return_available_positions('white')))
+
+    def test_case_2(self):
+        """Test that the flat backend matches the list backend over random games on several board sizes"""
+        rng = random.Random(17)
+        for size in (6, 8, 10):
+            for _ in range(5):
+                list_game = Othello('list', size)
+                flat_game = Othello('flat', size)
+                color = 'black'
+                passes = 0
+                while passes < 2:
+                    list_moves = list_game.return_available_positions(color)
+                    self.assertEqual(sorted(list_moves), sorted(flat_game.return_available_positions(color)))
+                    if list_moves:
+                        passes = 0
+                        move = rng.choice(sorted(list_moves))
+                        self.assertEqual(list_game.make_move(color, move), flat_game.make_move(color, move))
+                        self.assertEqual(list_game.tabulate_score(), flat_game.tabulate_score())
+                        self.assertEqual(list_game.get_hash(), flat_game.get_hash())
+
+                        # take a move back now and then, and play it again
+                        if rng.random() < 0.3:
+                            list_game.undo_move()
+                            flat_game.undo_move()
+                            self.assertEqual(list_game.get_board(), flat_game.get_board())
+                            list_game.make_move(color, move)
+                            flat_game.make_move(color, move)
+                    else:
+                        passes += 1
+                    color = 'white' if color == 'black' else 'black'
+
+    def test_case_3(self):
+        """Test the flat backend after loading a board, through a pass and the end of the game"""
+        game = Othello('flat')
+        self.assertEqual('flat', game.get_backend())
+        game.load_board(bitboards_to_board(*parse_board('XO' + '.' * 62)))
+        self.assertEqual([], game.return_available_positions('white'))
+        self.assertEqual([(1, 3)], game.return_available_positions('black'))
+        self.assertEqual([], game.play_game('white', None))
+        game.play_game('black', (1, 3))
+        self.assertEqual((0, 3), game.tabulate_score())
+        self.assertTrue(game.is_game_over())
@@ -0,0 +1,157 @@
+# Author: Jonathan Reuter
+# GitHub username: ReuterJo
+# Date: 10/18/2026
+# Description: Describes the layout of Othello boards of any even size from 4x4 to 16x16. A board of size N is held
+# with a border of edge squares around it, as N + 2 rows of N + 2 squares, which can also be numbered as a single flat
+# array. For each size, the direction offsets in that flat array and the ray of squares in each direction from every
+# square are computed once and cached, so that walking a line of pieces never has to check for the edge of the board.
+
+# all 8 directions relative to a position
+DIRECTIONS = ((0, 1), (1, 1), (1, 0), (1, -1), (0, -1), (-1, -1), (-1, 0), (-1, 1))
+
+# the 4 directions along which lines of squares are read: rows, columns, and both diagonals
+LINE_DIRECTIONS = ((0, 1), (1, 0), (1, 1), (1, -1))
+
+# shortest line that can hold a move, which needs an empty square, an opponent piece and an own piece
+MIN_LINE_LENGTH = 3
+
+# supported board sizes
+MIN_SIZE = 4
+MAX_SIZE = 16
+DEFAULT_SIZE = 8
+
+
+class BoardGeometry:
+    """
+    Represents the layout of a board of one size, including the edge around it. Squares are identified either by
+    (row, column) positions, with rows and columns 1 through size, or by their index in the flat array of
+    (size + 2) * (size + 2) squares, row by row. Use get_geometry rather than creating geometries directly, so that
+    each size is only computed once.
+    """
+    def __init__(self, size):
+        """Computes the layout of a board of the given size, which must be even and between MIN_SIZE and MAX_SIZE"""
+        if size % 2 != 0 or not MIN_SIZE <= size <= MAX_SIZE:
+            raise ValueError('Board size must be even and between %d and %d' % (MIN_SIZE, MAX_SIZE))
+        self._size = size
+        self._width = size + 2
+        self._offsets = tuple(row_step * self._width + column_step for row_step, column_step in DIRECTIONS)
+        self._positions = tuple((row, column) for row in range(1, size + 1) for column in range(1, size + 1))
+
+        # the ray in each direction from each position, as the positions passed in order up to the edge. Directions
+        # pointing straight off the board have no ray.
+        self._position_rays = {}
+        self._rays = [()] * (self._width * self._width)
+        for row, column in self._positions:
+            position_rays = []
+            for row_step, column_step in DIRECTIONS:
+                ray = []
+                next_row = row + row_step
+                next_column = column + column_step
+                while 1 <= next_row <= size and 1 <= next_column <= size:
+                    ray.append((next_row, next_column))
+                    next_row += row_step
+                    next_column += column_step
+                if ray:
+                    position_rays.append(tuple(ray))
+            self._position_rays[(row, column)] = tuple(position_rays)
+            self._rays[self.get_index((row, column))] = tuple(tuple(self.get_index(position) for position in ray)
+                                                              for ray in position_rays)
+
+        # every row, column and diagonal long enough to hold a move, as the indices of its squares in order, and the
+        # lines through each index, as (line number, offset of the index in the line)
+        self._lines = []
+        self._index_lines = [[] for _ in range(self._width * self._width)]
+        for row, column in self._positions:
+            for row_step, column_step in LINE_DIRECTIONS:
+                # a line starts at the first square in its direction
+                if 1 <= row - row_step <= size and 1 <= column - column_step <= size:
+                    continue
+                line = []
+                next_row, next_column = row, column
+                while 1 <= next_row <= size and 1 <= next_column <= size:
+                    line.append(self.get_index((next_row, next_column)))
+                    next_row += row_step
+                    next_column += column_step
+                if len(line) >= MIN_LINE_LENGTH:
+                    for offset, index in enumerate(line):
+                        self._index_lines[index].append((len(self._lines), offset))
+                    self._lines.append(tuple(line))
+        self._index_lines = [tuple(lines) for lines in self._index_lines]
+
+    def get_size(self):
+        """Returns the number of rows and columns of the board, not counting the edge"""
+        return self._size
+
+    def get_width(self):
+        """Returns the number of rows and columns including the edge, which is the row length of the flat array"""
+        return self._width
+
+    def get_offsets(self):
+        """Returns the step in the flat array for each of the DIRECTIONS"""
+        return self._offsets
+
+    def get_positions(self):
+        """Returns every (row, column) position on the board, in order"""
+        return self._positions
+
+    def get_index(self, position):
+        """Returns the index in the flat array of a (row, column) position"""
+        return position[0] * self._width + position[1]
+
+    def get_position(self, index):
+        """Returns the (row, column) position of an index in the flat array"""
+        return divmod(index, self._width)
+
+    def get_position_rays(self):
+        """
+        Returns a dictionary from each position to its rays, each ray being a tuple of the positions passed on the way
+        from the position to the edge in one direction
+        """
+        return self._position_rays
+
+    def get_rays(self):
+        """Returns a list from each index in the flat array to its rays, given as indices. Edge squares have no rays."""
+        return self._rays
+
+    def get_lines(self):
+        """
+        Returns the list of every row, column and diagonal of at least MIN_LINE_LENGTH squares, each as a tuple of the
+        indices of its squares in order
+        """
+        return self._lines
+
+    def get_index_lines(self):
+        """
+        Returns a list from each index in the flat array to the lines through it, each as a tuple (line number, offset
+        of the index in the line)
+        """
+        return self._index_lines
+
+    def get_start_pieces(self):
+        """Returns a dictionary from each of the four center positions to the piece placed there at the start"""
+        center = self._size // 2
+        return {(center, center): 'O', (center, center + 1): 'X', (center + 1, center): 'X',
+                (center + 1, center + 1): 'O'}
+
+    def create_board(self):
+        """Returns a new 2D board list in the starting position, with '*' around the edge and '.' for empty squares"""
+        board = [['*'] * self._width]
+        for _ in range(self._size):
+            board.append(['*'] + ['.'] * self._size + ['*'])
+        board.append(['*'] * self._width)
+        for (row, column), piece in self.get_start_pieces().items():
+            board[row][column] = piece
+        return board
+
+
+# geometries computed so far, by size
+geometry_cache = {}
+
+
+def get_geometry(size=DEFAULT_SIZE):
+    """Returns the BoardGeometry of a board size, computing it the first time the size is used"""
+    geometry = geometry_cache.get(size)
+    if geometry is None:
+        geometry = BoardGeometry(size)
+        geometry_cache[size] = geometry
+    return geometry
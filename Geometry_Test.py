@@ -0,0 +1,65 @@
+# Author: Jonathan Reuter
+# GitHub username: ReuterJo
+# Date: 10/18/2026
+# Description: Contains test cases for Geometry.py
+
+import unittest
+from Geometry import BoardGeometry, get_geometry
+
+
+class TestGeometry(unittest.TestCase):
+    """Test cases for Geometry.py"""
+
+    def test_case_1(self):
+        """Test the layout of a 6x6 board, and that sizes are validated"""
+        geometry = get_geometry(6)
+        self.assertIs(geometry, get_geometry(6))
+        self.assertEqual(6, geometry.get_size())
+        self.assertEqual(8, geometry.get_width())
+        self.assertEqual(36, len(geometry.get_positions()))
+        self.assertEqual(19, geometry.get_index((2, 3)))
+        self.assertEqual((2, 3), geometry.get_position(19))
+        self.assertEqual((1, 9, 8, 7, -1, -9, -8, -7), geometry.get_offsets())
+        self.assertEqual({(3, 3): 'O', (3, 4): 'X', (4, 3): 'X', (4, 4): 'O'}, geometry.get_start_pieces())
+        for size in (2, 7, 18):
+            with self.assertRaises(ValueError):
+                BoardGeometry(size)
+
+    def test_case_2(self):
+        """Test the rays from a corner and from the center of a 4x4 board"""
+        geometry = get_geometry(4)
+        self.assertEqual((((1, 2), (1, 3), (1, 4)), ((2, 2), (3, 3), (4, 4)), ((2, 1), (3, 1), (4, 1))),
+                         geometry.get_position_rays()[(1, 1)])
+        self.assertEqual(8, len(geometry.get_position_rays()[(2, 2)]))
+        self.assertEqual(((8, 9, 10), (14, 21, 28), (13, 19, 25)), geometry.get_rays()[7])
+        self.assertEqual((), geometry.get_rays()[0])
+
+    def test_case_3(self):
+        """Test that each ray steps by its direction's offset without crossing the edge"""
+        for size in (4, 8, 16):
+            geometry = get_geometry(size)
+            for position in geometry.get_positions():
+                index = geometry.get_index(position)
+                for ray in geometry.get_rays()[index]:
+                    self.assertIn(ray[0] - index, geometry.get_offsets())
+                    for previous, current in zip((index,) + ray, ray):
+                        self.assertEqual(ray[0] - index, current - previous)
+                    row, column = geometry.get_position(ray[-1])
+                    self.assertTrue(1 <= row <= size and 1 <= column <= size)
+
+    def test_case_4(self):
+        """Test the rows, columns and diagonals of a 4x4 board and the lines through each index"""
+        geometry = get_geometry(4)
+        lines = geometry.get_lines()
+        self.assertEqual(14, len(lines))
+        self.assertEqual((7, 8, 9, 10), lines[0])
+        self.assertIn((7, 14, 21, 28), lines)
+        self.assertIn((8, 15, 22), lines)
+        self.assertIn((10, 15, 20, 25), lines)
+        self.assertEqual(38, len(get_geometry(8).get_lines()))
+        self.assertEqual(3, len(geometry.get_index_lines()[7]))
+        self.assertEqual(4, len(geometry.get_index_lines()[14]))
+        self.assertEqual((), geometry.get_index_lines()[0])
+        for index, index_lines in enumerate(geometry.get_index_lines()):
+            for number, offset in index_lines:
+                self.assertEqual(index, lines[number][offset])
@@ -0,0 +1,183 @@
+# Author: Jonathan Reuter
+# GitHub username: ReuterJo
+# Date: 10/18/2026
+# Description: Measures where time goes inside the Othello class. An Instrumentation replaces the methods for move
+# generation, flipping, scoring and game-over checks with wrappers that count calls and time, only while it is
+# enabled, so that a disabled instrumentation leaves the original methods in place and costs nothing. The counts can
+# be read as a dictionary or as Prometheus text. profile_games captures a cProfile dump of a batch of games, which
+# can be read with pstats or turned into a flame graph by tools such as flameprof or snakeviz.
+
+import argparse
+import contextlib
+import cProfile
+import functools
+import pstats
+import random
+import time
+
+from Othello import Othello
+from Tournament import create_strategy, play_match
+
+# the Othello methods measured for each operation
+INSTRUMENTED_METHODS = {'move_generation': 'return_available_positions',
+                        'flipping': 'flip_captured_pieces',
+                        'scoring': 'tabulate_score',
+                        'game_over': 'is_game_over'}
+
+# the instrumentation currently enabled on each class, since only one can replace its methods at a time
+enabled_instrumentations = {}
+
+
+class Instrumentation:
+    """
+    Counts the calls to some of a class's methods and the time spent in them, by replacing them on the class while
+    enabled. Times include any instrumented methods called from inside another, such as the move generation done by a
+    game-over check. Can be used as a context manager, which enables it for the duration of the block.
+    """
+    def __init__(self, cls=Othello, methods=None):
+        """
+        Creates a disabled instrumentation of a class. methods maps each operation name to the name of the method
+        measured for it, and defaults to INSTRUMENTED_METHODS.
+        """
+        if methods is None:
+            methods = INSTRUMENTED_METHODS
+        self._class = cls
+        self._methods = dict(methods)
+        self._originals = {}
+
+        # [calls, seconds] for each operation, updated in place by the wrappers
+        self._counters = {operation: [0, 0.0] for operation in self._methods}
+
+    def __enter__(self):
+        """Enables the instrumentation and returns it"""
+        self.enable()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Disables the instrumentation"""
+        self.disable()
+
+    def is_enabled(self):
+        """Returns True if the instrumented methods are currently replaced by wrappers"""
+        return len(self._originals) > 0
+
+    def create_wrapper(self, method, counter):
+        """Returns a wrapper around a method, which adds each call and its duration to a [calls, seconds] counter"""
+        perf_counter = time.perf_counter
+
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                counter[0] += 1
+                counter[1] += perf_counter() - start
+        return wrapper
+
+    def enable(self):
+        """Replaces the instrumented methods of the class with wrappers. Raises ValueError if another is enabled."""
+        if self.is_enabled():
+            return
+        if self._class in enabled_instrumentations:
+            raise ValueError('Another instrumentation is already enabled on ' + self._class.__name__)
+        enabled_instrumentations[self._class] = self
+        for operation, method_name in self._methods.items():
+            method = self._class.__dict__[method_name]
+            self._originals[method_name] = method
+            setattr(self._class, method_name, self.create_wrapper(method, self._counters[operation]))
+
+    def disable(self):
+        """Puts the original methods back on the class, keeping the counts collected so far"""
+        for method_name, method in self._originals.items():
+            setattr(self._class, method_name, method)
+        self._originals = {}
+        enabled_instrumentations.pop(self._class, None)
+
+    def reset(self):
+        """Sets every count back to zero"""
+        for counter in self._counters.values():
+            counter[0] = 0
+            counter[1] = 0.0
+
+    def get_statistics(self):
+        """
+        Returns a dictionary from each operation to a dictionary of its 'calls', total 'seconds', and average
+        'microseconds_per_call'
+        """
+        statistics = {}
+        for operation, (calls, seconds) in self._counters.items():
+            statistics[operation] = {'calls': calls,
+                                     'seconds': seconds,
+                                     'microseconds_per_call': seconds / calls * 1e6 if calls else 0.0}
+        return statistics
+
+    def to_prometheus(self, prefix='othello'):
+        """Returns the counts in the Prometheus text exposition format, as counters labelled by operation"""
+        lines = ['# HELP %s_calls_total Calls to each instrumented Othello operation.' % prefix,
+                 '# TYPE %s_calls_total counter' % prefix]
+        for operation, (calls, _) in self._counters.items():
+            lines.append('%s_calls_total{operation="%s"} %d' % (prefix, operation, calls))
+        lines.append('# HELP %s_seconds_total Seconds spent in each instrumented Othello operation.' % prefix)
+        lines.append('# TYPE %s_seconds_total counter' % prefix)
+        for operation, (_, seconds) in self._counters.items():
+            lines.append('%s_seconds_total{operation="%s"} %.9f' % (prefix, operation, seconds))
+        return '\n'.join(lines) + '\n'
+
+
+@contextlib.contextmanager
+def profile_games(path=None):
+    """
+    Profiles the code run inside the block with cProfile, and yields the profiler. If a path is given, the profile is
+    written there on leaving the block, in the pstats format read by pstats, snakeviz and flame graph tools.
+    """
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield profiler
+    finally:
+        profiler.disable()
+        if path is not None:
+            profiler.dump_stats(path)
+
+
+def play_games(games, black_strategy='random', white_strategy='random', seed=0):
+    """Plays a batch of games between two strategies through play_game, as a workload to measure"""
+    rng = random.Random(seed)
+    for _ in range(games):
+        play_match(create_strategy(black_strategy, rng), create_strategy(white_strategy, rng))
+
+
+def main():
+    """Plays a batch of games from the command line, and reports the time spent in each instrumented operation"""
+    parser = argparse.ArgumentParser(description='Measure where time goes inside the Othello class')
+    parser.add_argument('--games', type=int, default=100, help='number of games played')
+    parser.add_argument('--black', default='random', help='strategy of the black player')
+    parser.add_argument('--white', default='random', help='strategy of the white player')
+    parser.add_argument('--profile', help='also write a cProfile dump of the games to this file')
+    parser.add_argument('--prometheus', action='store_true', help='print the counts as Prometheus text')
+    parser.add_argument('--seed', type=int, default=0, help='random seed')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    with Instrumentation() as instrumentation:
+        if args.profile:
+            with profile_games(args.profile):
+                play_games(args.games, args.black, args.white, args.seed)
+        else:
+            play_games(args.games, args.black, args.white, args.seed)
+    elapsed = time.perf_counter() - start
+
+    if args.prometheus:
+        print(instrumentation.to_prometheus(), end='')
+    else:
+        print('%d games in %.2fs' % (args.games, elapsed))
+        for operation, statistics in instrumentation.get_statistics().items():
+            print('%-16s %9d calls  %8.3fs  %8.2f us/call' % (operation, statistics['calls'], statistics['seconds'],
+                                                              statistics['microseconds_per_call']))
+    if args.profile:
+        pstats.Stats(args.profile).sort_stats('cumulative').print_stats(15)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+# Author: Jonathan Reuter
+# GitHub username: ReuterJo
+# Date: 10/18/2026
+# Description: Contains test cases for Instrumentation.py
+
+import os
+import pstats
+import tempfile
+import unittest
+from Othello import Othello
+from Instrumentation import Instrumentation, profile_games, play_games
+
+
+class TestInstrumentation(unittest.TestCase):
+    """Test cases for Instrumentation.py"""
+
+    def test_case_1(self):
+        """Test that the methods are only replaced while enabled, and that the counts are kept after disabling"""
+        original = Othello.return_available_positions
+        instrumentation = Instrumentation()
+        self.assertFalse(instrumentation.is_enabled())
+        with instrumentation:
+            self.assertIsNot(original, Othello.return_available_positions)
+            with self.assertRaises(ValueError):
+                Instrumentation().enable()
+            game = Othello()
+            game.play_game('black', (3, 4))
+            game.tabulate_score()
+        self.assertIs(original, Othello.return_available_positions)
+        self.assertFalse(instrumentation.is_enabled())
+
+        # play_game checks the moves of the player, and submit_move makes the move
+        statistics = instrumentation.get_statistics()
+        self.assertEqual(1, statistics['move_generation']['calls'])
+        self.assertEqual(1, statistics['flipping']['calls'])
+        self.assertEqual(1, statistics['scoring']['calls'])
+        self.assertEqual(0, statistics['game_over']['calls'])
+        self.assertGreater(statistics['flipping']['seconds'], 0)
+        Othello().tabulate_score()
+        self.assertEqual(1, instrumentation.get_statistics()['scoring']['calls'])
+        instrumentation.reset()
+        self.assertEqual(0, instrumentation.get_statistics()['flipping']['calls'])
+
+    def test_case_2(self):
+        """Test counts over a batch of games, including move generation done inside game-over checks"""
+        with Instrumentation() as instrumentation:
+            play_games(3)
+        statistics = instrumentation.get_statistics()
+        self.assertGreater(statistics['game_over']['calls'], 3 * 20)
+        self.assertGreater(statistics['move_generation']['calls'], 2 * statistics['game_over']['calls'])
+        self.assertEqual(0, Instrumentation().get_statistics()['move_generation']['microseconds_per_call'])
+
+    def test_case_3(self):
+        """Test the Prometheus text format"""
+        instrumentation = Instrumentation(methods={'scoring': 'tabulate_score'})
+        with instrumentation:
+            Othello().tabulate_score()
+        lines = instrumentation.to_prometheus().splitlines()
+        self.assertEqual(['# HELP othello_calls_total Calls to each instrumented Othello operation.',
+                          '# TYPE othello_calls_total counter',
+                          'othello_calls_total{operation="scoring"} 1',
+                          '# HELP othello_seconds_total Seconds spent in each instrumented Othello operation.',
+                          '# TYPE othello_seconds_total counter'], lines[:5])
+        self.assertTrue(lines[5].startswith('othello_seconds_total{operation="scoring"} 0.'))
+        self.assertEqual(6, len(lines))
+
+    def test_case_4(self):
+        """Test that profile_games writes a profile that pstats can read"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'games.prof')
+            with profile_games(path):
+                play_games(1)
+            stats = pstats.Stats(path)
+            functions = {function for _, _, function in stats.stats}
+            self.assertIn('play_match', functions)
+            self.assertIn('make_move', functions)
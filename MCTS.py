@@ -0,0 +1,383 @@
+# Author: Jonathan Reuter
+# GitHub username: ReuterJo
+# Date: 10/18/2026
+# Description: Implements a Monte Carlo tree search computer player for Othello, using UCT to choose which moves to
+# explore. The tree is grown with the Othello class's return_available_positions and make_move, and the random games
+# played out from its leaves are run together in batches with the BatchEngine. Nodes are kept in flat arrays, and the
+# tree is kept between moves so that the search continues from the part of the tree that was played into.
+
+import argparse
+import math
+import time
+from array import array
+
+import numpy as np
+
+from Othello import Othello, Player
+from BatchEngine import BatchEngine
+from Bitboard import board_to_bitboards, position_to_square, square_to_position
+
+# move stored for a pass
+PASS_MOVE = 64
+
+# first child of a node that has not been expanded yet, and of a node where the game is over
+UNEXPANDED = -1
+TERMINAL = -2
+
+# default weight of exploration against exploitation in UCT
+EXPLORATION = 1.4
+
+
+class MonteCarloTree:
+    """
+    Represents a search tree stored as flat arrays with one element per node, so that trees with millions of nodes
+    fit in memory. The children of a node are stored next to each other, so that a node only needs the index of its
+    first child and the number of children. Each node records the move leading to it, whether that move was made by
+    white, and the number of playouts through it together with how many of them were won by the player who moved.
+    Node 0 is the root.
+    """
+    def __init__(self, white_to_move):
+        """Creates a tree with only a root, for a position with the given player to move"""
+        self._first_child = array('i', [UNEXPANDED])
+        self._child_count = array('B', [0])
+        self._move = array('B', [PASS_MOVE])
+        self._white_moved = array('B', [0 if white_to_move else 1])
+        self._visits = array('I', [0])
+        self._wins = array('f', [0.0])
+
+    def get_node_count(self):
+        """Returns the number of nodes in the tree"""
+        return len(self._visits)
+
+    def get_visits(self, node):
+        """Returns the number of playouts through a node"""
+        return self._visits[node]
+
+    def get_wins(self, node):
+        """Returns the number of playouts through a node won by the player who made its move, counting a tie as half"""
+        return self._wins[node]
+
+    def get_move(self, node):
+        """Returns the square of the move leading to a node, or PASS_MOVE"""
+        return self._move[node]
+
+    def white_to_move(self, node):
+        """Returns True if white is to move in the position of a node"""
+        return not self._white_moved[node]
+
+    def is_expanded(self, node):
+        """Returns True if the children of a node have been added, or the game is over at the node"""
+        return self._first_child[node] != UNEXPANDED
+
+    def is_terminal(self, node):
+        """Returns True if the game is over at a node"""
+        return self._first_child[node] == TERMINAL
+
+    def get_children(self, node):
+        """Returns the range of the indices of a node's children"""
+        first_child = self._first_child[node]
+        if first_child < 0:
+            return range(0)
+        return range(first_child, first_child + self._child_count[node])
+
+    def find_child(self, node, move):
+        """Returns the child of a node reached by a move square or PASS_MOVE, or None if there is none"""
+        for child in self.get_children(node):
+            if self._move[child] == move:
+                return child
+        return None
+
+    def expand(self, node, moves):
+        """Adds a child to a node for each move square or PASS_MOVE. With no moves, the node is marked as game over."""
+        if len(moves) == 0:
+            self._first_child[node] = TERMINAL
+            return
+        white_moved = 1 - self._white_moved[node]
+        self._first_child[node] = len(self._visits)
+        self._child_count[node] = len(moves)
+        self._first_child.extend([UNEXPANDED] * len(moves))
+        self._child_count.extend([0] * len(moves))
+        self._move.extend(moves)
+        self._white_moved.extend([white_moved] * len(moves))
+        self._visits.extend([0] * len(moves))
+        self._wins.extend([0.0] * len(moves))
+
+    def select_child(self, node, exploration):
+        """
+        Returns the child of a node with the highest UCT value, which favors children with a high proportion of wins
+        and children that have been tried few times. Children that have never been tried are chosen first.
+        """
+        visits = self._visits
+        wins = self._wins
+        log_parent_visits = math.log(max(visits[node], 1))
+        best_child = None
+        best_value = -1.0
+        for child in self.get_children(node):
+            child_visits = visits[child]
+            if child_visits == 0:
+                return child
+            value = wins[child] / child_visits + exploration * math.sqrt(log_parent_visits / child_visits)
+            if value > best_value:
+                best_value = value
+                best_child = child
+        return best_child
+
+    def add_visit(self, node):
+        """Counts a playout through a node before its result is known, so that a batch of selections spreads out"""
+        self._visits[node] += 1
+
+    def add_result(self, node, white_result):
+        """
+        Adds the result of a playout through a node, given as 1 for a white win, 0 for a black win and 0.5 for a tie
+        """
+        if self._white_moved[node]:
+            self._wins[node] += white_result
+        else:
+            self._wins[node] += 1.0 - white_result
+
+    def most_visited_child(self, node):
+        """Returns the child of a node with the most playouts, or None if it has no children"""
+        best_child = None
+        for child in self.get_children(node):
+            if best_child is None or self._visits[child] > self._visits[best_child]:
+                best_child = child
+        return best_child
+
+    def extract_subtree(self, node):
+        """Returns a new tree holding only a node and its descendants, with the node as the root"""
+        subtree = MonteCarloTree(self.white_to_move(node))
+        subtree._move[0] = self._move[node]
+        subtree._visits[0] = self._visits[node]
+        subtree._wins[0] = self._wins[node]
+
+        # copy the nodes in breadth-first order, so that the children of each node stay next to each other
+        old_nodes = [node]
+        new_node = 0
+        while new_node < len(old_nodes):
+            old_node = old_nodes[new_node]
+            first_child = self._first_child[old_node]
+            if first_child == TERMINAL:
+                subtree._first_child[new_node] = TERMINAL
+            elif first_child != UNEXPANDED:
+                children = self.get_children(old_node)
+                subtree.expand(new_node, self._move[first_child:first_child + len(children)])
+                for child, new_child in zip(children, subtree.get_children(new_node)):
+                    subtree._visits[new_child] = self._visits[child]
+                    subtree._wins[new_child] = self._wins[child]
+                    old_nodes.append(child)
+            new_node += 1
+        return subtree
+
+
+def white_result(white_score, black_score):
+    """Returns the result of a game for white: 1 for a win, 0 for a loss and 0.5 for a tie"""
+    if white_score > black_score:
+        return 1.0
+    if white_score < black_score:
+        return 0.0
+    return 0.5
+
+
+class MCTSSearcher:
+    """
+    Chooses moves with Monte Carlo tree search. Each round selects a batch of leaves with UCT, counting each selection
+    as a visit straight away so that the leaves of a batch differ, plays a random game from every leaf at once with
+    the BatchEngine, and adds the results to every node on the way to each leaf. The tree is kept between searches,
+    and reused when the game has continued from the position last searched.
+    """
+    def __init__(self, time_limit=1.0, playouts=None, batch_size=128, exploration=EXPLORATION, seed=0):
+        """
+        Creates a new searcher, which searches for time_limit seconds, or until at least the given number of playouts
+        have been played if playouts is given
+        """
+        self._time_limit = time_limit
+        self._playouts = playouts
+        self._batch_size = batch_size
+        self._exploration = exploration
+        self._rng = np.random.default_rng(seed)
+        self._tree = None
+        self._game = None
+        self._history_length = 0
+        self._statistics = {'playouts': 0, 'elapsed': 0.0, 'playouts_per_second': 0.0, 'nodes': 0,
+                            'reused_playouts': 0}
+
+    def get_tree(self):
+        """Returns the tree of the most recent search, or None"""
+        return self._tree
+
+    def get_statistics(self):
+        """
+        Returns a dictionary describing the most recent search: the playouts played, the time taken, playouts per
+        second, the number of nodes in the tree, and the playouts kept from the previous search through tree reuse
+        """
+        return self._statistics
+
+    def prepare_tree(self, game, color):
+        """
+        Returns the tree for the position of the game, with the player of the given color to move. The previous tree
+        is reused if the game has continued from the position it was built for, by following the moves made since
+        into the tree and keeping only the part of the tree below them.
+        """
+        tree = self._tree
+        history = game.get_move_history()
+        node = 0
+        if tree is None or game is not self._game or len(history) < self._history_length:
+            tree = None
+        else:
+            for moved_color, position, _, _ in history[self._history_length:]:
+                # a move by the player who just moved means the other player passed
+                if (moved_color == 'white') != tree.white_to_move(node):
+                    node = tree.find_child(node, PASS_MOVE)
+                    if node is None:
+                        break
+                node = tree.find_child(node, PASS_MOVE if position is None else position_to_square(position))
+                if node is None:
+                    break
+            if node is not None and (color == 'white') != tree.white_to_move(node):
+                node = tree.find_child(node, PASS_MOVE)
+            if node is None:
+                tree = None
+            elif node != 0:
+                tree = tree.extract_subtree(node)
+
+        if tree is None:
+            tree = MonteCarloTree(color == 'white')
+        self._tree = tree
+        self._game = game
+        self._history_length = len(history)
+        return tree
+
+    def select_leaf(self, game, tree):
+        """
+        Descends the tree from the root with UCT, making each move on the game, and expands the node reached if it
+        has been visited before. Returns (path, black, white, white_to_move), where path lists the nodes visited and
+        the bitboards are those of the leaf. The game is left unchanged.
+        """
+        node = 0
+        path = [0]
+        tree.add_visit(0)
+        moves_made = 0
+        while True:
+            if not tree.is_expanded(node):
+                if tree.get_visits(node) == 1 and node != 0:
+                    # a node is only expanded when it is reached a second time
+                    break
+                color = 'white' if tree.white_to_move(node) else 'black'
+                positions = game.return_available_positions(color)
+                if positions:
+                    tree.expand(node, sorted(position_to_square(position) for position in positions))
+                elif game.is_game_over():
+                    tree.expand(node, [])
+                else:
+                    tree.expand(node, [PASS_MOVE])
+            if tree.is_terminal(node):
+                break
+
+            node = tree.select_child(node, self._exploration)
+            tree.add_visit(node)
+            path.append(node)
+            color = 'black' if tree.white_to_move(node) else 'white'
+            if tree.get_move(node) == PASS_MOVE:
+                game.pass_move(color)
+            else:
+                game.make_move(color, square_to_position(tree.get_move(node)))
+            moves_made += 1
+
+        black, white = board_to_bitboards(game.get_board())
+        for _ in range(moves_made):
+            game.undo_move()
+        return path, black, white, tree.white_to_move(node)
+
+    def run_batch(self, game, tree):
+        """Selects a batch of leaves, plays a random game from each of them at once, and adds up the results"""
+        leaves = [self.select_leaf(game, tree) for _ in range(self._batch_size)]
+        engine = BatchEngine(len(leaves))
+        for index, (_, black, white, white_to_move) in enumerate(leaves):
+            engine.set_game(index, black, white, 'white' if white_to_move else 'black')
+        engine.play_random_games(self._rng)
+        white_scores, black_scores = engine.tabulate_scores()
+
+        for (path, _, _, _), white_score, black_score in zip(leaves, white_scores, black_scores):
+            result = white_result(white_score, black_score)
+            for node in path:
+                tree.add_result(node, result)
+        return len(leaves)
+
+    def search(self, game, color):
+        """
+        Returns the move with the most playouts for the player of the given color, or None if that player has no
+        available moves. The game is left unchanged. Only supports 8x8 boards.
+        """
+        if game.get_size() != 8:
+            raise ValueError('Monte Carlo tree search only supports 8x8 boards')
+        start = time.perf_counter()
+        if len(game.return_available_positions(color)) == 0:
+            self._tree = None
+            return None
+        tree = self.prepare_tree(game, color)
+        reused_playouts = tree.get_visits(0)
+
+        playouts = 0
+        while True:
+            playouts += self.run_batch(game, tree)
+            if self._playouts is not None:
+                if playouts >= self._playouts:
+                    break
+            elif time.perf_counter() - start >= self._time_limit:
+                break
+
+        elapsed = time.perf_counter() - start
+        self._statistics = {'playouts': playouts,
+                            'elapsed': elapsed,
+                            'playouts_per_second': playouts / elapsed if elapsed > 0 else 0.0,
+                            'nodes': tree.get_node_count(),
+                            'reused_playouts': reused_playouts}
+        return square_to_position(tree.get_move(tree.most_visited_child(0)))
+
+
+class MCTSPlayer(Player):
+    """Represents a computer player, which chooses its moves with an MCTSSearcher"""
+    def __init__(self, player_name, color, time_limit=1.0, playouts=None, batch_size=128, exploration=EXPLORATION,
+                 seed=0):
+        """Creates a new computer player"""
+        super().__init__(player_name, color)
+        self._searcher = MCTSSearcher(time_limit, playouts, batch_size, exploration, seed)
+
+    def get_searcher(self):
+        """Returns the searcher used to choose moves"""
+        return self._searcher
+
+    def choose_move(self, game):
+        """Returns the move chosen for the player in the game, or None if the player has to pass"""
+        return self._searcher.search(game, self.get_player_color())
+
+    def play_turn(self, game):
+        """Chooses a move and plays it through play_game. Returns the result of play_game."""
+        return game.play_game(self.get_player_color(), self.choose_move(game))
+
+
+def main():
+    """Plays a game between two MCTS players from the command line, reporting playouts/sec for each move"""
+    parser = argparse.ArgumentParser(description='Play a game between two Monte Carlo tree search players')
+    parser.add_argument('--time', type=float, default=1.0, help='seconds per move')
+    parser.add_argument('--batch-size', type=int, default=128, help='playouts run together in each batch')
+    parser.add_argument('--seed', type=int, default=0, help='random seed')
+    args = parser.parse_args()
+
+    game = Othello()
+    players = {'black': MCTSPlayer('black', 'black', args.time, batch_size=args.batch_size, seed=args.seed),
+               'white': MCTSPlayer('white', 'white', args.time, batch_size=args.batch_size, seed=args.seed + 1)}
+    color = 'black'
+    while not game.is_game_over():
+        move = players[color].choose_move(game)
+        game.play_game(color, move)
+        statistics = players[color].get_searcher().get_statistics()
+        print('%s %s  playouts: %d (%d reused)  playouts/sec: %.0f  nodes: %d'
+              % (color, move, statistics['playouts'], statistics['reused_playouts'],
+                 statistics['playouts_per_second'], statistics['nodes']))
+        color = 'white' if color == 'black' else 'black'
+    print(game.return_winner())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+# Author: Jonathan Reuter
+# GitHub username: ReuterJo
+# Date: 10/18/2026
+# Description: Contains test cases for MCTS.py
+
+import unittest
+from Othello import Othello
+from Bitboard import parse_board, bitboards_to_board, position_to_square
+from MCTS import MonteCarloTree, MCTSSearcher, MCTSPlayer, PASS_MOVE
+
+
+class TestMCTS(unittest.TestCase):
+    """Test cases for MCTS.py"""
+
+    def test_case_1(self):
+        """Test expanding, selecting, results and extracting a subtree of a tree"""
+        tree = MonteCarloTree(False)
+        self.assertFalse(tree.is_expanded(0))
+        tree.expand(0, [19, 26, 37, 44])
+        self.assertEqual(range(1, 5), tree.get_children(0))
+        self.assertTrue(tree.white_to_move(1))
+        self.assertEqual(3, tree.find_child(0, 37))
+        self.assertIsNone(tree.find_child(0, 20))
+
+        # untried children come first, then the child with the best UCT value
+        for child in tree.get_children(0):
+            self.assertEqual(child, tree.select_child(0, 1.4))
+            for node in (0, child):
+                tree.add_visit(node)
+                tree.add_result(node, 0.0 if child == 2 else 1.0)
+        self.assertEqual(2, tree.select_child(0, 1.4))
+        self.assertEqual(1.0, tree.get_wins(2))
+        self.assertEqual(0.0, tree.get_wins(3))
+
+        tree.expand(2, [PASS_MOVE])
+        tree.expand(5, [])
+        tree.add_visit(2)
+        self.assertEqual(2, tree.most_visited_child(0))
+        subtree = tree.extract_subtree(2)
+        self.assertEqual(2, subtree.get_node_count())
+        self.assertEqual(2, subtree.get_visits(0))
+        self.assertEqual(PASS_MOVE, subtree.get_move(1))
+        self.assertTrue(subtree.is_terminal(1))
+
+    def test_case_2(self):
+        """Test that a search leaves the game unchanged, returns a legal move and reports its playouts"""
+        game = Othello()
+        searcher = MCTSSearcher(playouts=256, batch_size=64)
+        move = searcher.search(game, 'black')
+        self.assertIn(move, game.return_available_positions('black'))
+        self.assertEqual([], game.get_move_history())
+        statistics = searcher.get_statistics()
+        self.assertEqual(256, statistics['playouts'])
+        self.assertEqual(256, searcher.get_tree().get_visits(0))
+        self.assertGreater(statistics['playouts_per_second'], 0)
+        self.assertEqual(0, statistics['reused_playouts'])
+
+    def test_case_3(self):
+        """Test that the tree is reused across moves, and rebuilt for a different game"""
+        game = Othello()
+        searcher = MCTSSearcher(playouts=512, batch_size=128)
+        move = searcher.search(game, 'black')
+        game.make_move('black', move)
+        reply = game.return_available_positions('white')[0]
+        node = searcher.get_tree().find_child(0, position_to_square(move))
+        expected = searcher.get_tree().get_visits(searcher.get_tree().find_child(node, position_to_square(reply)))
+        game.make_move('white', reply)
+
+        searcher.search(game, 'black')
+        self.assertEqual(expected, searcher.get_statistics()['reused_playouts'])
+        self.assertGreater(expected, 0)
+        self.assertEqual(512 + expected, searcher.get_tree().get_visits(0))
+
+        searcher.search(Othello(), 'black')
+        self.assertEqual(0, searcher.get_statistics()['reused_playouts'])
+
+    def test_case_4(self):
+        """Test the player in a nearly finished game, and that it passes without available moves"""
+        # black can only take the last empty square
+        game = Othello()
+        game.load_board(bitboards_to_board(*parse_board(
+            'XXXXXXXX XXXXXXXX XXXXXXXX XXXXXXXX XXXXXXXX XXXXXXXX XXXXXXXO XXXXXXX.')))
+        player = MCTSPlayer('Ann', 'black', playouts=64, batch_size=32)
+        self.assertEqual((8, 8), player.choose_move(game))
+        self.assertIsNone(MCTSPlayer('Bob', 'white', playouts=64).choose_move(game))
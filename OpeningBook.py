@@ -0,0 +1,251 @@
+# Author: Jonathan Reuter
+# GitHub username: ReuterJo
+# Date: 10/18/2026
+# Description: Implements an opening book for Othello. The book is built from archived games, keeping statistics for
+# each move played in the early positions of those games, with positions that are symmetric to each other stored
+# once. It is saved as a sorted file of fixed-size entries that is memory-mapped and searched by bisection, so
+# looking up a position does not load the book into memory.
+
+import argparse
+import bisect
+import mmap
+import random
+import struct
+import time
+
+from Bitboard import (INVERSE_SYMMETRIES, board_to_bitboards, canonical_symmetries, transform_square,
+                      square_to_position)
+from Records import MappedRecordReader, iterate_bitboards
+
+# file header identifying an opening book, followed by the format version
+MAGIC = b'OTHB'
+VERSION = 1
+FILE_HEADER = MAGIC + bytes([VERSION])
+
+# each entry is the position as big-endian (own, opponent) bitboards of the player to move and the opponent, so that
+# entries sort by comparing their first 16 bytes, then the move's square in the position's canonical form, the number
+# of games in which the move was played, how many of them the player won and drew, and the sum of the final disc
+# differences for the player
+ENTRY = struct.Struct('>QQBIIIi')
+KEY_SIZE = 16
+
+# the key of every this many entries is kept in memory, so that a lookup only searches that many entries of the file
+INDEX_STRIDE = 64
+
+# by default, moves are recorded for this many plies from the start of each game
+DEFAULT_PLIES = 20
+
+
+def position_key(own, opponent):
+    """Returns the 16 byte key under which a canonical position is stored"""
+    return own.to_bytes(8, 'big') + opponent.to_bytes(8, 'big')
+
+
+def canonical_move(own, opponent, square):
+    """
+    Returns (canonical_own, canonical_opponent, canonical_square) for a move in a position. When the position is
+    symmetric, the move can be transformed in several ways; the smallest resulting square is used, so that
+    equivalent moves share their statistics.
+    """
+    canonical_own, canonical_opponent, symmetries = canonical_symmetries(own, opponent)
+    canonical_square = min(transform_square(square, symmetry) for symmetry in symmetries)
+    return canonical_own, canonical_opponent, canonical_square
+
+
+class OpeningBookBuilder:
+    """Collects move statistics from games, and saves them as an opening book file"""
+    def __init__(self, plies=DEFAULT_PLIES):
+        """Creates a new builder, which records the first plies moves of each game"""
+        self._plies = plies
+        # maps (own, opponent, square) to [games, wins, draws, disc_difference_sum]
+        self._statistics = {}
+
+    def get_entry_count(self):
+        """Returns the number of distinct (position, move) pairs collected"""
+        return len(self._statistics)
+
+    def add_result(self, own, opponent, square, disc_difference):
+        """
+        Records that the player owning the own bitboard played the given square in a position, and finished the game
+        with the given disc difference.
+        """
+        key = canonical_move(own, opponent, square)
+        statistics = self._statistics.get(key)
+        if statistics is None:
+            statistics = [0, 0, 0, 0]
+            self._statistics[key] = statistics
+        statistics[0] += 1
+        if disc_difference > 0:
+            statistics[1] += 1
+        elif disc_difference == 0:
+            statistics[2] += 1
+        statistics[3] += disc_difference
+
+    def add_record(self, record):
+        """Records the opening moves of a game record"""
+        white_score, black_score = record.get_score()
+        for ply, (own, opponent, color, square) in enumerate(iterate_bitboards(record)):
+            if ply >= self._plies:
+                break
+            if square is not None:
+                if color == 'white':
+                    self.add_result(own, opponent, square, white_score - black_score)
+                else:
+                    self.add_result(own, opponent, square, black_score - white_score)
+
+    def add_archive(self, path):
+        """Records the opening moves of every game in an archive written by Records.py. Returns the number of games."""
+        count = 0
+        with MappedRecordReader(path) as reader:
+            for record in reader:
+                self.add_record(record)
+                count += 1
+        return count
+
+    def save(self, path):
+        """Writes the collected statistics to an opening book file, sorted by position"""
+        with open(path, 'wb') as book_file:
+            book_file.write(FILE_HEADER)
+            for own, opponent, square in sorted(self._statistics):
+                games, wins, draws, disc_difference_sum = self._statistics[(own, opponent, square)]
+                book_file.write(ENTRY.pack(own, opponent, square, games, wins, draws, disc_difference_sum))
+
+
+class EntryKeys:
+    """Presents the keys of a memory-mapped opening book as a sequence, so that it can be searched with bisect"""
+    def __init__(self, book_map):
+        """Creates a sequence over the entries following the file header"""
+        self._map = book_map
+        self._length = (len(book_map) - len(FILE_HEADER)) // ENTRY.size
+
+    def __len__(self):
+        """Returns the number of entries"""
+        return self._length
+
+    def __getitem__(self, index):
+        """Returns the key of the entry at the index"""
+        offset = len(FILE_HEADER) + index * ENTRY.size
+        return self._map[offset:offset + KEY_SIZE]
+
+
+class OpeningBook:
+    """
+    Represents an opening book file, memory-mapped for lookups. Can be used as a context manager, and passed to an
+    AIPlayer, which plays book moves before searching.
+    """
+    def __init__(self, path, min_games=1):
+        """Opens an opening book. Moves played in fewer than min_games games are not chosen by choose_move."""
+        self._file = open(path, 'rb')
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._map[:len(FILE_HEADER)] != FILE_HEADER:
+            self.close()
+            raise ValueError('Not an opening book')
+        self._keys = EntryKeys(self._map)
+        self._index = [self._keys[index] for index in range(0, len(self._keys), INDEX_STRIDE)]
+        self._min_games = min_games
+
+    def __enter__(self):
+        """Returns the book"""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Closes the book"""
+        self.close()
+
+    def __len__(self):
+        """Returns the number of (position, move) entries in the book"""
+        return len(self._keys)
+
+    def get_entry(self, index):
+        """
+        Returns the entry at the index as a tuple (own, opponent, square, games, wins, draws, disc_difference_sum), in
+        the position's canonical form
+        """
+        return ENTRY.unpack_from(self._map, len(FILE_HEADER) + index * ENTRY.size)
+
+    def lookup_bitboards(self, own, opponent):
+        """
+        Returns the book moves for the player owning the own bitboard, as a list of
+        (square, games, wins, draws, disc_difference_sum), with squares in the orientation of the given position. In
+        a symmetric position, each of the equivalent moves is returned with the same statistics.
+        """
+        canonical_own, canonical_opponent, symmetries = canonical_symmetries(own, opponent)
+        key = position_key(canonical_own, canonical_opponent)
+
+        # find the block of entries holding the key in memory, then search the block in the file
+        block = bisect.bisect_left(self._index, key)
+        index = bisect.bisect_left(self._keys, key, max(0, (block - 1) * INDEX_STRIDE),
+                                   min(len(self._keys), block * INDEX_STRIDE))
+
+        moves = []
+        while index < len(self._keys) and self._keys[index] == key:
+            _, _, square, games, wins, draws, disc_difference_sum = self.get_entry(index)
+            squares = {transform_square(square, INVERSE_SYMMETRIES[symmetry]) for symmetry in symmetries}
+            for move_square in sorted(squares):
+                moves.append((move_square, games, wins, draws, disc_difference_sum))
+            index += 1
+        return moves
+
+    def lookup(self, game, color):
+        """
+        Returns the book moves for the player of the given color in an Othello game, as a list of
+        (position, games, wins, draws, average_disc_difference)
+        """
+        black, white = board_to_bitboards(game.get_board())
+        if color == 'white':
+            moves = self.lookup_bitboards(white, black)
+        else:
+            moves = self.lookup_bitboards(black, white)
+        return [(square_to_position(square), games, wins, draws, disc_difference_sum / games)
+                for square, games, wins, draws, disc_difference_sum in moves]
+
+    def choose_move(self, game, color):
+        """
+        Returns the book move with the best score for the player of the given color, counting a draw as half a win,
+        or None if the position is not in the book. Only moves played in at least min_games games are considered.
+        """
+        best_move = None
+        best_key = None
+        available_positions = game.return_available_positions(color)
+        for position, games, wins, draws, average in self.lookup(game, color):
+            if games < self._min_games or position not in available_positions:
+                continue
+            key = ((wins + draws / 2) / games, average, games)
+            if best_key is None or key > best_key:
+                best_key = key
+                best_move = position
+        return best_move
+
+    def close(self):
+        """Closes the memory map and the book file"""
+        self._map.close()
+        self._file.close()
+
+
+def main():
+    """Builds an opening book from a game archive from the command line, and reports its lookup speed"""
+    parser = argparse.ArgumentParser(description='Build an Othello opening book from a game archive')
+    parser.add_argument('archive', help='game archive written by Records.py')
+    parser.add_argument('book', help='opening book file to write')
+    parser.add_argument('--plies', type=int, default=DEFAULT_PLIES, help='moves recorded from the start of each game')
+    args = parser.parse_args()
+
+    builder = OpeningBookBuilder(args.plies)
+    start = time.perf_counter()
+    games = builder.add_archive(args.archive)
+    builder.save(args.book)
+    print('built %d entries from %d games in %.2fs' % (builder.get_entry_count(), games, time.perf_counter() - start))
+
+    # time lookups of positions taken from the book itself
+    with OpeningBook(args.book) as book:
+        rng = random.Random(0)
+        positions = [book.get_entry(rng.randrange(len(book)))[:2] for _ in range(1000)]
+        start = time.perf_counter()
+        for own, opponent in positions:
+            book.lookup_bitboards(own, opponent)
+        elapsed = time.perf_counter() - start
+        print('%.1f microseconds per lookup' % (elapsed / len(positions) * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+# Author: Jonathan Reuter
+# GitHub username: ReuterJo
+# Date: 10/18/2026
+# Description: Contains test cases for OpeningBook.py
+
+import os
+import random
+import tempfile
+import unittest
+from Othello import Othello
+from Records import GameRecord, RecordWriter, random_record
+from Search import AIPlayer
+from OpeningBook import OpeningBookBuilder, OpeningBook
+
+
+class TestOpeningBook(unittest.TestCase):
+    """Test cases for OpeningBook.py"""
+
+    def setUp(self):
+        """Creates a temporary directory for archives and books"""
+        self._directory = tempfile.TemporaryDirectory()
+        self._book_path = os.path.join(self._directory.name, 'book.bin')
+
+    def tearDown(self):
+        """Removes the temporary directory"""
+        self._directory.cleanup()
+
+    def test_case_1(self):
+        """Test that the four symmetric first moves share one entry, and are all returned by lookup"""
+        builder = OpeningBookBuilder(plies=1)
+        for move, score in (((3, 4), (20, 44)), ((4, 3), (30, 34)), ((5, 6), (40, 24)), ((6, 5), (32, 32))):
+            builder.add_record(GameRecord([], [move], *score))
+        self.assertEqual(1, builder.get_entry_count())
+        builder.save(self._book_path)
+        with OpeningBook(self._book_path) as book:
+            self.assertEqual(1, len(book))
+            moves = book.lookup(Othello(), 'black')
+            self.assertEqual([(3, 4), (4, 3), (5, 6), (6, 5)], sorted(move[0] for move in moves))
+            self.assertEqual({(4, 2, 1, 3.0)}, {move[1:] for move in moves})
+            # with white to move, the starting position is the mirror image of the one with black to move
+            self.assertEqual(sorted(Othello().return_available_positions('white')),
+                             sorted(move[0] for move in book.lookup(Othello(), 'white')))
+
+    def test_case_2(self):
+        """Test that moves are mapped back to the orientation of the position looked up"""
+        builder = OpeningBookBuilder()
+        builder.add_record(GameRecord([], [(3, 4), (3, 3), (4, 3)], 10, 54))
+        builder.save(self._book_path)
+        with OpeningBook(self._book_path) as book:
+            # the line (6, 5), (6, 6) is the recorded line rotated by 180 degrees, so (4, 3) is played at (5, 6)
+            game = Othello()
+            game.make_move('black', (6, 5))
+            self.assertEqual([((6, 6), 1, 0, 0, -44.0)], book.lookup(game, 'white'))
+            self.assertEqual((6, 6), book.choose_move(game, 'white'))
+            game.make_move('white', (6, 6))
+            self.assertEqual((5, 6), book.choose_move(game, 'black'))
+            game.make_move('black', (5, 6))
+            self.assertIsNone(book.choose_move(game, 'white'))
+
+    def test_case_3(self):
+        """Test building from an archive, with every book move legal in its position"""
+        archive_path = os.path.join(self._directory.name, 'games.bin')
+        rng = random.Random(3)
+        records = [random_record(rng) for _ in range(40)]
+        with RecordWriter(archive_path) as writer:
+            for record in records:
+                writer.write(record)
+        builder = OpeningBookBuilder(plies=6)
+        self.assertEqual(40, builder.add_archive(archive_path))
+        builder.save(self._book_path)
+        with OpeningBook(self._book_path) as book:
+            for record in records[:10]:
+                game = Othello()
+                color = 'black'
+                for move in record.get_moves()[:6]:
+                    book_moves = [book_move[0] for book_move in book.lookup(game, color)]
+                    self.assertIn(move, book_moves)
+                    self.assertTrue(set(book_moves) <= set(game.return_available_positions(color)))
+                    game.make_move(color, move)
+                    color = 'white' if color == 'black' else 'black'
+
+    def test_case_4(self):
+        """Test that an AIPlayer plays the book move before searching"""
+        builder = OpeningBookBuilder()
+        builder.add_record(GameRecord([], [(5, 6)], 0, 64))
+        builder.save(self._book_path)
+        with OpeningBook(self._book_path) as book:
+            player = AIPlayer('Deep', 'black', max_depth=1, book=book)
+            self.assertIn(player.choose_move(Othello()), [(3, 4), (4, 3), (5, 6), (6, 5)])
+            self.assertEqual(0, player.get_searcher().get_statistics()['nodes'])
+        with open(self._book_path, 'wb') as book_file:
+            book_file.write(b'nothing')
+        with self.assertRaises(ValueError):
+            OpeningBook(self._book_path)
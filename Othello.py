@@ -4,25 +4,139 @@
 # Description: This program implements a text-based version of the strategy board game called Othello. For more
 # information about this game, including the rules and history, please see https://en.wikipedia.org/wiki/Reversi.
 
+from Bitboard import BitboardEngine, board_to_bitboards
+from Endgame import EndgameSolver
+from FlatBoard import FlatEngine
+from Geometry import DEFAULT_SIZE, get_geometry
+from Position import Position
+from Transposition import get_zobrist_keys, compute_hash
+
+
 class Othello:
     """
     Represents a game of Othello, including board state, players, and game rules. Uses the Player class to keep
-    track of player information.
+    track of player information. Move generation, flipping and scoring can optionally be handled by a BitboardEngine
+    or a FlatEngine, in which case the 2D board list is kept as a mirror of the engine's board. The piece counts and,
+    with the list backend, the available positions of both colors are kept up to date as pieces are placed and
+    flipped, so the board must only be changed through make_move and undo_move, or refresh_board_state must be called
+    afterwards.
     """
-    def __init__(self):
-        """Creates a new game, with white and black pieces setup corresponding to their starting positions"""
-        self._board = [['*', '*', '*', '*', '*', '*', '*', '*', '*', '*'],
-                       ['*', '.', '.', '.', '.', '.', '.', '.', '.', '*'],
-                       ['*', '.', '.', '.', '.', '.', '.', '.', '.', '*'],
-                       ['*', '.', '.', '.', '.', '.', '.', '.', '.', '*'],
-                       ['*', '.', '.', '.', 'O', 'X', '.', '.', '.', '*'],
-                       ['*', '.', '.', '.', 'X', 'O', '.', '.', '.', '*'],
-                       ['*', '.', '.', '.', '.', '.', '.', '.', '.', '*'],
-                       ['*', '.', '.', '.', '.', '.', '.', '.', '.', '*'],
-                       ['*', '.', '.', '.', '.', '.', '.', '.', '.', '*'],
-                       ['*', '*', '*', '*', '*', '*', '*', '*', '*', '*']]
+    def __init__(self, backend='list', size=DEFAULT_SIZE):
+        """
+        Creates a new game, with white and black pieces setup corresponding to their starting positions. The backend
+        is either 'list', which walks the 2D board list, 'bitboard', which uses a BitboardEngine, or 'flat', which
+        uses a FlatEngine. The board has size rows and columns, which must be even and from 4 to 16; the bitboard
+        backend only supports 8x8 boards.
+        """
+        # the layout of the board, and the rays from each position to the edge, are shared by all games of a size
+        geometry = get_geometry(size)
+        self._size = size
+        self._board = geometry.create_board()
+        self._rays = geometry.get_position_rays()
+        self._zobrist_keys, self._zobrist_flip_keys = get_zobrist_keys(size)
         self._player_list = []
 
+        # stack of moves made, each recorded as (color, position, previous piece, flipped positions), so that they can
+        # be undone. A pass is recorded with a position of None.
+        self._move_history = []
+
+        # select the engine used for move generation, flipping and scoring
+        if backend == 'bitboard':
+            if size != 8:
+                raise ValueError('The bitboard backend only supports 8x8 boards')
+            self._engine = BitboardEngine()
+        elif backend == 'flat':
+            self._engine = FlatEngine(size)
+        elif backend == 'list':
+            self._engine = None
+        else:
+            raise ValueError('Invalid backend: ' + str(backend))
+        self._backend = backend
+
+        # state derived from the board, kept up to date as pieces are placed and flipped: the Zobrist hash of the
+        # board, the number of each symbol on the board, the available positions for each color, the positions changed
+        # since the available positions were last updated along with what they held at that time, and the positions
+        # still to be re-evaluated for each color
+        self._hash = 0
+        self._piece_counts = {}
+        self._available_positions = {'white': set(), 'black': set()}
+        self._changed_positions = {}
+        self._affected_positions = {'white': set(), 'black': set()}
+        self.refresh_board_state()
+
+    def load_board(self, board):
+        """
+        Replaces the state of the board with a copy of the given 2D board list, such as one returned by get_board. The
+        move history is cleared, since the moves leading to the new board are not known. The board must be of the
+        same size as the game's.
+        """
+        if len(board) != len(self._board):
+            raise ValueError('The board must have the same size as the game')
+        for row in range(len(self._board)):
+            self._board[row][:] = board[row]
+        self._move_history = []
+        self.refresh_board_state()
+
+    @classmethod
+    def from_position(cls, position, backend='list'):
+        """
+        Creates a new 8x8 game holding the board of a Position. The game does not keep track of the color to move,
+        which can be read from the position's get_side.
+        """
+        game = cls(backend)
+        game.load_board(position.get_board())
+        return game
+
+    def get_bitboards(self):
+        """
+        Returns the board of an 8x8 game as a (black, white) bitboard pair, read straight from the engine with the
+        bitboard backend
+        """
+        if self._size != 8:
+            raise ValueError('Bitboards only support 8x8 boards')
+        if self._backend == 'bitboard':
+            return self._engine.get_bitboards()
+        return board_to_bitboards(self._board)
+
+    def get_position(self, color):
+        """Returns the board of an 8x8 game as an immutable Position, with the given color to move"""
+        black, white = self.get_bitboards()
+        return Position(black, white, color)
+
+    def refresh_board_state(self):
+        """
+        Recalculates the hash, piece counts and available positions from the board. Only needed after the board list
+        has been changed directly rather than through make_move.
+        """
+        self._hash = compute_hash(self._board)
+        self._piece_counts = {'.': 0, 'X': 0, 'O': 0, '*': 0}
+        for row in self._board:
+            for piece in row:
+                self._piece_counts[piece] += 1
+        self._changed_positions = {}
+        self._affected_positions = {'white': set(), 'black': set()}
+        if self._engine is None:
+            self._available_positions['white'] = self.scan_available_positions('white')
+            self._available_positions['black'] = self.scan_available_positions('black')
+        else:
+            self._engine.set_board(self._board)
+
+    def get_backend(self):
+        """Returns the name of the backend used for move generation, flipping and scoring"""
+        return self._backend
+
+    def get_size(self):
+        """Returns the number of rows and columns of the board, not counting the edge"""
+        return self._size
+
+    def get_move_history(self):
+        """Returns the stack of moves made, as a list of (color, position, previous piece, flipped positions)"""
+        return self._move_history
+
+    def get_hash(self):
+        """Returns the Zobrist hash of the board"""
+        return self._hash
+
     def get_player_list(self):
         """Returns the list of players playing the game"""
         return self._player_list
@@ -40,17 +154,20 @@ class Othello:
 
     def print_board(self):
         """Prints the state of the game board to the display"""
+        # numbers are padded to the width of the largest, so that columns line up on boards of 10 or more rows
+        width = len(str(len(self._board) - 1))
+
         # print column numbering
-        print(' ', end=' ')
+        print(' ' * width, end=' ')
         for column in range(len(self._board[0])):
-            print(column, end=' ')
+            print(str(column).rjust(width), end=' ')
         print()
 
         # print the board including row numbering
         for row in range(len(self._board)):
-            print(row, end=' ')
+            print(str(row).rjust(width), end=' ')
             for column in range(len(self._board[0])):
-                print(self._board[row][column], end=' ')
+                print(self._board[row][column].rjust(width), end=' ')
             print()
 
     def create_player(self, player_name, color):
@@ -76,6 +193,87 @@ class Othello:
 
     def return_available_positions(self, color):
         """Returns the available move positions for a player of a chosen color"""
+        # if an engine is in use, let it generate the moves
+        if self._engine is not None:
+            return self._engine.return_available_positions(color)
+
+        # otherwise, bring the maintained available positions up to date with any changed positions
+        if self._changed_positions or self._affected_positions[color]:
+            self.update_available_positions(color)
+        return list(self._available_positions[color])
+
+    def is_game_over(self):
+        """Returns True if neither player has an available position to move to"""
+        return (len(self.return_available_positions('white')) == 0 and
+                len(self.return_available_positions('black')) == 0)
+
+    def update_available_positions(self, color):
+        """
+        Updates the available positions of a chosen color after pieces have been placed, flipped or restored. Only the
+        empty positions that can see a changed position along a line of pieces are re-evaluated, since no other
+        position's moves can have changed. The positions affected for the other color are kept until they are needed.
+        """
+        board = self._board
+        rays = self._rays
+
+        # find the positions affected by each changed position, for both colors
+        if self._changed_positions:
+            affected_positions = set()
+            for (row, column), previous_piece in self._changed_positions.items():
+                # a position changed back to what it held, such as by a move that was then undone, affects nothing
+                if board[row][column] == previous_piece:
+                    continue
+
+                # a changed position itself must be re-evaluated, as it may have been emptied by an undo
+                affected_positions.add((row, column))
+
+                # walk along each ray across pieces; the first empty position reached may have gained or lost a
+                # move
+                for ray in rays[(row, column)]:
+                    for next_position in ray:
+                        if board[next_position[0]][next_position[1]] == '.':
+                            affected_positions.add(next_position)
+                            break
+
+            self._changed_positions = {}
+            self._affected_positions['white'].update(affected_positions)
+            self._affected_positions['black'].update(affected_positions)
+
+        # re-evaluate each affected position for the chosen color
+        if color == 'white':
+            own_piece = 'O'
+            opponent_piece = 'X'
+        else:
+            own_piece = 'X'
+            opponent_piece = 'O'
+        available_positions = self._available_positions[color]
+        for position in self._affected_positions[color]:
+            if board[position[0]][position[1]] == '.' and self.is_valid_move(position, own_piece, opponent_piece):
+                available_positions.add(position)
+            else:
+                available_positions.discard(position)
+        self._affected_positions[color] = set()
+
+    def is_valid_move(self, position, own_piece, opponent_piece):
+        """Returns True if placing own_piece at the empty position would capture at least one opponent_piece"""
+        board = self._board
+        for ray in self._rays[position]:
+            row, column = ray[0]
+            if board[row][column] != opponent_piece:
+                continue
+            # step across the line of opponent pieces, which is captured if it ends at an own_piece before the edge
+            for row, column in ray:
+                piece = board[row][column]
+                if piece != opponent_piece:
+                    if piece == own_piece:
+                        return True
+                    break
+        return False
+
+    def scan_available_positions(self, color):
+        """
+        Returns the set of available move positions for a player of a chosen color, found by scanning the whole board
+        """
         # initialize an empty set for available positions
         available_positions = set()
 
@@ -95,8 +293,8 @@ class Othello:
                     # add them to the available positions set
                     available_positions.update(self.find_valid_moves((row, column), own_piece, opponent_piece))
 
-        # convert set of available positions into a list of available positions
-        return list(available_positions)
+        # return the set of available positions
+        return available_positions
 
     def find_valid_moves(self, position, own_piece, opponent_piece):
         """
@@ -150,14 +348,33 @@ class Othello:
 
     def make_move(self, color, piece_position):
         """Places a piece of the chosen color at the corresponding location. Returns the updated board state."""
-        # place a piece of the chosen color at the board location
+        # remember what was at the board location, so that the move can be undone
+        previous_piece = self._board[piece_position[0]][piece_position[1]]
+
+        # place a piece of the chosen color at the board location, and update the hash accordingly
         if color == 'white':
             self._board[piece_position[0]][piece_position[1]] = 'O'
         else:
             self._board[piece_position[0]][piece_position[1]] = 'X'
-
-        # flip any pieces captured by placing that piece
-        self.flip_captured_pieces(color, piece_position)
+        row, column = piece_position
+        keys = self._zobrist_keys
+        self._hash ^= keys[previous_piece][row][column] ^ keys[self._board[row][column]][row][column]
+        self._piece_counts[previous_piece] -= 1
+        self._piece_counts[self._board[row][column]] += 1
+
+        # flip any pieces captured by placing that piece, and record the move on the move history
+        flipped_positions = self.flip_captured_pieces(color, piece_position)
+        self._move_history.append((color, piece_position, previous_piece, flipped_positions))
+
+        # mark the changed positions, so the available positions are updated the next time they are needed
+        if self._engine is None:
+            changed_positions = self._changed_positions
+            if piece_position not in changed_positions:
+                changed_positions[piece_position] = previous_piece
+            opponent_piece = 'X' if color == 'white' else 'O'
+            for flipped_position in flipped_positions:
+                if flipped_position not in changed_positions:
+                    changed_positions[flipped_position] = opponent_piece
 
         # return the new state of the board after the piece has been placed and all captures are made
         return self._board
@@ -166,7 +383,7 @@ class Othello:
         """
         Helper function for rec_flip_captured pieces. Given a position, searches in all directions for an opponents
         piece, before starting the recursive process of moving piece by piece in a direction to evaluate if there are
-        captured pieces or not.
+        captured pieces or not. Returns the list of flipped positions.
         """
         # determine piece type based upon color
         if color == 'white':
@@ -176,6 +393,19 @@ class Othello:
             own_piece = 'X'
             opponent_piece = 'O'
 
+        # if an engine is in use, let it make the move, and mirror the flipped pieces onto the board
+        if self._engine is not None:
+            flipped_positions = self._engine.make_move(color, position)
+            for flipped_position in flipped_positions:
+                self._board[flipped_position[0]][flipped_position[1]] = own_piece
+                self._hash ^= self._zobrist_flip_keys[flipped_position[0]][flipped_position[1]]
+            self._piece_counts[own_piece] += len(flipped_positions)
+            self._piece_counts[opponent_piece] -= len(flipped_positions)
+            return flipped_positions
+
+        # initialize an empty list of flipped positions
+        flipped_positions = []
+
         # create a list of all 8 directions relative to the position received
         directions = [(0, 1), (1, 1), (1, 0), (1, -1), (0, -1), (-1, -1), (-1, 0), (-1, 1)]
 
@@ -183,13 +413,21 @@ class Othello:
         for direction in directions:
             if self._board[position[0] + direction[0]][position[1] + direction[1]] == opponent_piece:
                 # if found, start the recursive process of determining if there is any captured pieces in that direction
-                self.rec_flip_captured_pieces((position[0] + direction[0], position[1] + direction[1]), direction,
-                                              own_piece, opponent_piece)
+                flipped_positions.extend(self.rec_flip_captured_pieces((position[0] + direction[0],
+                                                                        position[1] + direction[1]), direction,
+                                                                       own_piece, opponent_piece))
+
+        # update the hash and piece counts for every flipped piece, and return the positions flipped in all directions
+        for flipped_position in flipped_positions:
+            self._hash ^= self._zobrist_flip_keys[flipped_position[0]][flipped_position[1]]
+        self._piece_counts[own_piece] += len(flipped_positions)
+        self._piece_counts[opponent_piece] -= len(flipped_positions)
+        return flipped_positions
 
     def rec_flip_captured_pieces(self, position, direction, own_piece, opponent_piece, positions_visited=None):
         """
         Recursively walks from a position in a direction to determine if a captured pieces exist. If so, it converts
-        those positions to be the color representing the capturing player.
+        those positions to be the color representing the capturing player. Returns the set of flipped positions.
         """
         # name board spaces representing empty spaces and the edge for better readability
         edge = '*'
@@ -205,23 +443,99 @@ class Othello:
 
         # base case - if next position in the direction is edge, do nothing
         if self._board[position[0] + direction[0]][position[1] + direction[1]] == edge:
-            return
+            return set()
 
         # base case - if next position in the direction is blank, do nothing
         if self._board[position[0] + direction[0]][position[1] + direction[1]] == blank:
-            return
+            return set()
 
         # base case - if next position in the direction is own_piece, flip all pieces recorded in positions_visited
         if self._board[position[0] + direction[0]][position[1] + direction[1]] == own_piece:
             for update_position in positions_visited:
                 self._board[update_position[0]][update_position[1]] = own_piece
-            return
+            return positions_visited
 
         # recursive case - if next position in the direction is opponent_piece, step to next position and evaluate again
         if self._board[position[0] + direction[0]][position[1] + direction[1]] == opponent_piece:
             next_position = (position[0] + direction[0], position[1] + direction[1])
-            self.rec_flip_captured_pieces(next_position, direction, own_piece, opponent_piece, positions_visited)
-            return
+            return self.rec_flip_captured_pieces(next_position, direction, own_piece, opponent_piece, positions_visited)
+
+    def pass_move(self, color):
+        """Records that the player of the chosen color passed, so that the pass can be undone like any other move"""
+        self._move_history.append((color, None, None, []))
+
+    def undo_move(self):
+        """
+        Takes back the most recent move or pass, restoring the placed piece and every flipped piece. Returns the updated
+        board state, or an error message if there is no move to undo.
+        """
+        if len(self._move_history) == 0:
+            return 'Invalid - there are no moves to undo'
+        color, piece_position, previous_piece, flipped_positions = self._move_history.pop()
+
+        # a pass did not change the board
+        if piece_position is None:
+            return self._board
+
+        # if an engine is in use, restore its state as well
+        if self._engine is not None:
+            self._engine.undo_move()
+
+        # restore the board location of the placed piece, and give every flipped piece back to the opponent, updating
+        # the hash accordingly
+        row, column = piece_position
+        keys = self._zobrist_keys
+        self._hash ^= keys[self._board[row][column]][row][column] ^ keys[previous_piece][row][column]
+        self._piece_counts[self._board[row][column]] -= 1
+        self._piece_counts[previous_piece] += 1
+        self._board[row][column] = previous_piece
+        own_piece = 'O' if color == 'white' else 'X'
+        opponent_piece = 'X' if color == 'white' else 'O'
+        for flipped_position in flipped_positions:
+            self._board[flipped_position[0]][flipped_position[1]] = opponent_piece
+            self._hash ^= self._zobrist_flip_keys[flipped_position[0]][flipped_position[1]]
+        self._piece_counts[own_piece] -= len(flipped_positions)
+        self._piece_counts[opponent_piece] += len(flipped_positions)
+
+        # mark the changed positions, so the available positions are updated the next time they are needed
+        if self._engine is None:
+            changed_positions = self._changed_positions
+            if piece_position not in changed_positions:
+                changed_positions[piece_position] = own_piece
+            for flipped_position in flipped_positions:
+                if flipped_position not in changed_positions:
+                    changed_positions[flipped_position] = own_piece
+
+        return self._board
+
+    def submit_move(self, player_color, piece_position):
+        """
+        Attempts a game move in the same way as play_game, but reports the outcome as a dictionary instead of printing
+        it, for callers such as a game server. The 'status' key is 'game_over' if neither player can move, along with
+        the 'white_score', 'black_score' and 'winner'; 'pass' if only the active player cannot move; 'invalid' if the
+        position is not available, along with the 'available_positions'; or 'moved' if the board was updated, along
+        with the 'flipped' positions.
+        """
+        # determine the active player's available positions
+        active_player_available_positions = self.return_available_positions(player_color)
+
+        # if both the active and inactive player have no available positions to move to, the game is over
+        if len(active_player_available_positions) == 0 and self.is_game_over():
+            score = self.tabulate_score()
+            return {'status': 'game_over', 'white_score': score[0], 'black_score': score[1],
+                    'winner': self.return_winner()}
+
+        # if only the active player has no available positions, he/she must pass
+        if len(active_player_available_positions) == 0:
+            return {'status': 'pass'}
+
+        # if the position chosen is valid, update the board accordingly
+        if piece_position in active_player_available_positions:
+            self.make_move(player_color, piece_position)
+            return {'status': 'moved', 'flipped': sorted(self._move_history[-1][3])}
+
+        # if the position is invalid, do not update the board
+        return {'status': 'invalid', 'available_positions': active_player_available_positions}
 
     def play_game(self, player_color, piece_position):
         """
@@ -231,58 +545,48 @@ class Othello:
         available positions is printed, and 'Invalid Move' is return. Lastly, if the move is valid, then the board is
         updated accordingly.
         """
-        # determine the active player's available positions
-        active_player_available_positions = self.return_available_positions(player_color)
-
-        # determine the inactive player's available positions
-        if player_color == 'white':
-            inactive_player_available_positions = self.return_available_positions('black')
-        else:
-            inactive_player_available_positions = self.return_available_positions('white')
+        result = self.submit_move(player_color, piece_position)
 
         # if both the active and inactive player have no available positions to move to, end the game
-        if len(active_player_available_positions) == 0 and len(inactive_player_available_positions) == 0:
-            # calculate the score and display it
-            score = self.tabulate_score()
-            print('Game is ended  white piece: ', score[0], ' black piece: ', score[1])
+        if result['status'] == 'game_over':
+            # display the score
+            print('Game is ended  white piece: ', result['white_score'], ' black piece: ', result['black_score'])
 
             # and return the winner of the game
-            return self.return_winner()
+            return result['winner']
 
         # if only the active player has no available positions, return an empty list indicating that he/she must pass
-        if len(active_player_available_positions) == 0:
-            return active_player_available_positions
+        if result['status'] == 'pass':
+            return []
 
-        # if the position chosen is valid, update the board accordingly
-        if piece_position in active_player_available_positions:
-            self.make_move(player_color, piece_position)
+        # if the position chosen was valid, the board has been updated
+        if result['status'] == 'moved':
             return
-        # if the position is invalid, do not update the board and inform the user of the valid positions
+        # if the position is invalid, the board was not updated, so inform the user of the valid positions
         # for his/her color
         else:
-            print("Here are the valid moves:", active_player_available_positions)
+            print("Here are the valid moves:", result['available_positions'])
             return "Invalid move"
 
+    def solve_endgame(self, color):
+        """
+        Solves the rest of the game exactly, for the player of the chosen color to move. Returns a tuple
+        (best_move, score, nodes), where score is the final difference between the player's and the opponent's pieces
+        with best play by both, best_move is None if the player must pass, and nodes is the number of positions
+        searched. Solves up to around 16 empty positions in seconds, and takes minutes from 20. Only supports 8x8
+        boards.
+        """
+        if self._size != 8:
+            raise ValueError('The endgame solver only supports 8x8 boards')
+        return EndgameSolver().solve(self, color)
+
     def tabulate_score(self):
         """
         Tabulates the current score determine by the number of pieces on the board of each color. Returns the score as a
         tuple (white_score, black_score).
         """
-        # set score for white and black to be zero
-        white_score = 0
-        black_score = 0
-
-        # iterate through the board position by position, incrementing score each time a piece of the corresponding
-        # color is found
-        for row in range(len(self._board)):
-            for column in range(len(self._board[0])):
-                if self._board[row][column] == 'O':
-                    white_score += 1
-                elif self._board[row][column] == 'X':
-                    black_score += 1
-
-        # return score as a tuple
-        return white_score, black_score
+        # the number of pieces of each color is kept up to date as pieces are placed and flipped
+        return self._piece_counts['O'], self._piece_counts['X']
 
 
 class Player:
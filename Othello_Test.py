@@ -3,8 +3,15 @@
 # Date: 5/27/2023
 # Description: Contains test cases for Othello.py
 
+import contextlib
+import copy
+import io
+import random
 import unittest
 from Othello import Othello, Player
+from Bitboard import bitboards_to_board, board_to_bitboards
+from Endgame import EndgameSolver
+from Transposition import compute_hash
 
 
 class TestOthello(unittest.TestCase):
@@ -242,3 +249,128 @@ class TestOthello(unittest.TestCase):
         game.play_game('white', (6, 7))
         # game.print_board()
         # print(game.play_game('black', (8,8)))
+
+    def test_case_14(self):
+        """Test undo_move, which restores the placed and flipped pieces, and get_move_history"""
+        game = Othello()
+        start_board = copy.deepcopy(game.get_board())
+        game.make_move('black', (6, 5))
+        board_after_first_move = copy.deepcopy(game.get_board())
+        game.make_move('white', (6, 6))
+        self.assertEqual([('black', (6, 5), '.', [(5, 5)]), ('white', (6, 6), '.', [(5, 5)])],
+                         game.get_move_history())
+        self.assertEqual(board_after_first_move, game.undo_move())
+        self.assertEqual(start_board, game.undo_move())
+        self.assertEqual([], game.get_move_history())
+        self.assertEqual('Invalid - there are no moves to undo', game.undo_move())
+
+    def test_case_15(self):
+        """Test pass_move and undo_move, including a move onto an occupied position, with both backends"""
+        for backend in ('list', 'bitboard'):
+            game = Othello(backend)
+            start_board = copy.deepcopy(game.get_board())
+            game.make_move('black', (4, 4))
+            game.pass_move('white')
+            game.make_move('black', (3, 3))
+            self.assertEqual((1, 4), game.tabulate_score())
+            game.undo_move()
+            game.undo_move()
+            game.undo_move()
+            self.assertEqual(start_board, game.get_board())
+            self.assertEqual((2, 2), game.tabulate_score())
+            self.assertEqual(sorted(Othello().return_available_positions('white')),
+                             sorted(game.return_available_positions('white')))
+
+    def test_case_16(self):
+        """Test that the maintained available positions and piece counts match a full scan, through moves and undos"""
+        rng = random.Random(6)
+        for _ in range(5):
+            game = Othello()
+            color = 'black'
+            while not game.is_game_over():
+                for check_color in ('white', 'black'):
+                    self.assertEqual(game.scan_available_positions(check_color),
+                                     set(game.return_available_positions(check_color)))
+                board = game.get_board()
+                self.assertEqual((sum(row.count('O') for row in board), sum(row.count('X') for row in board)),
+                                 game.tabulate_score())
+                moves = sorted(game.return_available_positions(color))
+                if moves:
+                    # try a move and take it back before playing another one
+                    game.make_move(color, rng.choice(moves))
+                    if rng.random() < 0.5:
+                        game.undo_move()
+                        game.make_move(color, rng.choice(moves))
+                color = 'white' if color == 'black' else 'black'
+
+    def test_case_17(self):
+        """Test refresh_board_state after changing the board directly"""
+        game = Othello()
+        game.get_board()[4][4] = 'X'
+        game.refresh_board_state()
+        self.assertEqual((1, 3), game.tabulate_score())
+        self.assertEqual(game.scan_available_positions('white'), set(game.return_available_positions('white')))
+
+    def test_case_18(self):
+        """Test submit_move, which reports the outcomes of play_game as dictionaries instead of printing them"""
+        game = Othello()
+        self.assertEqual({'status': 'moved', 'flipped': [(4, 4)]}, game.submit_move('black', (3, 4)))
+        result = game.submit_move('white', (1, 1))
+        self.assertEqual('invalid', result['status'])
+        self.assertEqual([(3, 3), (3, 5), (5, 3)], sorted(result['available_positions']))
+        self.assertEqual('moved', game.submit_move('white', (3, 3))['status'])
+        game.load_board(bitboards_to_board(1 << 0, 1 << 63))
+        self.assertEqual({'status': 'game_over', 'white_score': 1, 'black_score': 1, 'winner': "It's a tie"},
+                         game.submit_move('black', (2, 2)))
+
+    def test_case_19(self):
+        """Test boards of other sizes, checking moves, piece counts and the hash against full scans through a game"""
+        rng = random.Random(19)
+        for size in (4, 6, 10, 16):
+            game = Othello(size=size)
+            self.assertEqual(size, game.get_size())
+            self.assertEqual(size + 2, len(game.get_board()))
+            self.assertEqual('O', game.get_board()[size // 2][size // 2])
+            self.assertEqual('X', game.get_board()[size // 2][size // 2 + 1])
+            self.assertEqual([(size // 2 - 1, size // 2), (size // 2, size // 2 - 1)],
+                             sorted(game.return_available_positions('black'))[:2])
+            color = 'black'
+            while not game.is_game_over():
+                for check_color in ('white', 'black'):
+                    self.assertEqual(game.scan_available_positions(check_color),
+                                     set(game.return_available_positions(check_color)))
+                self.assertEqual(compute_hash(game.get_board()), game.get_hash())
+                moves = sorted(game.return_available_positions(color))
+                if moves:
+                    game.make_move(color, rng.choice(moves))
+                color = 'white' if color == 'black' else 'black'
+            white_score, black_score = game.tabulate_score()
+            self.assertEqual(sum(row.count('O') for row in game.get_board()), white_score)
+            self.assertEqual(sum(row.count('X') for row in game.get_board()), black_score)
+
+    def test_case_20(self):
+        """Test that invalid sizes are refused, and that print_board lines up the columns of larger boards"""
+        for size in (3, 9, 18):
+            with self.assertRaises(ValueError):
+                Othello(size=size)
+        with self.assertRaises(ValueError):
+            Othello('bitboard', 6)
+        with self.assertRaises(ValueError):
+            Othello(size=6).load_board(Othello().get_board())
+
+        # tools built on bitboards refuse other sizes, rather than reading part of the board
+        for size in (6, 10):
+            with self.assertRaises(ValueError):
+                Othello(size=size).solve_endgame('black')
+            with self.assertRaises(ValueError):
+                EndgameSolver().solve(Othello(size=size), 'black')
+            with self.assertRaises(ValueError):
+                board_to_bitboards(Othello(size=size).get_board())
+
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            Othello(size=10).print_board()
+        lines = output.getvalue().splitlines()
+        self.assertEqual(13, len(lines))
+        self.assertEqual('    0  1  2  3  4  5  6  7  8  9 10 11 ', lines[0])
+        self.assertEqual(' 5  *  .  .  .  .  O  X  .  .  .  .  * ', lines[6])
@@ -0,0 +1,341 @@
+# Author: Jonathan Reuter
+# GitHub username: ReuterJo
+# Date: 10/18/2026
+# Description: Implements a parallel alpha-beta search for Othello across worker processes. The moves at the root of
+# each iteration are split between the workers, which share a transposition table held in shared memory, so that
+# results found by one worker order the moves searched by the others in later iterations.
+
+import argparse
+import concurrent.futures
+import os
+import struct
+import time
+from multiprocessing import shared_memory
+
+from Othello import Othello
+from Bitboard import board_to_bitboards, bitboards_to_board, position_to_square, square_to_position
+from Endgame import random_endgame
+from Search import AlphaBetaSearcher, evaluate_position, WIN_SCORE
+
+# an entry is stored as two 64-bit words: the position key combined with the data by exclusive or, and the data.
+# An entry only partly written by one process while read by another then fails to match its key, and is ignored.
+ENTRY = struct.Struct('<QQ')
+
+# the data word holds the depth, the flag plus one (so that an empty entry has a flag of zero), the square of the best
+# move, or NO_MOVE, and the score
+DATA = struct.Struct('<hBBf')
+NO_MOVE = 255
+
+# the searcher and board backend used by each worker process, set when the worker starts
+worker_state = {}
+
+
+class SharedTranspositionTable:
+    """
+    Represents a transposition table held in shared memory, so that several processes can read and write it at once
+    without locks. It has the same buckets, replacement scheme and methods as TranspositionTable, but scores are
+    stored as 32-bit floats. The hit, miss, collision and store counters count the calls made in this process.
+    """
+    def __init__(self, size=65536, name=None):
+        """
+        Creates a new, empty table in shared memory, or attaches to the existing table with the given name. The
+        number of buckets is rounded down to a power of two.
+        """
+        self._size = 1 << (max(size, 1).bit_length() - 1)
+        self._mask = self._size - 1
+        self._owner = name is None
+        if self._owner:
+            self._memory = shared_memory.SharedMemory(create=True, size=self._size * 2 * ENTRY.size)
+            self._memory.buf[:] = bytes(len(self._memory.buf))
+        else:
+            self._memory = shared_memory.SharedMemory(name=name)
+        self._buffer = self._memory.buf
+        self._hits = 0
+        self._misses = 0
+        self._collisions = 0
+        self._stores = 0
+
+    def __enter__(self):
+        """Returns the table"""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Closes the table"""
+        self.close()
+
+    def get_name(self):
+        """Returns the name of the shared memory, for attaching to the table from another process"""
+        return self._memory.name
+
+    def get_size(self):
+        """Returns the number of buckets in the table"""
+        return self._size
+
+    def get_statistics(self):
+        """Returns a dictionary of the hit, miss, collision and store counters"""
+        return {'size': self._size,
+                'hits': self._hits,
+                'misses': self._misses,
+                'collisions': self._collisions,
+                'stores': self._stores}
+
+    def clear(self):
+        """Removes every entry and resets the counters"""
+        self._buffer[:] = bytes(len(self._buffer))
+        self._hits = 0
+        self._misses = 0
+        self._collisions = 0
+        self._stores = 0
+
+    def read_entry(self, offset):
+        """Returns the entry at a byte offset as (key, depth, score, flag, best_move), or None if it is empty or torn"""
+        check, data = ENTRY.unpack_from(self._buffer, offset)
+        depth, stored_flag, square, score = DATA.unpack(data.to_bytes(8, 'little'))
+        if stored_flag == 0:
+            return None
+        if score.is_integer():
+            score = int(score)
+        best_move = None if square == NO_MOVE else square_to_position(square)
+        return check ^ data, depth, score, stored_flag - 1, best_move
+
+    def probe(self, key):
+        """Returns the entry stored for the key, or None if there is none"""
+        offset = (key & self._mask) * 2 * ENTRY.size
+        entry = self.read_entry(offset)
+        if entry is not None and entry[0] == key:
+            self._hits += 1
+            return entry
+        other_entry = self.read_entry(offset + ENTRY.size)
+        if other_entry is not None and other_entry[0] == key:
+            self._hits += 1
+            return other_entry
+
+        # a miss on a bucket holding other positions is a collision
+        self._misses += 1
+        if entry is not None or other_entry is not None:
+            self._collisions += 1
+        return None
+
+    def store(self, key, depth, score, flag, best_move):
+        """Stores a search result for the key, replacing an older entry in its bucket"""
+        offset = (key & self._mask) * 2 * ENTRY.size
+        square = NO_MOVE if best_move is None else position_to_square(best_move)
+        data = int.from_bytes(DATA.pack(depth, flag + 1, square, score), 'little')
+        self._stores += 1
+
+        # the depth-preferred entry is only replaced by the same position or a search at least as deep
+        current = self.read_entry(offset)
+        if current is None or current[0] == key or depth >= current[1]:
+            ENTRY.pack_into(self._buffer, offset, key ^ data, data)
+        else:
+            ENTRY.pack_into(self._buffer, offset + ENTRY.size, key ^ data, data)
+
+    def close(self):
+        """Detaches from the shared memory, and removes it if this table created it"""
+        self._buffer = None
+        self._memory.close()
+        if self._owner:
+            self._memory.unlink()
+
+
+def start_worker(table_name, table_size, evaluate, backend):
+    """Creates the searcher of a worker process, using the shared table"""
+    worker_state['searcher'] = AlphaBetaSearcher(time_limit=float('inf'), evaluate=evaluate,
+                                                 table=SharedTranspositionTable(table_size, table_name))
+    worker_state['backend'] = backend
+
+
+def search_root_move(black, white, color, move, depth, alpha, beta):
+    """
+    Searches one root move in a worker process, for the position given as bitboards. Returns (score, nodes), where
+    the score is from the point of view of the player of the given color.
+    """
+    searcher = worker_state['searcher']
+    game = Othello(worker_state['backend'])
+    game.load_board(bitboards_to_board(black, white))
+    score = searcher.search_move(game, color, move, depth, alpha, beta)
+    return score, searcher.get_statistics()['nodes']
+
+
+class ParallelSearcher:
+    """
+    Searches an Othello game for the best move of a player across a pool of worker processes, with iterative
+    deepening. In each iteration, the best move of the previous iteration is searched first, to find a score to beat.
+    The other root moves are then searched in parallel with a null window, which only proves whether a move beats
+    that score, and any move that does is searched again in full. Can be used as a context manager.
+    """
+    def __init__(self, workers=None, max_depth=8, time_limit=None, table_size=1 << 20, evaluate=evaluate_position,
+                 backend='list'):
+        """
+        Creates a new searcher with its worker processes, by default one per core. With a time limit in seconds, no
+        new iteration is started once it has passed, but an iteration that has started is always finished.
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+        self._workers = workers
+        self._max_depth = max_depth
+        self._time_limit = time_limit
+        self._table = SharedTranspositionTable(table_size)
+        self._executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers, initializer=start_worker,
+            initargs=(self._table.get_name(), table_size, evaluate, backend))
+        self._nodes = 0
+        self._elapsed = 0.0
+        self._depth_reached = 0
+        self._best_score = None
+        self._depth_times = []
+
+    def __enter__(self):
+        """Returns the searcher"""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Shuts down the searcher"""
+        self.close()
+
+    def get_table(self):
+        """Returns the shared transposition table"""
+        return self._table
+
+    def get_statistics(self):
+        """
+        Returns a dictionary describing the most recent search, including depth_times, the list of
+        (depth, seconds since the search started) at which each iteration finished
+        """
+        return {'workers': self._workers,
+                'nodes': self._nodes,
+                'elapsed': self._elapsed,
+                'nodes_per_second': self._nodes / self._elapsed if self._elapsed > 0 else 0.0,
+                'depth': self._depth_reached,
+                'score': self._best_score,
+                'depth_times': self._depth_times}
+
+    def search(self, game, color):
+        """Returns the best move found for the player of the given color, or None if that player has no moves"""
+        start = time.perf_counter()
+        self._nodes = 0
+        self._depth_reached = 0
+        self._best_score = None
+        self._depth_times = []
+
+        moves = game.return_available_positions(color)
+        if len(moves) == 0:
+            self._elapsed = time.perf_counter() - start
+            return None
+        black, white = board_to_bitboards(game.get_board())
+        searcher = AlphaBetaSearcher()
+        best_move = searcher.order_moves(moves)[0]
+
+        for depth in range(1, self._max_depth + 1):
+            score, best_move = self.search_root(black, white, color, depth, searcher.order_moves(moves, best_move))
+            self._best_score = score
+            self._depth_reached = depth
+            self._depth_times.append((depth, time.perf_counter() - start))
+
+            # stop once the outcome of the game is known, or the time is up
+            if abs(score) >= WIN_SCORE:
+                break
+            if self._time_limit is not None and time.perf_counter() - start > self._time_limit:
+                break
+
+        self._elapsed = time.perf_counter() - start
+        return best_move
+
+    def search_root(self, black, white, color, depth, ordered_moves):
+        """Searches the root moves to the given depth across the workers. Returns the best (score, move)."""
+        # the first move is searched in full to find the score to beat
+        best_move = ordered_moves[0]
+        alpha, nodes = self._executor.submit(search_root_move, black, white, color, best_move, depth,
+                                             -WIN_SCORE * 2, WIN_SCORE * 2).result()
+        self._nodes += nodes
+
+        # the rest are searched in parallel with a null window, which proves whether they beat it
+        scouts = {self._executor.submit(search_root_move, black, white, color, move, depth, alpha, alpha + 1): move
+                  for move in ordered_moves[1:]}
+        better_moves = []
+        for future in concurrent.futures.as_completed(scouts):
+            score, nodes = future.result()
+            self._nodes += nodes
+            if score > alpha:
+                better_moves.append(scouts[future])
+
+        # search the moves that beat it again in parallel, for their exact scores
+        researches = {self._executor.submit(search_root_move, black, white, color, move, depth, alpha, WIN_SCORE * 2):
+                      move for move in better_moves}
+        scores = {}
+        for future in concurrent.futures.as_completed(researches):
+            score, nodes = future.result()
+            self._nodes += nodes
+            scores[researches[future]] = score
+
+        # keep the earliest ordered of the best moves
+        best_score = alpha
+        for move in ordered_moves[1:]:
+            if move in scores and scores[move] > best_score:
+                best_score = scores[move]
+                best_move = move
+        return best_score, best_move
+
+    def close(self):
+        """Shuts down the worker processes and removes the shared table"""
+        self._executor.shutdown()
+        self._table.close()
+
+
+def benchmark(worker_counts, depth, positions=4, empties=48, seed=0):
+    """
+    Searches the same random positions to a fixed depth with each number of workers. Returns a list of dictionaries,
+    one per worker count, of the total time to reach the depth, nodes searched, nodes per second, and the speedup in
+    time to depth over the first worker count.
+    """
+    games = []
+    for position_index in range(positions):
+        own, opponent, color = random_endgame(empties, seed + position_index)
+        game = Othello()
+        game.load_board(bitboards_to_board(*((opponent, own) if color == 'white' else (own, opponent))))
+        games.append((game, color))
+
+    results = []
+    for workers in worker_counts:
+        # a new searcher each time, so that no results are kept from earlier runs in the table
+        with ParallelSearcher(workers, max_depth=depth) as searcher:
+            elapsed = 0.0
+            nodes = 0
+            for game, color in games:
+                searcher.search(game, color)
+                statistics = searcher.get_statistics()
+                elapsed += statistics['elapsed']
+                nodes += statistics['nodes']
+        results.append({'workers': workers,
+                        'elapsed': elapsed,
+                        'nodes': nodes,
+                        'nodes_per_second': nodes / elapsed if elapsed > 0 else 0.0,
+                        'speedup': results[0]['elapsed'] / elapsed if results and elapsed > 0 else 1.0})
+    return results
+
+
+def main():
+    """Reports the time to depth, nodes/sec and speedup of the parallel search for several worker counts"""
+    parser = argparse.ArgumentParser(description='Benchmark the parallel Othello search')
+    parser.add_argument('--workers', type=int, nargs='+', default=None,
+                        help='worker counts to compare (default: 1, 2, 4, ... up to the number of cores)')
+    parser.add_argument('--depth', type=int, default=6, help='depth searched')
+    parser.add_argument('--positions', type=int, default=4, help='random positions searched')
+    parser.add_argument('--empties', type=int, default=48, help='empty squares in each random position')
+    parser.add_argument('--seed', type=int, default=0, help='random seed')
+    args = parser.parse_args()
+
+    worker_counts = args.workers
+    if worker_counts is None:
+        worker_counts = [1]
+        while worker_counts[-1] * 2 <= (os.cpu_count() or 1):
+            worker_counts.append(worker_counts[-1] * 2)
+
+    print('%8s %10s %12s %12s %8s' % ('workers', 'seconds', 'nodes', 'nodes/sec', 'speedup'))
+    for result in benchmark(worker_counts, args.depth, args.positions, args.empties, args.seed):
+        print('%8d %10.2f %12d %12.0f %8.2f' % (result['workers'], result['elapsed'], result['nodes'],
+                                                result['nodes_per_second'], result['speedup']))
+
+
+if __name__ == '__main__':
+    main()
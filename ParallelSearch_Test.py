@@ -0,0 +1,71 @@
+# Author: Jonathan Reuter
+# GitHub username: ReuterJo
+# Date: 10/18/2026
+# Description: Contains test cases for ParallelSearch.py
+
+import concurrent.futures
+import unittest
+from Othello import Othello
+from Search import AlphaBetaSearcher
+from Transposition import TranspositionTable
+from ParallelSearch import SharedTranspositionTable, ParallelSearcher, benchmark
+
+
+def store_in_other_process(name, size):
+    """Stores an entry in a shared table from a worker process"""
+    table = SharedTranspositionTable(size, name)
+    table.store(12345, 4, -7.5, TranspositionTable.LOWER_BOUND, (8, 8))
+    table.close()
+
+
+class TestParallelSearch(unittest.TestCase):
+    """Test cases for ParallelSearch.py"""
+
+    def test_case_1(self):
+        """Test store, probe, replacement and the counters of a shared table"""
+        with SharedTranspositionTable(100) as table:
+            self.assertEqual(64, table.get_size())
+            self.assertIsNone(table.probe(5))
+            table.store(5, 3, 10, TranspositionTable.EXACT, (3, 4))
+            self.assertEqual((5, 3, 10, TranspositionTable.EXACT, (3, 4)), table.probe(5))
+            self.assertIsNone(table.probe(5 + 64))
+            self.assertEqual({'size': 64, 'hits': 1, 'misses': 2, 'collisions': 1, 'stores': 1},
+                             table.get_statistics())
+            table.store(69, 1, 20, TranspositionTable.UPPER_BOUND, None)
+            self.assertEqual((69, 1, 20, TranspositionTable.UPPER_BOUND, None), table.probe(69))
+            self.assertEqual(10, table.probe(5)[2])
+            table.store(133, 6, 30, TranspositionTable.EXACT, None)
+            self.assertIsNone(table.probe(5))
+            table.clear()
+            self.assertIsNone(table.probe(133))
+
+    def test_case_2(self):
+        """Test that entries stored by another process are seen through the shared memory"""
+        with SharedTranspositionTable(1024) as table:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=1) as executor:
+                executor.submit(store_in_other_process, table.get_name(), table.get_size()).result()
+            self.assertEqual((12345, 4, -7.5, TranspositionTable.LOWER_BOUND, (8, 8)), table.probe(12345))
+
+    def test_case_3(self):
+        """Test that the parallel search finds the same score as the single process search at each depth"""
+        game = Othello()
+        for color, move in (('black', (3, 4)), ('white', (3, 5)), ('black', (3, 6)), ('white', (5, 3))):
+            game.make_move(color, move)
+        board = [row[:] for row in game.get_board()]
+        with ParallelSearcher(workers=2, max_depth=4) as searcher:
+            move = searcher.search(game, 'black')
+            statistics = searcher.get_statistics()
+        self.assertEqual(board, game.get_board())
+        self.assertIn(move, game.return_available_positions('black'))
+        self.assertEqual([1, 2, 3, 4], [depth for depth, _ in statistics['depth_times']])
+        single = AlphaBetaSearcher(time_limit=float('inf'), max_depth=4)
+        single.search(game, 'black')
+        self.assertEqual(single.get_statistics()['score'], statistics['score'])
+        self.assertGreater(statistics['nodes_per_second'], 0)
+
+    def test_case_4(self):
+        """Test that the benchmark reports every worker count, with speedups relative to the first"""
+        results = benchmark([1, 2], depth=2, positions=1)
+        self.assertEqual([1, 2], [result['workers'] for result in results])
+        self.assertEqual(1.0, results[0]['speedup'])
+        self.assertGreater(results[1]['nodes'], 0)
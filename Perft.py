@@ -0,0 +1,178 @@
+# Author: Jonathan Reuter
+# GitHub username: ReuterJo
+# Date: 10/18/2026
+# Description: Implements perft, which counts the positions reachable in an exact number of moves, for checking the
+# correctness and measuring the speed of move generation in the Othello class. A player without an available move
+# passes, which counts as a move, and a finished game counts as a single position however many moves remain.
+
+import argparse
+import random
+import time
+
+from Othello import Othello
+from Bitboard import parse_board, bitboards_to_board
+from FlatBoard import FlatEngine
+
+# known perft counts from the starting position, with black to move
+REFERENCE_COUNTS = {1: 4, 2: 12, 3: 56, 4: 244, 5: 1396, 6: 8200, 7: 55092, 8: 390216, 9: 3005288, 10: 24571284,
+                    11: 212258800}
+
+
+def opposite_color(color):
+    """Returns the color of the opponent of a player of the given color"""
+    if color == 'white':
+        return 'black'
+    return 'white'
+
+
+def perft(game, color, depth, passed=False):
+    """
+    Returns the number of positions reached after depth moves, starting with the player of the given color. Moves are
+    made with make_move and taken back with undo_move, so the game is left unchanged.
+    """
+    if depth == 0:
+        return 1
+    moves = game.return_available_positions(color)
+
+    # a player without a move passes, unless the opponent just passed as well, which ends the game
+    if len(moves) == 0:
+        if passed:
+            return 1
+        return perft(game, opposite_color(color), depth - 1, True)
+
+    # at the last move, the number of positions is just the number of moves
+    if depth == 1:
+        return len(moves)
+
+    nodes = 0
+    for move in moves:
+        game.make_move(color, move)
+        nodes += perft(game, opposite_color(color), depth - 1)
+        game.undo_move()
+    return nodes
+
+
+def divide(game, color, depth):
+    """Returns a dictionary from each available move to the perft count of the position it leads to"""
+    counts = {}
+    for move in sorted(game.return_available_positions(color)):
+        game.make_move(color, move)
+        counts[move] = perft(game, opposite_color(color), depth - 1)
+        game.undo_move()
+    return counts
+
+
+def verify(max_depth, backend='list'):
+    """
+    Checks perft from the starting position against the reference counts, up to max_depth. Returns a list of
+    (depth, expected, counted) for every depth with a wrong count.
+    """
+    errors = []
+    for depth in range(1, max_depth + 1):
+        counted = perft(Othello(backend), 'black', depth)
+        if counted != REFERENCE_COUNTS[depth]:
+            errors.append((depth, REFERENCE_COUNTS[depth], counted))
+    return errors
+
+
+def benchmark(game, color, depth):
+    """Runs perft and returns a tuple (nodes, elapsed seconds, nodes per second)"""
+    start = time.perf_counter()
+    nodes = perft(game, color, depth)
+    elapsed = time.perf_counter() - start
+    return nodes, elapsed, nodes / elapsed if elapsed > 0 else 0.0
+
+
+def random_game_moves(rng, size=8):
+    """Returns the moves of a random game as a list of (color, position), leaving out passes"""
+    game = Othello('flat', size)
+    moves = []
+    color = 'black'
+    passes = 0
+    while passes < 2:
+        available_positions = game.return_available_positions(color)
+        if available_positions:
+            position = rng.choice(sorted(available_positions))
+            game.make_move(color, position)
+            moves.append((color, position))
+            passes = 0
+        else:
+            passes += 1
+        color = opposite_color(color)
+    return moves
+
+
+def compare_walks(games, size=8, seed=0):
+    """
+    Replays random games through the recursive walks of the list backend, scan_available_positions and
+    flip_captured_pieces, and through the line moves table of a FlatEngine, generating every move of the player to
+    move before each move. Returns a dictionary with the moves per second of each and the resulting speedup, which
+    is about 4x on 8x8 boards and grows with the size of the board (see the README).
+    """
+    rng = random.Random(seed)
+    move_lists = [random_game_moves(rng, size) for _ in range(games)]
+    move_count = sum(len(moves) for moves in move_lists)
+
+    start = time.perf_counter()
+    for moves in move_lists:
+        game = Othello('list', size)
+        board = game.get_board()
+        for color, position in moves:
+            game.scan_available_positions(color)
+            game.flip_captured_pieces(color, position)
+            board[position[0]][position[1]] = 'O' if color == 'white' else 'X'
+    recursive_rate = move_count / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for moves in move_lists:
+        engine = FlatEngine(size)
+        for color, position in moves:
+            engine.return_available_positions(color)
+            engine.make_move(color, position)
+    flat_rate = move_count / (time.perf_counter() - start)
+
+    return {'recursive_moves_per_second': recursive_rate, 'flat_moves_per_second': flat_rate,
+            'speedup': flat_rate / recursive_rate}
+
+
+def main():
+    """Runs perft from the command line"""
+    parser = argparse.ArgumentParser(description='Count Othello positions reachable in an exact number of moves')
+    parser.add_argument('--depth', type=int, default=6, help='number of moves')
+    parser.add_argument('--backend', choices=('list', 'bitboard', 'flat'), default='list', help='Othello backend')
+    parser.add_argument('--size', type=int, default=8, help='number of rows and columns of the board')
+    parser.add_argument('--board', help='64 characters of X (black), O (white) and . (empty), row by row')
+    parser.add_argument('--color', choices=('black', 'white'), default='black', help='color of the player to move')
+    parser.add_argument('--divide', action='store_true', help='show the count below each available move')
+    parser.add_argument('--verify', action='store_true', help='check the starting position up to --depth')
+    parser.add_argument('--compare-walks', type=int, metavar='GAMES',
+                        help='compare the recursive walks with the flat engine over this many random games')
+    args = parser.parse_args()
+
+    if args.compare_walks:
+        results = compare_walks(args.compare_walks, args.size)
+        print('recursive walks:  %.0f moves/sec' % results['recursive_moves_per_second'])
+        print('flat engine:      %.0f moves/sec' % results['flat_moves_per_second'])
+        print('speedup:          %.1fx' % results['speedup'])
+        return
+
+    if args.verify:
+        errors = verify(args.depth, args.backend)
+        for depth, expected, counted in errors:
+            print('depth %d: expected %d, counted %d' % (depth, expected, counted))
+        print('perft verified to depth %d' % args.depth if not errors else 'perft FAILED')
+        return
+
+    game = Othello(args.backend, args.size)
+    if args.board:
+        game.load_board(bitboards_to_board(*parse_board(args.board)))
+    if args.divide:
+        for move, count in divide(game, args.color, args.depth).items():
+            print(move, count)
+
+    nodes, elapsed, nodes_per_second = benchmark(game, args.color, args.depth)
+    print('perft(%d) = %d  time: %.2fs  nodes/sec: %.0f' % (args.depth, nodes, elapsed, nodes_per_second))
+
+
+if __name__ == '__main__':
+    main()
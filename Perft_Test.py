@@ -0,0 +1,53 @@
+# Author: Jonathan Reuter
+# GitHub username: ReuterJo
+# Date: 10/18/2026
+# Description: Contains test cases for Perft.py
+
+import copy
+import unittest
+from Othello import Othello
+from Bitboard import parse_board, bitboards_to_board
+from Perft import perft, divide, verify, benchmark, compare_walks, REFERENCE_COUNTS
+
+
+class TestPerft(unittest.TestCase):
+    """Test cases for Perft.py"""
+
+    def test_case_1(self):
+        """Test perft from the starting position against the reference counts, with every backend"""
+        self.assertEqual([], verify(5, 'list'))
+        self.assertEqual([], verify(6, 'bitboard'))
+        self.assertEqual([], verify(5, 'flat'))
+
+    def test_case_2(self):
+        """Test that perft leaves the game unchanged, and divide adds up to perft"""
+        game = Othello()
+        board = copy.deepcopy(game.get_board())
+        counts = divide(game, 'black', 4)
+        self.assertEqual(4, len(counts))
+        self.assertEqual(REFERENCE_COUNTS[4], sum(counts.values()))
+        self.assertEqual(board, game.get_board())
+        self.assertEqual([], game.get_move_history())
+
+    def test_case_3(self):
+        """Test perft through a pass and the end of the game"""
+        # white has no move, so black moves after a pass and then the game is over
+        game = Othello()
+        game.load_board(bitboards_to_board(*parse_board('XO' + '.' * 62)))
+        self.assertEqual([], game.return_available_positions('white'))
+        self.assertEqual(1, perft(game, 'white', 1))
+        self.assertEqual(1, perft(game, 'white', 2))
+        self.assertEqual(1, perft(game, 'white', 5))
+
+    def test_case_4(self):
+        """Test benchmark, which reports nodes per second"""
+        nodes, elapsed, nodes_per_second = benchmark(Othello('bitboard'), 'black', 4)
+        self.assertEqual(REFERENCE_COUNTS[4], nodes)
+        self.assertGreater(nodes_per_second, 0)
+
+    def test_case_5(self):
+        """Test compare_walks, which reports the moves per second of the recursive walks and the flat engine"""
+        results = compare_walks(2, 6)
+        self.assertGreater(results['recursive_moves_per_second'], 0)
+        self.assertGreater(results['flat_moves_per_second'], 0)
+        self.assertEqual(results['flat_moves_per_second'] / results['recursive_moves_per_second'], results['speedup'])
@@ -0,0 +1,109 @@
+# Author: Jonathan Reuter
+# GitHub username: ReuterJo
+# Date: 10/18/2026
+# Description: Implements an immutable 8x8 Othello position, made of the black and white bitboards and the color to
+# move. A Position is a plain tuple with no instance dictionary, so it can be hashed, compared, stored in sets and
+# sorted, and playing a move creates a new small tuple instead of copying a whole game.
+
+from Bitboard import (START_BLACK, START_WHITE, FULL_MASK, bitboard_to_positions, bitboards_to_board, count_bits,
+                      compute_flips, generate_moves, position_to_square)
+
+# the color moving after each color
+NEXT_COLOR = {'black': 'white', 'white': 'black'}
+
+
+class Position(tuple):
+    """
+    Represents an 8x8 Othello position as an immutable tuple (black, white, side), where black and white are the
+    bitboards of each color's pieces and side is the color to move. Positions are ordered and hashed as tuples. Can be
+    played through an Othello game with Othello.from_position, and read from one with Othello.get_position.
+    """
+    __slots__ = ()
+
+    def __new__(cls, black=START_BLACK, white=START_WHITE, side='black'):
+        """Creates a position, by default the starting position with black to move"""
+        if side not in NEXT_COLOR:
+            raise ValueError('Invalid color: ' + str(side))
+        if black & white or (black | white) & ~FULL_MASK:
+            raise ValueError('Invalid bitboards')
+        return tuple.__new__(cls, (black, white, side))
+
+    def __repr__(self):
+        """Returns the position as a Position call with hexadecimal bitboards"""
+        return 'Position(0x%016x, 0x%016x, %r)' % self
+
+    def get_black(self):
+        """Returns the bitboard of the black pieces"""
+        return self[0]
+
+    def get_white(self):
+        """Returns the bitboard of the white pieces"""
+        return self[1]
+
+    def get_side(self):
+        """Returns the color to move"""
+        return self[2]
+
+    def get_bitboards(self):
+        """Returns the (own, opponent) bitboards of the color to move"""
+        black, white, side = self
+        if side == 'white':
+            return white, black
+        return black, white
+
+    def get_board(self):
+        """Returns the position as a 10x10 2D board list, including the edge, as used by the Othello class"""
+        return bitboards_to_board(self[0], self[1])
+
+    def legal_moves(self):
+        """Returns the list of (row, column) positions the color to move may play, in increasing square order"""
+        return bitboard_to_positions(generate_moves(*self.get_bitboards()))
+
+    def play(self, move):
+        """
+        Returns the position after the color to move plays a (row, column) position, or passes if the move is None.
+        Raises ValueError if the move is not on the board, captures nothing, or if the color passes while it has a move.
+        """
+        black, white, side = self
+        own, opponent = (white, black) if side == 'white' else (black, white)
+        if move is None:
+            if generate_moves(own, opponent):
+                raise ValueError('Cannot pass while a move is available')
+            return tuple.__new__(Position, (black, white, NEXT_COLOR[side]))
+
+        # a move must be a pair of integer coordinates on the board
+        if (not isinstance(move, (tuple, list)) or len(move) != 2
+                or not all(isinstance(coordinate, int) and not isinstance(coordinate, bool) for coordinate in move)
+                or not (1 <= move[0] <= 8 and 1 <= move[1] <= 8)):
+            raise ValueError('Invalid move: ' + str(move))
+        square = position_to_square(move)
+        flips = compute_flips(own, opponent, square) if not (black | white) >> square & 1 else 0
+        if not flips:
+            raise ValueError('Invalid move: ' + str(move))
+        own |= flips | 1 << square
+        opponent ^= flips
+        if side == 'white':
+            return tuple.__new__(Position, (opponent, own, 'black'))
+        return tuple.__new__(Position, (own, opponent, 'white'))
+
+    def children(self):
+        """
+        Returns the list of (move, position) pairs for each legal move, or a single (None, position) pair for a pass
+        if the color to move has no move. The list is empty if the game is over.
+        """
+        moves = self.legal_moves()
+        if moves:
+            return [(move, self.play(move)) for move in moves]
+        passed = self.play(None)
+        if passed.legal_moves():
+            return [(None, passed)]
+        return []
+
+    def is_game_over(self):
+        """Returns True if neither color has a move"""
+        own, opponent = self.get_bitboards()
+        return not generate_moves(own, opponent) and not generate_moves(opponent, own)
+
+    def score(self):
+        """Returns the score as a tuple (white_score, black_score), as Othello.tabulate_score does"""
+        return count_bits(self[1]), count_bits(self[0])
@@ -0,0 +1,255 @@
+# Author: Jonathan Reuter
+# GitHub username: ReuterJo
+# Date: 10/18/2026
+# Description: Implements a cache of the legal moves and evaluations of Othello positions, kept in a least recently
+# used cache of limited size. Legal moves are shared between positions that are rotations or reflections of each
+# other: each position is reduced to its canonical form among its 8 symmetric forms using bitboards, and cached moves
+# are transformed back to the orientation of the position they are requested for. Evaluations are cached for the exact
+# position only, since an evaluation function need not score symmetric positions alike.
+
+import argparse
+import collections
+import random
+import time
+
+from Bitboard import (INVERSE_SYMMETRIES, SYMMETRY_COUNT, canonical_symmetries, position_to_square, square_to_position,
+                      transform_square)
+from Evaluation import PatternEvaluator
+from Othello import Othello
+from Search import evaluate_position
+
+# default number of entries kept before the least recently used are evicted
+DEFAULT_MAX_ENTRIES = 100000
+
+# kinds of results cached, which form the first element of each key
+MOVES = 0
+EVALUATION = 1
+
+# the square, and the (row, column) position, that each square is moved to by each symmetry
+SYMMETRY_SQUARES = tuple(tuple(transform_square(square, symmetry) for square in range(64))
+                         for symmetry in range(SYMMETRY_COUNT))
+SYMMETRY_POSITIONS = tuple(tuple(square_to_position(square) for square in squares) for squares in SYMMETRY_SQUARES)
+
+
+def game_bitboards(game, color):
+    """Returns the (own, opponent) bitboards of the player of the given color in an 8x8 game"""
+    black, white = game.get_bitboards()
+    if color == 'white':
+        return white, black
+    return black, white
+
+
+class PositionCache:
+    """
+    Represents a least recently used cache of the legal moves and evaluations of positions. Legal moves are stored
+    under the canonical form of a position, so that the moves computed for one position answer every rotation and
+    reflection of it. Evaluations are stored under the exact position, so that any evaluation function can be cached,
+    including a trained PatternEvaluator, which does not give the same score to symmetric positions.
+    """
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, evaluate=evaluate_position):
+        """Creates an empty cache holding at most max_entries results, using the given evaluation function"""
+        if max_entries < 1:
+            raise ValueError('A cache must hold at least one entry')
+        self._max_entries = max_entries
+        self._evaluate = evaluate
+        self._entries = collections.OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+        # the bitboards last canonicalized and their canonical form, since the moves of a position are often asked
+        # for more than once in a row
+        self._last_bitboards = None
+        self._last_canonical = None
+
+    def __len__(self):
+        """Returns the number of results in the cache"""
+        return len(self._entries)
+
+    def get_max_entries(self):
+        """Returns the number of results kept before the least recently used are evicted"""
+        return self._max_entries
+
+    def get_statistics(self):
+        """Returns a dictionary of the cache's entries, maximum entries, hits, misses, evictions and hit rate"""
+        lookups = self._hits + self._misses
+        return {'entries': len(self._entries),
+                'max_entries': self._max_entries,
+                'hits': self._hits,
+                'misses': self._misses,
+                'evictions': self._evictions,
+                'hit_rate': self._hits / lookups if lookups else 0.0}
+
+    def clear(self):
+        """Removes every result and resets the counters"""
+        self._entries.clear()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def lookup(self, key):
+        """Returns the result stored under a key, marking it as the most recently used, or None if there is none"""
+        value = self._entries.get(key)
+        if value is None:
+            self._misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return value
+
+    def store(self, key, value):
+        """Stores a result under a key, evicting the least recently used result if the cache is full"""
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def canonicalize(self, own, opponent):
+        """Returns the canonical form of a position as canonical_symmetries does, reusing the last one if it matches"""
+        bitboards = (own, opponent)
+        if bitboards != self._last_bitboards:
+            self._last_bitboards = bitboards
+            self._last_canonical = canonical_symmetries(own, opponent)
+        return self._last_canonical
+
+    def lookup_moves(self, own, opponent):
+        """
+        Returns the legal moves of the player owning the own bitboard as a bitboard, or None if they are not cached.
+        The moves are transformed back from the canonical form to the orientation of the given position.
+        """
+        canonical_own, canonical_opponent, symmetries = self.canonicalize(own, opponent)
+        squares = self.lookup((MOVES, canonical_own, canonical_opponent))
+        if squares is None:
+            return None
+        to_position = SYMMETRY_SQUARES[INVERSE_SYMMETRIES[symmetries[0]]]
+        moves = 0
+        for square in squares:
+            moves |= 1 << to_position[square]
+        return moves
+
+    def return_available_positions(self, game, color):
+        """
+        Returns the available move positions for the player of the given color in an 8x8 game, sorted in square
+        order, calling Othello.return_available_positions only if the moves of the position or of a symmetric
+        position are not cached
+        """
+        own, opponent = game_bitboards(game, color)
+        canonical_own, canonical_opponent, symmetries = self.canonicalize(own, opponent)
+        key = (MOVES, canonical_own, canonical_opponent)
+        squares = self.lookup(key)
+        if squares is not None:
+            to_position = SYMMETRY_POSITIONS[INVERSE_SYMMETRIES[symmetries[0]]]
+            return sorted([to_position[square] for square in squares])
+
+        # store the moves as squares in the canonical orientation
+        positions = sorted(game.return_available_positions(color))
+        to_canonical = SYMMETRY_SQUARES[symmetries[0]]
+        self.store(key, tuple(to_canonical[position_to_square(position)] for position in positions))
+        return positions
+
+    def evaluate(self, game, color):
+        """
+        Returns the evaluation of an 8x8 game from the point of view of the player of the given color, calling the
+        evaluation function only if the same position has not been evaluated before
+        """
+        own, opponent = game_bitboards(game, color)
+        key = (EVALUATION, own, opponent)
+        value = self.lookup(key)
+        if value is None:
+            value = self._evaluate(game, color)
+            self.store(key, value)
+        return value
+
+
+def random_games(games, seed=0):
+    """Returns the moves of random games, each as a list of (color, position), with a position of None for a pass"""
+    rng = random.Random(seed)
+    move_lists = []
+    for _ in range(games):
+        game = Othello('bitboard')
+        moves = []
+        color = 'black'
+        while not game.is_game_over():
+            available_positions = sorted(game.return_available_positions(color))
+            move = rng.choice(available_positions) if available_positions else None
+            moves.append((color, move))
+            if move is not None:
+                game.make_move(color, move)
+            color = 'white' if color == 'black' else 'black'
+        move_lists.append(moves)
+    return move_lists
+
+
+def time_queries(move_lists, backend, query):
+    """
+    Replays games with the given backend, calling query(game, color) before each move. Returns the seconds spent in
+    the queries.
+    """
+    perf_counter = time.perf_counter
+    elapsed = 0.0
+    for moves in move_lists:
+        game = Othello(backend)
+        for color, move in moves:
+            start = perf_counter()
+            query(game, color)
+            elapsed += perf_counter() - start
+            if move is not None:
+                game.make_move(color, move)
+    return elapsed
+
+
+def benchmark(games, max_entries=DEFAULT_MAX_ENTRIES, seed=0, backend='bitboard', evaluate=None):
+    """
+    Replays random games, asking for the moves and evaluation of every position directly, through an empty
+    PositionCache, and again through the filled cache, where every result that was not evicted is a hit. Returns a
+    dictionary with the microseconds per position of each pass, and the cache statistics after the first cached pass.
+    The evaluation function defaults to a PatternEvaluator.
+    """
+    if evaluate is None:
+        evaluate = PatternEvaluator()
+    move_lists = random_games(games, seed)
+    positions = sum(len(moves) for moves in move_lists)
+    cache = PositionCache(max_entries, evaluate)
+
+    def direct_query(game, color):
+        game.return_available_positions(color)
+        evaluate(game, color)
+
+    def cached_query(game, color):
+        cache.return_available_positions(game, color)
+        cache.evaluate(game, color)
+
+    direct_time = time_queries(move_lists, backend, direct_query)
+    cold_time = time_queries(move_lists, backend, cached_query)
+    statistics = cache.get_statistics()
+    warm_time = time_queries(move_lists, backend, cached_query)
+    return {'positions': positions,
+            'direct_microseconds': direct_time / positions * 1e6,
+            'cold_microseconds': cold_time / positions * 1e6,
+            'warm_microseconds': warm_time / positions * 1e6,
+            'statistics': statistics}
+
+
+def main():
+    """Runs the cache benchmark from the command line"""
+    parser = argparse.ArgumentParser(description='Measure the symmetry-aware position cache over random games')
+    parser.add_argument('--games', type=int, default=200, help='number of random games')
+    parser.add_argument('--max-entries', type=int, default=DEFAULT_MAX_ENTRIES, help='size of the cache')
+    parser.add_argument('--backend', choices=('list', 'bitboard', 'flat'), default='bitboard',
+                        help='backend of the games replayed')
+    parser.add_argument('--seed', type=int, default=0, help='random seed')
+    args = parser.parse_args()
+
+    results = benchmark(args.games, args.max_entries, args.seed, args.backend)
+    statistics = results['statistics']
+    print('%d positions' % results['positions'])
+    print('direct:        %.1f us/position' % results['direct_microseconds'])
+    print('cached, cold:  %.1f us/position' % results['cold_microseconds'])
+    print('cached, warm:  %.1f us/position' % results['warm_microseconds'])
+    print('cold hit rate: %.1f%%  entries: %d  evictions: %d' % (statistics['hit_rate'] * 100, statistics['entries'],
+                                                            statistics['evictions']))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+# Author: Jonathan Reuter
+# GitHub username: ReuterJo
+# Date: 10/18/2026
+# Description: Contains test cases for PositionCache.py
+
+import random
+import unittest
+from Othello import Othello
+from Bitboard import SYMMETRY_COUNT, board_to_bitboards, bitboards_to_board, generate_moves, transform_bitboard
+from Search import evaluate_position
+from Records import random_record
+from Evaluation import collect_positions, train
+from PositionCache import PositionCache, benchmark
+
+
+def transformed_game(game, symmetry, backend='list'):
+    """Returns a new game holding the board of a game transformed by one of the 8 symmetries"""
+    black, white = board_to_bitboards(game.get_board())
+    transformed = Othello(backend)
+    transformed.load_board(bitboards_to_board(transform_bitboard(black, symmetry), transform_bitboard(white, symmetry)))
+    return transformed
+
+
+class TestPositionCache(unittest.TestCase):
+    """Test cases for PositionCache.py"""
+
+    def test_case_1(self):
+        """Test that cached moves and evaluations of every symmetric form match the uncached Othello methods"""
+        rng = random.Random(3)
+        cache = PositionCache()
+        for _ in range(3):
+            game = Othello()
+            color = 'black'
+            while not game.is_game_over():
+                for symmetry in range(SYMMETRY_COUNT):
+                    # the bitboards are read from the engine with the bitboard backend, and from the board otherwise
+                    transformed = transformed_game(game, symmetry, ('list', 'bitboard')[symmetry % 2])
+                    for player in ('black', 'white'):
+                        # hits and misses both return the moves in square order
+                        self.assertEqual(sorted(transformed.return_available_positions(player)),
+                                         cache.return_available_positions(transformed, player))
+                        # evaluations are cached for the exact position, so only the second call is a hit
+                        for _ in range(2):
+                            self.assertEqual(evaluate_position(transformed, player),
+                                             cache.evaluate(transformed, player))
+                moves = game.return_available_positions(color)
+                if moves:
+                    game.make_move(color, rng.choice(sorted(moves)))
+                color = 'white' if color == 'black' else 'black'
+        statistics = cache.get_statistics()
+        self.assertGreater(statistics['hits'], statistics['misses'])
+        self.assertEqual(statistics['hits'] / (statistics['hits'] + statistics['misses']), statistics['hit_rate'])
+
+    def test_case_2(self):
+        """Test that the moves of a position answer every rotation and reflection of it, mapped back to its squares"""
+        game = Othello()
+        game.make_move('black', (3, 4))
+        game.make_move('white', (3, 3))
+        cache = PositionCache()
+        cache.return_available_positions(game, 'black')
+        self.assertEqual({'entries': 1, 'max_entries': cache.get_max_entries(), 'hits': 0, 'misses': 1,
+                          'evictions': 0, 'hit_rate': 0.0}, cache.get_statistics())
+        for symmetry in range(1, SYMMETRY_COUNT):
+            transformed = transformed_game(game, symmetry)
+            self.assertEqual(sorted(transformed.return_available_positions('black')),
+                             cache.return_available_positions(transformed, 'black'))
+            black, white = board_to_bitboards(transformed.get_board())
+            self.assertEqual(generate_moves(black, white), cache.lookup_moves(black, white))
+        self.assertEqual(1, len(cache))
+        self.assertEqual(SYMMETRY_COUNT - 1 + SYMMETRY_COUNT - 1, cache.get_statistics()['hits'])
+        self.assertIsNone(cache.lookup_moves(*board_to_bitboards(Othello().get_board())))
+
+    def test_case_3(self):
+        """Test that the least recently used results are evicted once the cache is full"""
+        cache = PositionCache(2)
+        cache.store('a', 1)
+        cache.store('b', 2)
+        self.assertEqual(1, cache.lookup('a'))
+        cache.store('c', 3)
+        self.assertIsNone(cache.lookup('b'))
+        self.assertEqual(1, cache.lookup('a'))
+        self.assertEqual(3, cache.lookup('c'))
+        statistics = cache.get_statistics()
+        self.assertEqual(2, statistics['entries'])
+        self.assertEqual(1, statistics['evictions'])
+        self.assertEqual(3, statistics['hits'])
+        self.assertEqual(1, statistics['misses'])
+        cache.clear()
+        self.assertEqual(0, len(cache))
+        self.assertEqual(0, cache.get_statistics()['evictions'])
+
+    def test_case_4(self):
+        """Test invalid cache sizes and board sizes, and the benchmark"""
+        self.assertRaises(ValueError, PositionCache, 0)
+        self.assertRaises(ValueError, PositionCache().return_available_positions, Othello(size=6), 'black')
+        results = benchmark(2, 50)
+        self.assertGreater(results['positions'], 0)
+        self.assertGreater(results['warm_microseconds'], 0)
+        self.assertEqual(50, results['statistics']['entries'])
+        self.assertGreater(results['statistics']['evictions'], 0)
+
+    def test_case_5(self):
+        """Test that cached evaluations of every symmetric form match a trained PatternEvaluator"""
+        rng = random.Random(5)
+        evaluator = train(*collect_positions([random_record(rng) for _ in range(20)]), iterations=20)
+        cache = PositionCache(evaluate=evaluator)
+        game = Othello()
+        for move in ((3, 4), (3, 3), (2, 3), (3, 5)):
+            game.make_move('black' if len(game.get_move_history()) % 2 == 0 else 'white', move)
+        scores = set()
+        for symmetry in range(SYMMETRY_COUNT):
+            transformed = transformed_game(game, symmetry)
+            score = evaluator(transformed, 'black')
+            scores.add(score)
+            # the first call is a miss and the second a hit, and both match the evaluator
+            self.assertEqual(score, cache.evaluate(transformed, 'black'))
+            self.assertEqual(score, cache.evaluate(transformed, 'black'))
+        self.assertGreater(len(scores), 1)
+        self.assertEqual(SYMMETRY_COUNT, cache.get_statistics()['hits'])
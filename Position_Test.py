@@ -0,0 +1,86 @@
+# Author: Jonathan Reuter
+# GitHub username: ReuterJo
+# Date: 10/18/2026
+# Description: Contains test cases for Position.py
+
+import random
+import sys
+import unittest
+from Othello import Othello
+from Bitboard import START_BLACK, START_WHITE
+from Position import Position
+
+
+class TestPosition(unittest.TestCase):
+    """Test cases for Position.py"""
+
+    def test_case_1(self):
+        """Test the starting position, and that positions are immutable, hashable and ordered"""
+        position = Position()
+        self.assertEqual((START_BLACK, START_WHITE, 'black'), position)
+        self.assertEqual([(3, 4), (4, 3), (5, 6), (6, 5)], position.legal_moves())
+        self.assertEqual((2, 2), position.score())
+        self.assertRaises(AttributeError, setattr, position, 'side', 'white')
+        self.assertFalse(hasattr(position, '__dict__'))
+        self.assertEqual(sys.getsizeof((0, 0, 'black')), sys.getsizeof(position))
+
+        children = [child for _, child in position.children()]
+        self.assertEqual(4, len(set(children + [position.play((3, 4))])))
+        self.assertEqual(sorted(children, key=tuple), sorted(children))
+        self.assertEqual(position, eval(repr(position)))
+
+    def test_case_2(self):
+        """Test that playing random games through positions matches the Othello class"""
+        rng = random.Random(5)
+        for _ in range(10):
+            game = Othello()
+            position = Position()
+            while not game.is_game_over():
+                color = position.get_side()
+                self.assertEqual(game.get_position(color), position)
+                self.assertEqual(sorted(game.return_available_positions(color)), position.legal_moves())
+                self.assertEqual(game.tabulate_score(), position.score())
+                self.assertFalse(position.is_game_over())
+                moves = position.legal_moves()
+                if moves:
+                    move = rng.choice(moves)
+                    game.make_move(color, move)
+                else:
+                    move = None
+                position = position.play(move)
+            self.assertTrue(position.is_game_over())
+            self.assertEqual([], position.children())
+            self.assertEqual(game.tabulate_score(), position.score())
+
+    def test_case_3(self):
+        """Test invalid positions and moves"""
+        self.assertRaises(ValueError, Position, 1, 1, 'black')
+        self.assertRaises(ValueError, Position, 1 << 64, 0, 'black')
+        self.assertRaises(ValueError, Position, START_BLACK, START_WHITE, 'red')
+        position = Position()
+        self.assertRaises(ValueError, position.play, (1, 1))
+        self.assertRaises(ValueError, position.play, (4, 4))
+        self.assertRaises(ValueError, position.play, None)
+
+        # white has no move, so it must pass
+        position = Position(1, 2, 'white')
+        self.assertEqual([], position.legal_moves())
+        self.assertEqual([(None, Position(1, 2, 'black'))], position.children())
+
+    def test_case_4(self):
+        """Test that Othello wraps a position with every backend"""
+        position = Position().play((3, 4)).play((3, 3))
+        for backend in ('list', 'bitboard', 'flat'):
+            game = Othello.from_position(position, backend)
+            self.assertEqual(backend, game.get_backend())
+            self.assertEqual(position, game.get_position('black'))
+            self.assertEqual(position.legal_moves(), sorted(game.return_available_positions('black')))
+        self.assertRaises(ValueError, Othello(size=6).get_position, 'black')
+
+    def test_case_5(self):
+        """Test that moves off the board or with coordinates that are not integers are rejected"""
+        position = Position()
+        for move in ((0, 4), (9, 4), (3, 0), (3, 9), (-1, 4), (3.0, 4), ('3', 4), (True, 4), (3,), (3, 4, 5), 34):
+            with self.assertRaisesRegex(ValueError, 'Invalid move'):
+                position.play(move)
+        self.assertEqual(position.play((3, 4)), position.play([3, 4]))
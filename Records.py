@@ -0,0 +1,349 @@
+# Author: Jonathan Reuter
+# GitHub username: ReuterJo
+# Date: 10/18/2026
+# Description: Implements a compact binary format for archiving Othello games. An archive starts with a short file
+# header, followed by one record per game. Each record holds the players, the final score, and the moves, stored as
+# one byte per move, so that archives of millions of games can be written and read as a stream or memory-mapped.
+
+import argparse
+import mmap
+import random
+import struct
+import time
+
+from Othello import Othello
+from Bitboard import (START_BLACK, START_WHITE, position_to_square, square_to_position, generate_moves, compute_flips,
+                      bitboard_to_squares, count_bits)
+
+# file header identifying an archive, followed by the format version
+MAGIC = b'OTHR'
+VERSION = 1
+FILE_HEADER = MAGIC + bytes([VERSION])
+
+# byte stored for a pass
+PASS_MOVE = 64
+
+# byte stored for each player color
+COLOR_CODES = {'black': 0, 'white': 1}
+COLOR_NAMES = {0: 'black', 1: 'white'}
+
+# every record starts with its length in bytes, not counting the length itself
+RECORD_LENGTH = struct.Struct('<H')
+
+
+def opposite_color(color):
+    """Returns the color of the opponent of a player of the given color"""
+    if color == 'white':
+        return 'black'
+    return 'white'
+
+
+class GameRecord:
+    """
+    Represents a recorded game: its players as (name, color) pairs, its moves in order, with None for a pass, and its
+    final score. Black moves first, and the players alternate, with a pass recorded whenever a player could not move.
+    """
+    def __init__(self, players, moves, white_score, black_score):
+        """Creates a new game record"""
+        self._players = list(players)
+        self._moves = list(moves)
+        self._white_score = white_score
+        self._black_score = black_score
+
+    def __eq__(self, other):
+        """Returns True if both records hold the same game"""
+        return (isinstance(other, GameRecord) and self._players == other._players and self._moves == other._moves
+                and self.get_score() == other.get_score())
+
+    def get_players(self):
+        """Returns the players as a list of (name, color) pairs"""
+        return self._players
+
+    def get_moves(self):
+        """Returns the moves as a list of positions, with None for a pass"""
+        return self._moves
+
+    def get_score(self):
+        """Returns the final score as a tuple (white_score, black_score)"""
+        return self._white_score, self._black_score
+
+    def encode(self):
+        """Returns the record as bytes, starting with its length"""
+        body = bytearray([len(self._players)])
+        for name, color in self._players:
+            # a long name is cut to 255 bytes without splitting a character
+            encoded_name = name.encode('utf-8')[:255].decode('utf-8', 'ignore').encode('utf-8')
+            body.append(COLOR_CODES[color])
+            body.append(len(encoded_name))
+            body.extend(encoded_name)
+        body.append(self._white_score)
+        body.append(self._black_score)
+        body.append(len(self._moves))
+        for move in self._moves:
+            body.append(PASS_MOVE if move is None else position_to_square(move))
+        return RECORD_LENGTH.pack(len(body)) + bytes(body)
+
+    @classmethod
+    def decode(cls, buffer, offset=0):
+        """
+        Decodes the record starting at the offset of a bytes-like buffer. Returns a tuple (record, offset of the next
+        record).
+        """
+        if offset + RECORD_LENGTH.size > len(buffer):
+            raise ValueError('Truncated game record')
+        (length,) = RECORD_LENGTH.unpack_from(buffer, offset)
+        position = offset + RECORD_LENGTH.size
+        end = position + length
+        if end > len(buffer):
+            raise ValueError('Truncated game record')
+
+        players = []
+        player_count = buffer[position]
+        position += 1
+        for _ in range(player_count):
+            color = COLOR_NAMES[buffer[position]]
+            name_length = buffer[position + 1]
+            name = bytes(buffer[position + 2:position + 2 + name_length]).decode('utf-8')
+            players.append((name, color))
+            position += 2 + name_length
+
+        white_score = buffer[position]
+        black_score = buffer[position + 1]
+        move_count = buffer[position + 2]
+        position += 3
+        moves = [None if square == PASS_MOVE else square_to_position(square)
+                 for square in buffer[position:position + move_count]]
+        return cls(players, moves, white_score, black_score), end
+
+
+def record_from_game(game):
+    """
+    Creates a record of an Othello game from its move history. A pass is added wherever the same color moved twice
+    in a row, or white moved first, so that the recorded moves alternate starting with black. Raises ValueError for
+    games on boards other than 8x8, since records store each move as an 8x8 square number.
+    """
+    if game.get_size() != 8:
+        raise ValueError('Game records only support 8x8 boards')
+    moves = []
+    expected_color = 'black'
+    for color, position, _, _ in game.get_move_history():
+        if color != expected_color:
+            moves.append(None)
+        moves.append(position)
+        expected_color = opposite_color(color)
+
+    players = [(player.get_player_name(), player.get_player_color()) for player in game.get_player_list()]
+    white_score, black_score = game.tabulate_score()
+    return GameRecord(players, moves, white_score, black_score)
+
+
+def create_game(record, backend='list'):
+    """Returns a new Othello game at the starting position, with the players of the record"""
+    game = Othello(backend)
+    for name, color in record.get_players():
+        game.create_player(name, color)
+    return game
+
+
+def iterate_positions(record, backend='list'):
+    """
+    Replays a record through make_move, yielding (game, color, move) before each move is made, where move is None
+    for a pass. The same game object is yielded each time, so it must be copied if a position is to be kept.
+    """
+    game = create_game(record, backend)
+    color = 'black'
+    for move in record.get_moves():
+        yield game, color, move
+        if move is None:
+            game.pass_move(color)
+        else:
+            game.make_move(color, move)
+        color = opposite_color(color)
+
+
+def replay(record, backend='list'):
+    """Rebuilds the final position of a recorded game through make_move. Returns the Othello game."""
+    game = create_game(record, backend)
+    color = 'black'
+    for move in record.get_moves():
+        if move is None:
+            game.pass_move(color)
+        else:
+            game.make_move(color, move)
+        color = opposite_color(color)
+    return game
+
+
+def iterate_bitboards(record):
+    """
+    Replays a record on bitboards, which is much faster than through make_move. Yields (own, opponent, color, square)
+    before each move, where own and opponent are the bitboards of the player to move and the opponent, and square is
+    the square number of the move, or None for a pass.
+    """
+    own, opponent = START_BLACK, START_WHITE
+    color = 'black'
+    for move in record.get_moves():
+        if move is None:
+            yield own, opponent, color, None
+        else:
+            square = position_to_square(move)
+            yield own, opponent, color, square
+            flips = compute_flips(own, opponent, square)
+            own, opponent = own | flips | (1 << square), opponent ^ flips
+        own, opponent = opponent, own
+        color = opposite_color(color)
+
+
+class RecordWriter:
+    """Writes game records to an archive file one at a time. Can be used as a context manager."""
+    def __init__(self, path, append=False):
+        """Opens the archive for writing, or for appending to an existing archive"""
+        self._file = open(path, 'ab' if append else 'wb')
+        if self._file.tell() == 0:
+            self._file.write(FILE_HEADER)
+        self._count = 0
+
+    def __enter__(self):
+        """Returns the writer"""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Closes the archive"""
+        self.close()
+
+    def get_count(self):
+        """Returns the number of records written"""
+        return self._count
+
+    def write(self, record):
+        """Writes a record to the archive"""
+        self._file.write(record.encode())
+        self._count += 1
+
+    def close(self):
+        """Closes the archive"""
+        self._file.close()
+
+
+def check_header(header):
+    """Raises ValueError if the bytes do not start with the header of a supported archive"""
+    if bytes(header[:len(MAGIC)]) != MAGIC:
+        raise ValueError('Not a game record archive')
+    if len(header) < len(FILE_HEADER) or header[len(MAGIC)] != VERSION:
+        raise ValueError('Unsupported game record archive version')
+
+
+def read_records(path):
+    """Reads the records of an archive as a stream, yielding one GameRecord at a time"""
+    with open(path, 'rb') as archive:
+        check_header(archive.read(len(FILE_HEADER)))
+        while True:
+            length_bytes = archive.read(RECORD_LENGTH.size)
+            if len(length_bytes) == 0:
+                return
+            if len(length_bytes) < RECORD_LENGTH.size:
+                raise ValueError('Truncated game record')
+            (length,) = RECORD_LENGTH.unpack(length_bytes)
+            record, _ = GameRecord.decode(length_bytes + archive.read(length))
+            yield record
+
+
+class MappedRecordReader:
+    """
+    Reads the records of an archive through a memory map, so that archives larger than memory can be iterated
+    without being loaded. Can be used as a context manager.
+    """
+    def __init__(self, path):
+        """Opens and memory-maps the archive"""
+        self._file = open(path, 'rb')
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            check_header(self._map[:len(FILE_HEADER)])
+        except ValueError:
+            self.close()
+            raise
+
+    def __enter__(self):
+        """Returns the reader"""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Closes the archive"""
+        self.close()
+
+    def __iter__(self):
+        """Yields every record of the archive in order"""
+        for record, _ in self.iterate_with_offsets():
+            yield record
+
+    def iterate_with_offsets(self, offset=None):
+        """Yields (record, offset) for every record from the given byte offset, by default the first record"""
+        if offset is None:
+            offset = len(FILE_HEADER)
+        end = len(self._map)
+        while offset < end:
+            record, next_offset = GameRecord.decode(self._map, offset)
+            yield record, offset
+            offset = next_offset
+
+    def close(self):
+        """Closes the memory map and the archive"""
+        self._map.close()
+        self._file.close()
+
+
+def random_record(rng):
+    """Returns the record of a game of uniformly random moves, played on bitboards for speed"""
+    own, opponent = START_BLACK, START_WHITE
+    moves = []
+    passes = 0
+    while passes < 2:
+        squares = bitboard_to_squares(generate_moves(own, opponent))
+        if squares:
+            square = rng.choice(squares)
+            flips = compute_flips(own, opponent, square)
+            own, opponent = own | flips | (1 << square), opponent ^ flips
+            moves.append(square_to_position(square))
+            passes = 0
+        else:
+            moves.append(None)
+            passes += 1
+        own, opponent = opponent, own
+
+    # the game ends with two passes, which are not part of the record
+    del moves[-2:]
+    if len(moves) % 2 == 0:
+        black, white = own, opponent
+    else:
+        black, white = opponent, own
+    return GameRecord([('white', 'white'), ('black', 'black')], moves, count_bits(white), count_bits(black))
+
+
+def main():
+    """Writes an archive of random games from the command line, then reads it back, reporting the speed of each"""
+    parser = argparse.ArgumentParser(description='Write and read back an archive of random Othello games')
+    parser.add_argument('path', help='archive file to write')
+    parser.add_argument('--games', type=int, default=100000, help='number of random games to write')
+    parser.add_argument('--seed', type=int, default=0, help='random seed')
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    records = [random_record(rng) for _ in range(args.games)]
+
+    start = time.perf_counter()
+    with RecordWriter(args.path) as writer:
+        for record in records:
+            writer.write(record)
+    write_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with MappedRecordReader(args.path) as reader:
+        count = sum(1 for _ in reader)
+    read_elapsed = time.perf_counter() - start
+
+    print('wrote %d games in %.2fs (%.0f games/sec)' % (args.games, write_elapsed, args.games / write_elapsed))
+    print('read %d games in %.2fs (%.0f games/sec)' % (count, read_elapsed, count / read_elapsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+# Author: Jonathan Reuter
+# GitHub username: ReuterJo
+# Date: 10/18/2026
+# Description: Contains test cases for Records.py
+
+import os
+import random
+import tempfile
+import unittest
+from Othello import Othello
+from Records import (GameRecord, RecordWriter, MappedRecordReader, read_records, record_from_game, replay,
+                     iterate_positions, random_record, FILE_HEADER)
+
+
+class TestRecords(unittest.TestCase):
+    """Test cases for Records.py"""
+
+    def setUp(self):
+        """Creates a temporary directory for archives"""
+        self._directory = tempfile.TemporaryDirectory()
+        self._path = os.path.join(self._directory.name, 'games.bin')
+
+    def tearDown(self):
+        """Removes the temporary directory"""
+        self._directory.cleanup()
+
+    def test_case_1(self):
+        """Test that encode and decode round trip, with one byte per move"""
+        record = GameRecord([('Ann', 'black'), ('Bo', 'white')], [(3, 4), (3, 3), None, (1, 1)], 30, 34)
+        encoded = record.encode()
+        self.assertEqual(2 + 1 + 5 + 4 + 3 + 4, len(encoded))
+        decoded, offset = GameRecord.decode(encoded)
+        self.assertEqual(record, decoded)
+        self.assertEqual(len(encoded), offset)
+        with self.assertRaises(ValueError):
+            GameRecord.decode(encoded[:-1])
+
+    def test_case_2(self):
+        """Test that record_from_game adds passes, and replay rebuilds the same position through make_move"""
+        rng = random.Random(2)
+        game = Othello()
+        game.create_player('Ann', 'black')
+        game.create_player('Bo', 'white')
+        color = 'black'
+        while not game.is_game_over():
+            moves = sorted(game.return_available_positions(color))
+            if moves:
+                game.make_move(color, rng.choice(moves))
+            color = 'white' if color == 'black' else 'black'
+        record = record_from_game(game)
+        self.assertEqual(game.tabulate_score(), record.get_score())
+        for backend in ('list', 'bitboard'):
+            replayed = replay(record, backend)
+            self.assertEqual(game.get_board(), replayed.get_board())
+            self.assertEqual(game.tabulate_score(), replayed.tabulate_score())
+
+        # a 10x10 game cannot be recorded, since its squares do not fit in the 8x8 square numbers of a record
+        game = Othello(size=10)
+        game.make_move('black', (4, 5))
+        with self.assertRaisesRegex(ValueError, '8x8'):
+            record_from_game(game)
+
+    def test_case_3(self):
+        """Test iterate_positions, which yields each position before its move"""
+        record = GameRecord([], [(3, 4), (3, 3)], 2, 3)
+        seen = []
+        for game, color, move in iterate_positions(record):
+            seen.append((color, move, sorted(game.return_available_positions(color))))
+        self.assertEqual('black', seen[0][0])
+        self.assertIn((3, 4), seen[0][2])
+        self.assertEqual(('white', (3, 3)), seen[1][:2])
+        self.assertIn((3, 3), seen[1][2])
+
+    def test_case_4(self):
+        """Test that the streaming and memory-mapped readers return the records written, in order"""
+        rng = random.Random(4)
+        records = [random_record(rng) for _ in range(50)]
+        with RecordWriter(self._path) as writer:
+            for record in records[:30]:
+                writer.write(record)
+        with RecordWriter(self._path, append=True) as writer:
+            for record in records[30:]:
+                writer.write(record)
+        self.assertEqual(records, list(read_records(self._path)))
+        with MappedRecordReader(self._path) as reader:
+            self.assertEqual(records, list(reader))
+        for record in records[:5]:
+            white_score, black_score = replay(record).tabulate_score()
+            self.assertEqual(record.get_score(), (white_score, black_score))
+
+    def test_case_5(self):
+        """Test that a file without the archive header is rejected"""
+        with open(self._path, 'wb') as archive:
+            archive.write(b'NOPE' + FILE_HEADER[4:])
+        with self.assertRaises(ValueError):
+            list(read_records(self._path))
+        with self.assertRaises(ValueError):
+            MappedRecordReader(self._path)
+
+    def test_case_6(self):
+        """Test that long names are cut on a character boundary, and that truncated archives are rejected"""
+        record = GameRecord([('é' * 200, 'black')], [(3, 4)], 1, 4)
+        decoded, _ = GameRecord.decode(record.encode())
+        self.assertEqual('é' * 127, decoded.get_players()[0][0])
+        for cut in (1, 5):
+            with open(self._path, 'wb') as archive:
+                archive.write(FILE_HEADER + GameRecord([], [(3, 4)], 1, 4).encode()[:cut])
+            with self.assertRaisesRegex(ValueError, 'Truncated'):
+                list(read_records(self._path))
+        with self.assertRaisesRegex(ValueError, 'Truncated'):
+            GameRecord.decode(b'\x05')
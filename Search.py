@@ -0,0 +1,328 @@
+# Author: Jonathan Reuter
+# GitHub username: ReuterJo
+# Date: 10/18/2026
+# Description: Implements a computer player for Othello. Moves are chosen by a negamax search with alpha-beta pruning
+# and iterative deepening under a time limit, built on the Othello class's return_available_positions, make_move and
+# undo_move, so that the search explores the game tree in place. Results are shared between transpositions through
+# a TranspositionTable keyed by the game's Zobrist hash.
+
+import time
+
+from Othello import Player
+from Transposition import TranspositionTable, position_key
+
+# score given to a won game, before adding the final disc difference
+WIN_SCORE = 10000
+
+
+def create_square_weights(size):
+    """
+    Returns static weights for each square of a board of the given size, as a 2D list including the edge, used to
+    order moves so that good moves are searched first. Corners are valuable, and the squares next to an empty corner
+    usually give it away to the opponent.
+    """
+    weights = [[0] * (size + 2) for _ in range(size + 2)]
+    for row in range(1, size + 1):
+        for column in range(1, size + 1):
+            # distances from the nearest edge in each direction, counting the edge squares themselves as 1
+            near, far = sorted((min(row, size + 1 - row), min(column, size + 1 - column)))
+            if near == 1:
+                weights[row][column] = {1: 100, 2: -20, 3: 10}.get(far, 5)
+            elif near == 2:
+                weights[row][column] = -50 if far == 2 else -2
+            else:
+                weights[row][column] = -1
+    return weights
+
+
+# square weights of the standard board, and of each other size used so far
+SQUARE_WEIGHTS = create_square_weights(8)
+square_weights_cache = {8: SQUARE_WEIGHTS}
+
+
+def get_square_weights(size):
+    """Returns the square weights for a board of the given size"""
+    weights = square_weights_cache.get(size)
+    if weights is None:
+        weights = create_square_weights(size)
+        square_weights_cache[size] = weights
+    return weights
+
+
+def opposite_color(color):
+    """Returns the color of the opponent of a player of the given color"""
+    if color == 'white':
+        return 'black'
+    return 'white'
+
+
+def evaluate_position(game, color):
+    """
+    Returns a static evaluation of the game from the point of view of the player of the given color. Combines the
+    disc difference with a bonus for each corner held.
+    """
+    board = game.get_board()
+    own_piece = 'O' if color == 'white' else 'X'
+    white_score, black_score = game.tabulate_score()
+    if color == 'white':
+        score = white_score - black_score
+    else:
+        score = black_score - white_score
+
+    # corners can never be flipped, so weigh them heavily
+    size = len(board) - 2
+    for row, column in ((1, 1), (1, size), (size, 1), (size, size)):
+        if board[row][column] == own_piece:
+            score += 25
+        elif board[row][column] != '.':
+            score -= 25
+    return score
+
+
+def final_score(game, color):
+    """Returns the score of a finished game from the point of view of the player of the given color"""
+    white_score, black_score = game.tabulate_score()
+    if color == 'white':
+        difference = white_score - black_score
+    else:
+        difference = black_score - white_score
+    if difference > 0:
+        return WIN_SCORE + difference
+    if difference < 0:
+        return -WIN_SCORE + difference
+    return 0
+
+
+class SearchTimeout(Exception):
+    """Raised inside a search when its time limit has been reached"""
+    pass
+
+
+class AlphaBetaSearcher:
+    """
+    Searches an Othello game for the best move of a player using negamax with alpha-beta pruning. Iterative deepening
+    is used so that the best move of the deepest completed search is always available when time runs out.
+    """
+    def __init__(self, time_limit=0.1, max_depth=10, evaluate=evaluate_position, table=None):
+        """
+        Creates a new searcher with a time limit per move in seconds, a maximum depth, an evaluation function and a
+        transposition table. If no table is given, a new one is created, which is kept between searches.
+        """
+        self._time_limit = time_limit
+        self._max_depth = max_depth
+        self._evaluate = evaluate
+        if table is None:
+            table = TranspositionTable()
+        self._table = table
+        self._deadline = None
+        self._nodes = 0
+        self._elapsed = 0.0
+        self._depth_reached = 0
+        self._best_score = None
+        self._square_weights = SQUARE_WEIGHTS
+
+    def get_statistics(self):
+        """Returns a dictionary describing the most recent search"""
+        return {'nodes': self._nodes,
+                'elapsed': self._elapsed,
+                'nodes_per_second': self.get_nodes_per_second(),
+                'depth': self._depth_reached,
+                'score': self._best_score,
+                'table': self._table.get_statistics()}
+
+    def get_table(self):
+        """Returns the transposition table used by the searcher"""
+        return self._table
+
+    def get_nodes_per_second(self):
+        """Returns the search speed of the most recent search in nodes per second"""
+        if self._elapsed == 0:
+            return 0.0
+        return self._nodes / self._elapsed
+
+    def order_moves(self, moves, best_move=None):
+        """
+        Orders moves so that the most promising are searched first. The best move from a previous search comes first,
+        followed by the remaining moves from best to worst static square weight. Within the search, the best move
+        stored in the transposition table takes the place of the previous best move.
+        """
+        weights = self._square_weights
+        ordered = sorted(moves, key=lambda move: (-weights[move[0]][move[1]], move))
+        if best_move in moves:
+            ordered.remove(best_move)
+            ordered.insert(0, best_move)
+        return ordered
+
+    def search(self, game, color):
+        """
+        Returns the best move found for the player of the given color, or None if that player has no available moves.
+        Moves are made and undone on the game itself, which is left unchanged once the search returns.
+        """
+        start = time.perf_counter()
+        self._deadline = start + self._time_limit
+        self._nodes = 0
+        self._depth_reached = 0
+        self._best_score = None
+        self._square_weights = get_square_weights(game.get_size())
+
+        moves = game.return_available_positions(color)
+        if len(moves) == 0:
+            self._elapsed = time.perf_counter() - start
+            return None
+        best_move = self.order_moves(moves)[0]
+        history_length = len(game.get_move_history())
+
+        # search one ply deeper each iteration, keeping the result of the last iteration that finished in time
+        for depth in range(1, self._max_depth + 1):
+            try:
+                score, move = self.search_root(game, color, depth, moves, best_move)
+            except SearchTimeout:
+                # take back the moves of the interrupted search
+                while len(game.get_move_history()) > history_length:
+                    game.undo_move()
+                break
+            best_move = move
+            self._best_score = score
+            self._depth_reached = depth
+
+            # stop early once the outcome of the game is known
+            if abs(score) >= WIN_SCORE:
+                break
+
+        self._elapsed = time.perf_counter() - start
+        return best_move
+
+    def search_move(self, game, color, move, depth, alpha=-WIN_SCORE * 2, beta=WIN_SCORE * 2):
+        """
+        Searches a single move of the player of the given color to the given depth, with no time limit, and returns
+        its score if it lies between alpha and beta, or a bound on it otherwise. Is used to search root moves
+        separately, such as in another process. The game is left unchanged.
+        """
+        start = time.perf_counter()
+        self._deadline = float('inf')
+        self._nodes = 0
+        self._square_weights = get_square_weights(game.get_size())
+        game.make_move(color, move)
+        try:
+            score = -self.negamax(game, opposite_color(color), depth - 1, -beta, -alpha, False)
+        finally:
+            game.undo_move()
+        self._elapsed = time.perf_counter() - start
+        self._depth_reached = depth
+        self._best_score = score
+        return score
+
+    def search_root(self, game, color, depth, moves, previous_best_move):
+        """Searches each root move to the given depth. Returns the best (score, move)."""
+        alpha = -WIN_SCORE * 2
+        beta = WIN_SCORE * 2
+        best_move = None
+        opponent_color = opposite_color(color)
+
+        for move in self.order_moves(moves, previous_best_move):
+            game.make_move(color, move)
+            score = -self.negamax(game, opponent_color, depth - 1, -beta, -alpha, False)
+            game.undo_move()
+            if best_move is None or score > alpha:
+                alpha = score
+                best_move = move
+
+        return alpha, best_move
+
+    def negamax(self, game, color, depth, alpha, beta, passed):
+        """
+        Returns the score of the game from the point of view of the player of the given color, searched to the given
+        depth. The passed flag records that the previous player had to pass.
+        """
+        self._nodes += 1
+        if self._nodes & 255 == 0 and time.perf_counter() > self._deadline:
+            raise SearchTimeout()
+
+        if depth == 0:
+            return self._evaluate(game, color)
+
+        # use a stored result for the position if it was searched at least as deep, otherwise use its best move to
+        # order the moves
+        key = position_key(game, color)
+        entry = self._table.probe(key)
+        table_move = None
+        if entry is not None:
+            table_move = entry[4]
+            if entry[1] >= depth:
+                if entry[3] == TranspositionTable.EXACT:
+                    return entry[2]
+                if entry[3] == TranspositionTable.LOWER_BOUND and entry[2] > alpha:
+                    alpha = entry[2]
+                elif entry[3] == TranspositionTable.UPPER_BOUND and entry[2] < beta:
+                    beta = entry[2]
+                if alpha >= beta:
+                    return entry[2]
+
+        opponent_color = opposite_color(color)
+        moves = game.return_available_positions(color)
+
+        # if the player must pass, the game is over if the opponent passed as well
+        if len(moves) == 0:
+            if passed:
+                return final_score(game, color)
+            return -self.negamax(game, opponent_color, depth, -beta, -alpha, True)
+
+        original_alpha = alpha
+        best_score = -WIN_SCORE * 2
+        best_move = None
+        for move in self.order_moves(moves, table_move):
+            game.make_move(color, move)
+            score = -self.negamax(game, opponent_color, depth - 1, -beta, -alpha, False)
+            game.undo_move()
+            if score > best_score:
+                best_score = score
+                best_move = move
+            if score > alpha:
+                alpha = score
+            if alpha >= beta:
+                break
+
+        # store the result, recording whether it is exact or only a bound on the true score
+        if best_score <= original_alpha:
+            flag = TranspositionTable.UPPER_BOUND
+        elif best_score >= beta:
+            flag = TranspositionTable.LOWER_BOUND
+        else:
+            flag = TranspositionTable.EXACT
+        self._table.store(key, depth, best_score, flag, best_move)
+
+        return best_score
+
+
+class AIPlayer(Player):
+    """
+    Represents a computer player, which chooses its moves with an AlphaBetaSearcher. If given an opening book, such as
+    an OpeningBook from OpeningBook.py, it plays the book's move whenever the position is in the book instead of
+    searching.
+    """
+    def __init__(self, player_name, color, time_limit=0.1, max_depth=10, evaluate=evaluate_position, table=None,
+                 book=None):
+        """Creates a new computer player"""
+        super().__init__(player_name, color)
+        self._searcher = AlphaBetaSearcher(time_limit, max_depth, evaluate, table)
+        self._book = book
+
+    def get_searcher(self):
+        """Returns the searcher used to choose moves"""
+        return self._searcher
+
+    def get_book(self):
+        """Returns the opening book consulted before searching, or None"""
+        return self._book
+
+    def choose_move(self, game):
+        """Returns the move chosen for the player in the game, or None if the player has to pass"""
+        if self._book is not None:
+            move = self._book.choose_move(game, self.get_player_color())
+            if move is not None:
+                return move
+        return self._searcher.search(game, self.get_player_color())
+
+    def play_turn(self, game):
+        """Chooses a move and plays it through play_game. Returns the result of play_game."""
+        return game.play_game(self.get_player_color(), self.choose_move(game))
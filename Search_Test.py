@@ -0,0 +1,80 @@
+# Author: Jonathan Reuter
+# GitHub username: ReuterJo
+# Date: 10/18/2026
+# Description: Contains test cases for Search.py
+
+import copy
+import unittest
+from Othello import Othello
+from Search import AlphaBetaSearcher, AIPlayer, evaluate_position, opposite_color, WIN_SCORE
+
+
+def minimax(game, color, depth):
+    """Plain minimax without pruning, used to check the alpha-beta searcher"""
+    moves = game.return_available_positions(color)
+    if depth == 0 or len(moves) == 0:
+        return evaluate_position(game, color)
+    best_score = None
+    for move in moves:
+        child = copy.deepcopy(game)
+        child.make_move(color, move)
+        score = -minimax(child, opposite_color(color), depth - 1)
+        if best_score is None or score > best_score:
+            best_score = score
+    return best_score
+
+
+class TestSearch(unittest.TestCase):
+    """Test cases for Search.py"""
+
+    def test_case_1(self):
+        """Test order_moves, with corners first and the previous best move ahead of them"""
+        searcher = AlphaBetaSearcher()
+        self.assertEqual([(1, 1), (3, 4), (2, 2)], searcher.order_moves([(2, 2), (3, 4), (1, 1)]))
+        self.assertEqual([(2, 2), (1, 1), (3, 4)], searcher.order_moves([(2, 2), (3, 4), (1, 1)], (2, 2)))
+
+    def test_case_2(self):
+        """Test that alpha-beta search agrees with minimax"""
+        game = Othello()
+        game.make_move('black', (6, 5))
+        game.make_move('white', (6, 4))
+        searcher = AlphaBetaSearcher(time_limit=60, max_depth=3)
+        searcher.search(game, 'black')
+        self.assertEqual(3, searcher.get_statistics()['depth'])
+        self.assertEqual(minimax(game, 'black', 3), searcher.get_statistics()['score'])
+
+    def test_case_3(self):
+        """Test that search leaves the game unchanged and returns None when the player must pass"""
+        game = Othello()
+        board = copy.deepcopy(game.get_board())
+        self.assertIn(AlphaBetaSearcher(max_depth=2).search(game, 'black'), game.return_available_positions('black'))
+        self.assertEqual(board, game.get_board())
+        game.make_move('black', (4, 4))
+        game.make_move('black', (5, 5))
+        self.assertIsNone(AlphaBetaSearcher().search(game, 'white'))
+
+    def test_case_4(self):
+        """Test that search finds a win and reports its statistics"""
+        game = Othello()
+        game.make_move('black', (4, 4))
+        searcher = AlphaBetaSearcher(time_limit=60)
+        self.assertIn(searcher.search(game, 'black'), [(5, 6), (6, 5), (6, 6)])
+        statistics = searcher.get_statistics()
+        self.assertEqual(WIN_SCORE + 5, statistics['score'])
+        self.assertGreater(statistics['nodes'], 0)
+        self.assertGreater(statistics['nodes_per_second'], 0)
+
+    def test_case_5(self):
+        """Test AIPlayer playing a whole game against itself through play_game"""
+        game = Othello()
+        white = AIPlayer('Bob', 'white', time_limit=0.01, max_depth=2)
+        black = AIPlayer('Sarah', 'black', time_limit=0.01, max_depth=2)
+        game.create_player('Bob', 'white')
+        game.create_player('Sarah', 'black')
+        result = None
+        turn = 0
+        while result is None or result == []:
+            player = black if turn % 2 == 0 else white
+            result = player.play_turn(game)
+            turn += 1
+        self.assertIn(result, ("Winner is white player: Bob", "Winner is black player: Sarah", "It's a tie"))
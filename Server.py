@@ -0,0 +1,398 @@
+# Author: Jonathan Reuter
+# GitHub username: ReuterJo
+# Date: 10/18/2026
+# Description: Implements an asyncio game server hosting many concurrent Othello games in one process. Clients connect
+# over TCP and send one JSON request per line, and receive one JSON response per line. Moves are checked with the
+# Othello class's submit_move, which follows play_game's rules, and moves chosen by computer players are computed in
+# a pool of worker processes so that they do not hold up other games. Also includes a load-test client.
+
+import argparse
+import asyncio
+import concurrent.futures
+import json
+import random
+import time
+
+from Othello import Othello
+from Bitboard import parse_board, bitboards_to_board
+from Search import opposite_color
+from Tournament import create_strategy
+
+# default limit on the number of games open at once
+MAX_SESSIONS = 10000
+
+# strategy used by computer players when a game does not name one
+DEFAULT_STRATEGY = 'alphabeta:3'
+
+# deepest search a client may ask a strategy for, so that one request cannot hold up the worker pool for long
+MAX_STRATEGY_DEPTH = 6
+
+
+def is_position(position):
+    """Returns True if a position sent by a client is a list or tuple of two integers"""
+    return (isinstance(position, (list, tuple)) and len(position) == 2
+            and all(isinstance(value, int) and not isinstance(value, bool) for value in position))
+
+
+def board_to_text(board):
+    """Returns the playable squares of a 10x10 board, row by row, as a string of 64 characters"""
+    return ''.join(board[row][column] for row in range(1, 9) for column in range(1, 9))
+
+
+def choose_engine_move(board_text, color, strategy_name, seed):
+    """
+    Returns the move chosen by a strategy for the player of the given color, or None if the player has to pass. The
+    board is given as text, so that only a short string is sent to a worker process.
+    """
+    game = Othello()
+    game.load_board(bitboards_to_board(*parse_board(board_text)))
+    return create_strategy(strategy_name, random.Random(seed)).choose_move(game, color)
+
+
+class GameSession:
+    """Represents a game hosted by the server, with a lock so that requests for the game are handled one at a time"""
+    def __init__(self, game_id, black_name, white_name, engine_color=None, strategy_name=DEFAULT_STRATEGY):
+        """Creates a new game. If engine_color is 'black' or 'white', that color is played by the strategy."""
+        self._game_id = game_id
+        self._game = Othello()
+        self._game.create_player(white_name, 'white')
+        self._game.create_player(black_name, 'black')
+        self._engine_color = engine_color
+        self._strategy_name = strategy_name
+        self._color_to_move = 'black'
+        self._lock = asyncio.Lock()
+
+    def get_game_id(self):
+        """Returns the identifier of the game"""
+        return self._game_id
+
+    def get_game(self):
+        """Returns the Othello game"""
+        return self._game
+
+    def get_engine_color(self):
+        """Returns the color played by the strategy, or None"""
+        return self._engine_color
+
+    def get_strategy_name(self):
+        """Returns the name of the strategy choosing computer moves"""
+        return self._strategy_name
+
+    def get_color_to_move(self):
+        """Returns the color of the player to move"""
+        return self._color_to_move
+
+    def get_lock(self):
+        """Returns the lock held while a request for the game is handled"""
+        return self._lock
+
+    def end_turn(self):
+        """Hands the move to the other player"""
+        self._color_to_move = opposite_color(self._color_to_move)
+
+    def get_state(self):
+        """Returns the state of the game as a dictionary that can be sent as JSON"""
+        game = self._game
+        white_score, black_score = game.tabulate_score()
+        state = {'game_id': self._game_id,
+                 'board': [''.join(game.get_board()[row][1:9]) for row in range(1, 9)],
+                 'color_to_move': self._color_to_move,
+                 'white_score': white_score,
+                 'black_score': black_score,
+                 'available_positions': sorted(game.return_available_positions(self._color_to_move)),
+                 'game_over': game.is_game_over()}
+        if state['game_over']:
+            state['winner'] = game.return_winner()
+        return state
+
+
+class GameServer:
+    """
+    Represents a server hosting Othello games. Requests are dictionaries with a 'command' key, which is one of:
+    'new' to start a game, with optional 'black', 'white', 'engine_color' and 'strategy';
+    'move' to play the 'position' of the player of 'color' in the game 'game_id', with a position of None to pass;
+    'hint' for the move the strategy would choose for the player to move;
+    'state' for the state of a game; and
+    'close' to end a game.
+    Every response has an 'ok' key, and an 'error' message when it is False.
+    """
+    def __init__(self, engine_workers=None, max_sessions=MAX_SESSIONS):
+        """
+        Creates a new server. Computer moves are chosen in a pool of engine_workers processes, by default one per
+        core, or in the server's own thread if engine_workers is 0.
+        """
+        self._sessions = {}
+        self._next_game_id = 1
+        # tasks answering each open connection, with their stream writers
+        self._connections = {}
+        self._max_sessions = max_sessions
+        if engine_workers == 0:
+            self._executor = None
+        else:
+            self._executor = concurrent.futures.ProcessPoolExecutor(max_workers=engine_workers)
+        self._commands = {'new': self.new_game,
+                          'move': self.move,
+                          'hint': self.hint,
+                          'state': self.state,
+                          'close': self.close_game}
+
+    def get_session_count(self):
+        """Returns the number of games open"""
+        return len(self._sessions)
+
+    async def handle_request(self, request):
+        """Handles a request, returning the response"""
+        if not isinstance(request, dict) or request.get('command') not in self._commands:
+            return {'ok': False, 'error': 'Invalid command'}
+        if request['command'] == 'new':
+            return await self.new_game(request)
+
+        game_id = request.get('game_id')
+        session = self._sessions.get(game_id) if isinstance(game_id, int) else None
+        if session is None:
+            return {'ok': False, 'error': 'Invalid game'}
+        async with session.get_lock():
+            return await self._commands[request['command']](session, request)
+
+    async def new_game(self, request):
+        """Starts a new game"""
+        if len(self._sessions) >= self._max_sessions:
+            return {'ok': False, 'error': 'Too many games'}
+        engine_color = request.get('engine_color')
+        strategy_name = request.get('strategy', DEFAULT_STRATEGY)
+        black_name = request.get('black', 'black')
+        white_name = request.get('white', 'white')
+        if engine_color not in (None, 'black', 'white'):
+            return {'ok': False, 'error': 'Invalid color'}
+        if not isinstance(black_name, str) or not isinstance(white_name, str):
+            return {'ok': False, 'error': 'Invalid player name'}
+        if not isinstance(strategy_name, str):
+            return {'ok': False, 'error': 'Invalid strategy'}
+        try:
+            create_strategy(strategy_name, random.Random(0))
+        except (ValueError, TypeError):
+            return {'ok': False, 'error': 'Invalid strategy: ' + strategy_name}
+        _, _, depth = strategy_name.partition(':')
+        if depth and int(depth) > MAX_STRATEGY_DEPTH:
+            return {'ok': False, 'error': 'The deepest search allowed is %d' % MAX_STRATEGY_DEPTH}
+
+        session = GameSession(self._next_game_id, black_name, white_name, engine_color, strategy_name)
+        self._sessions[session.get_game_id()] = session
+        self._next_game_id += 1
+
+        # if the computer plays black, it moves first
+        async with session.get_lock():
+            engine_moves = await self.play_engine_turns(session)
+            return {'ok': True, 'engine_moves': engine_moves, 'state': session.get_state()}
+
+    async def move(self, session, request):
+        """Plays a move, followed by any computer moves, returning the result of the move as given by submit_move"""
+        color = request.get('color')
+        if color != session.get_color_to_move():
+            return {'ok': False, 'error': 'Not your turn'}
+        if color == session.get_engine_color():
+            return {'ok': False, 'error': 'That color is played by the computer'}
+        position = request.get('position')
+        if position is not None:
+            if not is_position(position):
+                return {'ok': False, 'error': 'Invalid position'}
+            position = tuple(position)
+
+        result = session.get_game().submit_move(color, position)
+        if result['status'] == 'invalid' and position is None:
+            result['error'] = 'A player may only pass when no moves are available'
+        if result['status'] in ('moved', 'pass'):
+            session.end_turn()
+        engine_moves = await self.play_engine_turns(session)
+        return dict(result, ok=True, engine_moves=engine_moves, state=session.get_state())
+
+    async def hint(self, session, request):
+        """Returns the move the strategy would choose for the player to move, without playing it"""
+        return {'ok': True, 'position': await self.choose_move(session), 'state': session.get_state()}
+
+    async def state(self, session, request):
+        """Returns the state of the game"""
+        return {'ok': True, 'state': session.get_state()}
+
+    async def close_game(self, session, request):
+        """Ends the game"""
+        del self._sessions[session.get_game_id()]
+        return {'ok': True}
+
+    async def choose_move(self, session):
+        """Returns the move chosen by the session's strategy for the player to move, computed in the process pool"""
+        game = session.get_game()
+        # seed each move from the game and the number of moves made, so that replies are repeatable
+        seed = session.get_game_id() * 1000 + len(game.get_move_history())
+        arguments = (board_to_text(game.get_board()), session.get_color_to_move(), session.get_strategy_name(), seed)
+        if self._executor is None:
+            return choose_engine_move(*arguments)
+        return await asyncio.get_running_loop().run_in_executor(self._executor, choose_engine_move, *arguments)
+
+    async def play_engine_turns(self, session):
+        """Plays the computer's moves for as long as it is the computer's turn. Returns the list of moves played."""
+        engine_moves = []
+        game = session.get_game()
+        while session.get_color_to_move() == session.get_engine_color() and not game.is_game_over():
+            position = await self.choose_move(session)
+            result = game.submit_move(session.get_color_to_move(), position)
+            engine_moves.append(dict(result, color=session.get_color_to_move(), position=position))
+            session.end_turn()
+        return engine_moves
+
+    async def handle_connection(self, reader, writer):
+        """Answers the requests sent over a connection, one JSON object per line, until the client disconnects"""
+        task = asyncio.current_task()
+        self._connections[task] = writer
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    request = json.loads(line)
+                except ValueError:
+                    response = {'ok': False, 'error': 'Invalid JSON'}
+                else:
+                    # a request that fails unexpectedly is answered with an error, rather than dropping the connection
+                    try:
+                        response = await self.handle_request(request)
+                    except Exception as error:
+                        response = {'ok': False, 'error': 'Internal error: ' + type(error).__name__}
+                    if isinstance(request, dict) and 'id' in request:
+                        response['id'] = request['id']
+                writer.write(json.dumps(response).encode() + b'\n')
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            del self._connections[task]
+            writer.close()
+
+    async def start(self, host='127.0.0.1', port=8765):
+        """Starts listening for connections. Returns the asyncio server."""
+        return await asyncio.start_server(self.handle_connection, host, port)
+
+    async def stop(self, server):
+        """Stops accepting connections on an asyncio server from start, closes open connections, and shuts down"""
+        server.close()
+        for writer in list(self._connections.values()):
+            writer.close()
+        await asyncio.gather(*self._connections, return_exceptions=True)
+        await server.wait_closed()
+        self.close()
+
+    def close(self):
+        """Shuts down the engine processes"""
+        if self._executor is not None:
+            self._executor.shutdown()
+
+
+def percentile(values, fraction):
+    """Returns the value at the given fraction, between 0 and 1, of the sorted values, by the nearest rank"""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, int(fraction * len(ordered) + 0.5) - 1))]
+
+
+async def play_client_game(host, port, strategy_name, seed, latencies):
+    """
+    Plays one game as a client over its own connection, choosing random moves for black against the server's
+    computer player as white. Appends the latency of each move request, in seconds, to latencies.
+    """
+    rng = random.Random(seed)
+    reader, writer = await asyncio.open_connection(host, port)
+
+    async def send(request):
+        writer.write(json.dumps(request).encode() + b'\n')
+        await writer.drain()
+        return json.loads(await reader.readline())
+
+    try:
+        response = await send({'command': 'new', 'engine_color': 'white', 'strategy': strategy_name})
+        state = response['state']
+        while not state['game_over']:
+            moves = state['available_positions']
+            start = time.perf_counter()
+            response = await send({'command': 'move', 'game_id': state['game_id'], 'color': 'black',
+                                   'position': rng.choice(moves) if moves else None})
+            latencies.append(time.perf_counter() - start)
+            state = response['state']
+        await send({'command': 'close', 'game_id': state['game_id']})
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+
+async def run_load_test(host, port, games, concurrency, strategy_name='random', seed=0):
+    """
+    Plays games against a server from many concurrent clients. Returns a dictionary of the games and moves played,
+    the p50 and p99 move latencies in seconds, and the moves handled per second.
+    """
+    latencies = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def play(game_index):
+        async with semaphore:
+            await play_client_game(host, port, strategy_name, seed * 1000003 + game_index, latencies)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(play(game_index) for game_index in range(games)))
+    elapsed = time.perf_counter() - start
+    return {'games': games,
+            'moves': len(latencies),
+            'p50': percentile(latencies, 0.5),
+            'p99': percentile(latencies, 0.99),
+            'moves_per_second': len(latencies) / elapsed if elapsed > 0 else 0.0}
+
+
+async def serve(host, port, engine_workers):
+    """Runs a server until interrupted"""
+    game_server = GameServer(engine_workers)
+    server = await game_server.start(host, port)
+    print('serving on %s:%d' % (host, port))
+    try:
+        await server.serve_forever()
+    finally:
+        await game_server.stop(server)
+
+
+async def load_test(host, port, games, concurrency, strategy_name, engine_workers):
+    """Runs a load test against a server, starting one in this process if no port is given"""
+    game_server = None
+    if port is None:
+        game_server = GameServer(engine_workers)
+        server = await game_server.start(host, 0)
+        port = server.sockets[0].getsockname()[1]
+    try:
+        results = await run_load_test(host, port, games, concurrency, strategy_name)
+    finally:
+        if game_server is not None:
+            await game_server.stop(server)
+    print('%d games, %d moves, %.0f moves/sec, p50 %.2f ms, p99 %.2f ms'
+          % (results['games'], results['moves'], results['moves_per_second'], results['p50'] * 1000,
+             results['p99'] * 1000))
+
+
+def main():
+    """Runs a server or a load test from the command line"""
+    parser = argparse.ArgumentParser(description='Host Othello games over TCP, one JSON request per line')
+    parser.add_argument('mode', choices=('serve', 'loadtest'), help='run a server, or a load test against one')
+    parser.add_argument('--host', default='127.0.0.1', help='address to listen on or connect to')
+    parser.add_argument('--port', type=int, default=None,
+                        help='port to listen on (default 8765), or to load test (default: a server in this process)')
+    parser.add_argument('--engine-workers', type=int, default=None,
+                        help='processes choosing computer moves (default: one per core, 0: in the server thread)')
+    parser.add_argument('--games', type=int, default=200, help='games played by the load test')
+    parser.add_argument('--concurrency', type=int, default=50, help='games played at once by the load test')
+    parser.add_argument('--strategy', default='random', help='computer strategy played against in the load test')
+    args = parser.parse_args()
+
+    if args.mode == 'serve':
+        asyncio.run(serve(args.host, args.port or 8765, args.engine_workers))
+    else:
+        asyncio.run(load_test(args.host, args.port, args.games, args.concurrency, args.strategy,
+                              args.engine_workers))
+
+
+if __name__ == '__main__':
+    main()
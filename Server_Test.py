@@ -0,0 +1,109 @@
+# Author: Jonathan Reuter
+# GitHub username: ReuterJo
+# Date: 10/18/2026
+# Description: Contains test cases for Server.py
+
+import asyncio
+import json
+import random
+import unittest
+from Server import GameServer, run_load_test, percentile
+
+
+class TestServer(unittest.TestCase):
+    """Test cases for Server.py"""
+
+    def test_case_1(self):
+        """Test requests for starting a game, moving out of turn, invalid moves and unknown games"""
+        async def run():
+            server = GameServer(engine_workers=0)
+            response = await server.handle_request({'command': 'new', 'black': 'Ann', 'white': 'Bo'})
+            game_id = response['state']['game_id']
+            self.assertEqual('black', response['state']['color_to_move'])
+            self.assertEqual([(3, 4), (4, 3), (5, 6), (6, 5)], response['state']['available_positions'])
+            move = {'command': 'move', 'game_id': game_id}
+            self.assertFalse((await server.handle_request(dict(move, color='white', position=[3, 3])))['ok'])
+            response = await server.handle_request(dict(move, color='black', position=[1, 1]))
+            self.assertEqual('invalid', response['status'])
+            response = await server.handle_request(dict(move, color='black', position=None))
+            self.assertEqual('invalid', response['status'])
+            response = await server.handle_request(dict(move, color='black', position=[3, 4]))
+            self.assertEqual(('moved', 'white'), (response['status'], response['state']['color_to_move']))
+            self.assertEqual({'ok': False, 'error': 'Invalid game'},
+                             await server.handle_request({'command': 'state', 'game_id': 999}))
+            self.assertFalse((await server.handle_request({'command': 'dance'}))['ok'])
+            self.assertFalse((await server.handle_request({'command': 'new', 'strategy': 'telepathy'}))['ok'])
+            self.assertTrue((await server.handle_request({'command': 'close', 'game_id': game_id}))['ok'])
+            self.assertEqual(0, server.get_session_count())
+        asyncio.run(run())
+
+    def test_case_2(self):
+        """Test a whole game against the computer, which replies to every move until the game is over"""
+        async def run():
+            server = GameServer(engine_workers=0)
+            rng = random.Random(3)
+            response = await server.handle_request({'command': 'new', 'engine_color': 'black', 'strategy': 'greedy'})
+            self.assertEqual(1, len(response['engine_moves']))
+            state = response['state']
+            while not state['game_over']:
+                self.assertEqual('white', state['color_to_move'])
+                moves = state['available_positions']
+                response = await server.handle_request({'command': 'move', 'game_id': state['game_id'],
+                                                        'color': 'white',
+                                                        'position': rng.choice(moves) if moves else None})
+                self.assertIn(response['status'], ('moved', 'pass'))
+                state = response['state']
+            self.assertLessEqual(state['white_score'] + state['black_score'], 64)
+            self.assertTrue(state['winner'].startswith('Winner') or state['winner'] == "It's a tie")
+        asyncio.run(run())
+
+    def test_case_3(self):
+        """Test the load-test client against a server over TCP, with computer moves in a worker process"""
+        async def run():
+            server = GameServer(engine_workers=1)
+            listener = await server.start('127.0.0.1', 0)
+            port = listener.sockets[0].getsockname()[1]
+            try:
+                results = await run_load_test('127.0.0.1', port, games=4, concurrency=2, strategy_name='alphabeta:1')
+            finally:
+                await server.stop(listener)
+            self.assertEqual(4, results['games'])
+            self.assertGreater(results['moves'], 4 * 20)
+            self.assertLessEqual(results['p50'], results['p99'])
+            self.assertEqual(0, server.get_session_count())
+        asyncio.run(run())
+        self.assertEqual(2, percentile([3, 1, 2, 4], 0.5))
+        self.assertEqual(4, percentile([3, 1, 2, 4], 0.99))
+
+    def test_case_4(self):
+        """Test that malformed requests get an error reply, including over a connection when a request fails"""
+        async def run():
+            server = GameServer(engine_workers=0)
+            response = await server.handle_request({'command': 'new'})
+            game_id = response['state']['game_id']
+            move = {'command': 'move', 'game_id': game_id, 'color': 'black'}
+            for position in (5, [3], [3, 'a'], [3, 4, 5], [True, 4]):
+                self.assertEqual({'ok': False, 'error': 'Invalid position'},
+                                 await server.handle_request(dict(move, position=position)))
+            self.assertEqual({'ok': False, 'error': 'Invalid game'},
+                             await server.handle_request({'command': 'state', 'game_id': [game_id]}))
+            self.assertFalse((await server.handle_request({'command': 'new', 'black': 5}))['ok'])
+            self.assertFalse((await server.handle_request({'command': 'new', 'strategy': ['greedy']}))['ok'])
+            self.assertFalse((await server.handle_request({'command': 'new', 'strategy': 'random:5'}))['ok'])
+            self.assertFalse((await server.handle_request({'command': 'new', 'strategy': 'alphabeta:60'}))['ok'])
+            self.assertEqual(1, server.get_session_count())
+
+            async def fail(request):
+                raise KeyError('boom')
+            server.handle_request = fail
+            listener = await server.start('127.0.0.1', 0)
+            port = listener.sockets[0].getsockname()[1]
+            try:
+                reader, writer = await asyncio.open_connection('127.0.0.1', port)
+                writer.write(b'{"command": "state", "game_id": 1, "id": 7}\n')
+                response = json.loads(await reader.readline())
+                writer.close()
+            finally:
+                await server.stop(listener)
+            self.assertEqual({'ok': False, 'error': 'Internal error: KeyError', 'id': 7}, response)
+        asyncio.run(run())
@@ -0,0 +1,245 @@
+# Author: Jonathan Reuter
+# GitHub username: ReuterJo
+# Date: 10/18/2026
+# Description: Runs tournaments between Othello playing strategies. Games are played through the Othello class's
+# play_game method and spread across a pool of worker processes, and the results are combined into win/loss/tie
+# standings and Elo ratings for each strategy.
+
+import argparse
+import concurrent.futures
+import itertools
+import os
+import random
+import time
+
+from Othello import Othello
+from Search import AlphaBetaSearcher, opposite_color
+
+# Elo rating given to every strategy before its first game, and the largest change a single game can cause
+INITIAL_RATING = 1500
+K_FACTOR = 16
+
+# number of chunks of games given to each worker process, so that work stays balanced without sending every game
+# to a worker separately
+CHUNKS_PER_WORKER = 4
+
+
+class RandomStrategy:
+    """Represents a strategy that plays a uniformly random available move"""
+    def __init__(self, rng):
+        """Creates a new strategy using the given random number generator"""
+        self._rng = rng
+
+    def choose_move(self, game, color):
+        """Returns the move chosen for the player of the given color, or None if the player has to pass"""
+        moves = sorted(game.return_available_positions(color))
+        if len(moves) == 0:
+            return None
+        return self._rng.choice(moves)
+
+
+class GreedyStrategy:
+    """Represents a strategy that plays the move capturing the most pieces, breaking ties at random"""
+    def __init__(self, rng):
+        """Creates a new strategy using the given random number generator"""
+        self._rng = rng
+
+    def choose_move(self, game, color):
+        """Returns the move chosen for the player of the given color, or None if the player has to pass"""
+        best_moves = []
+        best_score = None
+        for move in sorted(game.return_available_positions(color)):
+            game.make_move(color, move)
+            white_score, black_score = game.tabulate_score()
+            game.undo_move()
+            score = white_score if color == 'white' else black_score
+            if best_score is None or score > best_score:
+                best_score = score
+                best_moves = [move]
+            elif score == best_score:
+                best_moves.append(move)
+        if len(best_moves) == 0:
+            return None
+        return self._rng.choice(best_moves)
+
+
+class SearchStrategy:
+    """Represents a strategy that plays the move chosen by an alpha-beta search to a fixed depth"""
+    def __init__(self, rng, depth=3):
+        """Creates a new strategy searching to the given depth. The search itself does not use randomness."""
+        self._searcher = AlphaBetaSearcher(time_limit=float('inf'), max_depth=depth)
+
+    def choose_move(self, game, color):
+        """Returns the move chosen for the player of the given color, or None if the player has to pass"""
+        return self._searcher.search(game, color)
+
+
+# strategies available by name. A search strategy's depth can be chosen with a suffix, such as 'alphabeta:4'.
+STRATEGIES = {'random': RandomStrategy,
+              'greedy': GreedyStrategy,
+              'alphabeta': SearchStrategy}
+
+
+def create_strategy(name, rng):
+    """Creates the strategy with the given name, such as 'random' or 'alphabeta:4'"""
+    strategy_name, _, argument = name.partition(':')
+    if strategy_name not in STRATEGIES:
+        raise ValueError('Invalid strategy: ' + name)
+    if argument:
+        return STRATEGIES[strategy_name](rng, int(argument))
+    return STRATEGIES[strategy_name](rng)
+
+
+def play_match(black_strategy, white_strategy):
+    """
+    Plays a whole game between two strategies through play_game, with black moving first. Returns the final score
+    as a tuple (white_score, black_score).
+    """
+    game = Othello()
+    game.create_player('white', 'white')
+    game.create_player('black', 'black')
+    strategies = {'black': black_strategy, 'white': white_strategy}
+    color = 'black'
+
+    while not game.is_game_over():
+        move = strategies[color].choose_move(game, color)
+        # a strategy without a move has to pass, which play_game reports by returning an empty list
+        game.play_game(color, move)
+        color = opposite_color(color)
+
+    return game.tabulate_score()
+
+
+def play_chunk(chunk):
+    """
+    Plays a chunk of games in a worker process. The chunk is a tuple (seed, games), where each game is a tuple
+    (game_index, black_name, white_name). Every game seeds its own random number generator from the seed and its
+    index, so results do not depend on how games are split between workers. Returns a list of
+    (game_index, black_name, white_name, white_score, black_score).
+    """
+    seed, games = chunk
+    results = []
+    for game_index, black_name, white_name in games:
+        rng = random.Random(seed * 1000003 + game_index)
+        white_score, black_score = play_match(create_strategy(black_name, rng), create_strategy(white_name, rng))
+        results.append((game_index, black_name, white_name, white_score, black_score))
+    return results
+
+
+def schedule_games(strategy_names, games_per_pairing):
+    """
+    Returns the list of (game_index, black_name, white_name) played in a round robin between the strategies. Each
+    pair of strategies plays games_per_pairing games, alternating which of them plays black.
+    """
+    games = []
+    for first_name, second_name in itertools.combinations(strategy_names, 2):
+        for game_number in range(games_per_pairing):
+            if game_number % 2 == 0:
+                games.append((len(games), first_name, second_name))
+            else:
+                games.append((len(games), second_name, first_name))
+    return games
+
+
+def expected_score(rating, opponent_rating):
+    """Returns the expected score, between 0 and 1, of a player against an opponent under the Elo model"""
+    return 1 / (1 + 10 ** ((opponent_rating - rating) / 400))
+
+
+def tabulate_results(strategy_names, results):
+    """
+    Combines game results into standings. Returns a dictionary from each strategy name to a dictionary of its wins,
+    losses, ties, games and Elo rating. Ratings are updated game by game in schedule order.
+    """
+    standings = {name: {'wins': 0, 'losses': 0, 'ties': 0, 'games': 0, 'elo': float(INITIAL_RATING)}
+                 for name in strategy_names}
+
+    for _, black_name, white_name, white_score, black_score in sorted(results):
+        black = standings[black_name]
+        white = standings[white_name]
+        black['games'] += 1
+        white['games'] += 1
+        if black_score > white_score:
+            black['wins'] += 1
+            white['losses'] += 1
+            black_result = 1.0
+        elif white_score > black_score:
+            white['wins'] += 1
+            black['losses'] += 1
+            black_result = 0.0
+        else:
+            black['ties'] += 1
+            white['ties'] += 1
+            black_result = 0.5
+
+        # move both ratings towards the result, by how surprising it was
+        change = K_FACTOR * (black_result - expected_score(black['elo'], white['elo']))
+        black['elo'] += change
+        white['elo'] -= change
+
+    return standings
+
+
+def run_tournament(strategy_names, games_per_pairing, workers=None, seed=0):
+    """
+    Runs a round robin tournament between the named strategies across a pool of worker processes. With workers set
+    to 1, games are played in this process instead. Returns a dictionary with the standings, the individual game
+    results, the elapsed time in seconds and the number of games played per second.
+    """
+    for name in strategy_names:
+        create_strategy(name, random.Random(seed))
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    # split the games into chunks
+    games = schedule_games(strategy_names, games_per_pairing)
+    chunk_count = max(1, min(len(games), workers * CHUNKS_PER_WORKER))
+    chunks = [(seed, games[chunk_index::chunk_count]) for chunk_index in range(chunk_count)]
+
+    start = time.perf_counter()
+    results = []
+    if workers == 1:
+        for chunk in chunks:
+            results.extend(play_chunk(chunk))
+    else:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+            for chunk_results in executor.map(play_chunk, chunks):
+                results.extend(chunk_results)
+    elapsed = time.perf_counter() - start
+
+    return {'standings': tabulate_results(strategy_names, results),
+            'results': sorted(results),
+            'elapsed': elapsed,
+            'games_per_second': len(results) / elapsed if elapsed > 0 else 0.0}
+
+
+def format_standings(tournament):
+    """Returns the standings of a tournament as a printable table, from highest to lowest Elo rating"""
+    lines = ['%-16s %6s %6s %6s %6s %8s' % ('strategy', 'games', 'wins', 'losses', 'ties', 'elo')]
+    standings = tournament['standings']
+    for name in sorted(standings, key=lambda strategy_name: -standings[strategy_name]['elo']):
+        row = standings[name]
+        lines.append('%-16s %6d %6d %6d %6d %8.1f' % (name, row['games'], row['wins'], row['losses'], row['ties'],
+                                                       row['elo']))
+    lines.append('%d games in %.2f seconds, %.1f games/sec' % (len(tournament['results']), tournament['elapsed'],
+                                                               tournament['games_per_second']))
+    return '\n'.join(lines)
+
+
+def main():
+    """Runs a tournament from the command line"""
+    parser = argparse.ArgumentParser(description='Play a round robin tournament between Othello strategies')
+    parser.add_argument('strategies', nargs='+',
+                        help='strategy names: ' + ', '.join(sorted(STRATEGIES)) + ' (alphabeta:DEPTH sets the depth)')
+    parser.add_argument('--games', type=int, default=100, help='games played by each pair of strategies')
+    parser.add_argument('--workers', type=int, default=None, help='worker processes (default: one per core)')
+    parser.add_argument('--seed', type=int, default=0, help='random seed')
+    args = parser.parse_args()
+
+    if len(args.strategies) < 2:
+        parser.error('at least two strategies are needed')
+    print(format_standings(run_tournament(args.strategies, args.games, args.workers, args.seed)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+# Author: Jonathan Reuter
+# GitHub username: ReuterJo
+# Date: 10/18/2026
+# Description: Contains test cases for Tournament.py
+
+import random
+import unittest
+from Tournament import (schedule_games, tabulate_results, create_strategy, play_match, run_tournament,
+                        format_standings, INITIAL_RATING)
+
+
+class TestTournament(unittest.TestCase):
+    """Test cases for Tournament.py"""
+
+    def test_case_1(self):
+        """Test schedule_games, which alternates colors within each pairing"""
+        self.assertEqual([(0, 'a', 'b'), (1, 'b', 'a'), (2, 'a', 'c'), (3, 'c', 'a'), (4, 'b', 'c'), (5, 'c', 'b')],
+                         schedule_games(['a', 'b', 'c'], 2))
+
+    def test_case_2(self):
+        """Test tabulate_results, including Elo ratings"""
+        standings = tabulate_results(['a', 'b'], [(0, 'a', 'b', 10, 54), (1, 'b', 'a', 32, 32)])
+        self.assertEqual({'wins': 1, 'losses': 0, 'ties': 1, 'games': 2},
+                         {key: standings['a'][key] for key in ('wins', 'losses', 'ties', 'games')})
+        self.assertEqual(1, standings['b']['losses'])
+        self.assertGreater(standings['a']['elo'], INITIAL_RATING)
+        self.assertAlmostEqual(2 * INITIAL_RATING, standings['a']['elo'] + standings['b']['elo'])
+
+    def test_case_3(self):
+        """Test create_strategy and play_match"""
+        rng = random.Random(0)
+        with self.assertRaises(ValueError):
+            create_strategy('telepathy', rng)
+        white_score, black_score = play_match(create_strategy('greedy', rng), create_strategy('alphabeta:1', rng))
+        self.assertLessEqual(white_score + black_score, 64)
+
+    def test_case_4(self):
+        """Test that run_tournament gives the same results in this process and across worker processes"""
+        single = run_tournament(['random', 'greedy'], 4, workers=1, seed=3)
+        pooled = run_tournament(['random', 'greedy'], 4, workers=2, seed=3)
+        self.assertEqual(single['results'], pooled['results'])
+        self.assertEqual(single['standings'], pooled['standings'])
+        self.assertEqual(4, len(single['results']))
+        self.assertGreater(single['games_per_second'], 0)
+        self.assertIn('games/sec', format_standings(single))
@@ -0,0 +1,144 @@
+# Author: Jonathan Reuter
+# GitHub username: ReuterJo
+# Date: 10/18/2026
+# Description: Implements Zobrist hashing of Othello boards and a fixed-size transposition table. The Othello class
+# keeps a Zobrist hash of its board up to date as moves are made and undone, which the transposition table uses as
+# its key so that searches can reuse work across positions reached by different move orders.
+
+import random
+
+# seed for the Zobrist keys, fixed so that hashes are the same in every process and every run
+ZOBRIST_SEED = 20230527
+
+
+def create_zobrist_keys(seed=ZOBRIST_SEED, size=8):
+    """
+    Creates the Zobrist keys for a board of the given size, including its edge. Returns a dictionary from each board
+    symbol to a 2D list of 64-bit keys. Empty spaces and the edge have keys of zero, so that they do not contribute to
+    the hash.
+    """
+    rng = random.Random(seed)
+    width = size + 2
+    keys = {'.': [[0] * width for _ in range(width)], '*': [[0] * width for _ in range(width)]}
+    for piece in ('X', 'O'):
+        keys[piece] = [[0] * width for _ in range(width)]
+        for row in range(1, size + 1):
+            for column in range(1, size + 1):
+                keys[piece][row][column] = rng.getrandbits(64)
+    return keys
+
+
+def create_flip_keys(keys):
+    """Returns the key for flipping the piece at each position from one color to the other"""
+    return [[keys['X'][row][column] ^ keys['O'][row][column] for column in range(len(keys['X'][0]))]
+            for row in range(len(keys['X']))]
+
+
+ZOBRIST_KEYS = create_zobrist_keys()
+
+# key for flipping the piece at each position from one color to the other
+ZOBRIST_FLIP_KEYS = create_flip_keys(ZOBRIST_KEYS)
+
+# the (keys, flip keys) of each board size used so far, created when a size is first used
+zobrist_cache = {8: (ZOBRIST_KEYS, ZOBRIST_FLIP_KEYS)}
+
+
+def get_zobrist_keys(size):
+    """Returns the (keys, flip keys) for a board of the given size"""
+    keys = zobrist_cache.get(size)
+    if keys is None:
+        zobrist_keys = create_zobrist_keys(ZOBRIST_SEED, size)
+        keys = (zobrist_keys, create_flip_keys(zobrist_keys))
+        zobrist_cache[size] = keys
+    return keys
+
+
+# key added to the hash of the board when it is the white player's turn to move
+ZOBRIST_WHITE_TO_MOVE = random.Random(ZOBRIST_SEED + 1).getrandbits(64)
+
+
+def compute_hash(board):
+    """Computes the Zobrist hash of a 2D board list of any size from scratch"""
+    keys = get_zobrist_keys(len(board) - 2)[0]
+    board_hash = 0
+    for row in range(len(board)):
+        for column in range(len(board[0])):
+            board_hash ^= keys[board[row][column]][row][column]
+    return board_hash
+
+
+def position_key(game, color):
+    """Returns the Zobrist key of a game with the player of the given color to move"""
+    if color == 'white':
+        return game.get_hash() ^ ZOBRIST_WHITE_TO_MOVE
+    return game.get_hash()
+
+
+class TranspositionTable:
+    """
+    Represents a fixed-size transposition table of search results. Each bucket holds two entries: a depth-preferred
+    entry, only replaced by a search at least as deep, and an always-replace entry which takes everything else.
+    Entries are tuples of (key, depth, score, flag, best move).
+    """
+    # flags describing how the stored score relates to the true score of the position
+    EXACT = 0
+    LOWER_BOUND = 1
+    UPPER_BOUND = 2
+
+    def __init__(self, size=65536):
+        """Creates a new, empty transposition table. The number of buckets is rounded down to a power of two."""
+        self._size = 1 << (max(size, 1).bit_length() - 1)
+        self._mask = self._size - 1
+        self._depth_preferred = [None] * self._size
+        self._always_replace = [None] * self._size
+        self._hits = 0
+        self._misses = 0
+        self._collisions = 0
+        self._stores = 0
+
+    def get_size(self):
+        """Returns the number of buckets in the table"""
+        return self._size
+
+    def get_statistics(self):
+        """Returns a dictionary of the hit, miss, collision and store counters"""
+        return {'size': self._size,
+                'hits': self._hits,
+                'misses': self._misses,
+                'collisions': self._collisions,
+                'stores': self._stores}
+
+    def clear(self):
+        """Removes every entry and resets the counters"""
+        self.__init__(self._size)
+
+    def probe(self, key):
+        """Returns the entry stored for the key, or None if there is none"""
+        index = key & self._mask
+        entry = self._depth_preferred[index]
+        if entry is not None and entry[0] == key:
+            self._hits += 1
+            return entry
+        other_entry = self._always_replace[index]
+        if other_entry is not None and other_entry[0] == key:
+            self._hits += 1
+            return other_entry
+
+        # a miss on a bucket holding other positions is a collision
+        self._misses += 1
+        if entry is not None or other_entry is not None:
+            self._collisions += 1
+        return None
+
+    def store(self, key, depth, score, flag, best_move):
+        """Stores a search result for the key, replacing an older entry in its bucket"""
+        index = key & self._mask
+        entry = (key, depth, score, flag, best_move)
+        self._stores += 1
+
+        # the depth-preferred entry is only replaced by the same position or a search at least as deep
+        current = self._depth_preferred[index]
+        if current is None or current[0] == key or depth >= current[1]:
+            self._depth_preferred[index] = entry
+        else:
+            self._always_replace[index] = entry
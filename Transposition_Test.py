@@ -0,0 +1,75 @@
+# Author: Jonathan Reuter
+# GitHub username: ReuterJo
+# Date: 10/18/2026
+# Description: Contains test cases for Transposition.py
+
+import random
+import unittest
+from Othello import Othello
+from Transposition import TranspositionTable, compute_hash, position_key
+
+
+class TestTransposition(unittest.TestCase):
+    """Test cases for Transposition.py"""
+
+    def test_case_1(self):
+        """Test that the incremental hash matches compute_hash through random moves and undos, with both backends"""
+        rng = random.Random(5)
+        for backend in ('list', 'bitboard'):
+            game = Othello(backend)
+            start_hash = game.get_hash()
+            color = 'black'
+            for _ in range(30):
+                moves = game.return_available_positions(color)
+                if moves:
+                    game.make_move(color, rng.choice(sorted(moves)))
+                else:
+                    game.pass_move(color)
+                self.assertEqual(compute_hash(game.get_board()), game.get_hash())
+                color = 'white' if color == 'black' else 'black'
+            while game.get_move_history():
+                game.undo_move()
+                self.assertEqual(compute_hash(game.get_board()), game.get_hash())
+            self.assertEqual(start_hash, game.get_hash())
+
+    def test_case_2(self):
+        """Test that transpositions have the same hash, and position_key distinguishes the player to move"""
+        first_game = Othello()
+        first_game.make_move('black', (3, 4))
+        first_game.make_move('white', (8, 8))
+        first_game.make_move('black', (1, 1))
+        second_game = Othello()
+        second_game.make_move('black', (1, 1))
+        second_game.make_move('white', (8, 8))
+        second_game.make_move('black', (3, 4))
+        self.assertEqual(first_game.get_board(), second_game.get_board())
+        self.assertEqual(first_game.get_hash(), second_game.get_hash())
+        self.assertNotEqual(Othello().get_hash(), first_game.get_hash())
+        self.assertNotEqual(position_key(first_game, 'white'), position_key(first_game, 'black'))
+
+    def test_case_3(self):
+        """Test store, probe and the hit, miss and collision counters"""
+        table = TranspositionTable(100)
+        self.assertEqual(64, table.get_size())
+        self.assertIsNone(table.probe(5))
+        table.store(5, 3, 10, TranspositionTable.EXACT, (3, 4))
+        self.assertEqual((5, 3, 10, TranspositionTable.EXACT, (3, 4)), table.probe(5))
+        self.assertIsNone(table.probe(5 + 64))
+        self.assertEqual({'size': 64, 'hits': 1, 'misses': 2, 'collisions': 1, 'stores': 1}, table.get_statistics())
+        table.clear()
+        self.assertIsNone(table.probe(5))
+
+    def test_case_4(self):
+        """Test the depth-preferred and always-replace entries of a bucket"""
+        table = TranspositionTable(64)
+        table.store(1, 5, 10, TranspositionTable.EXACT, None)
+        # a shallower search of another position in the bucket goes to the always-replace entry
+        table.store(65, 2, 20, TranspositionTable.EXACT, None)
+        table.store(129, 1, 30, TranspositionTable.EXACT, None)
+        self.assertEqual(10, table.probe(1)[2])
+        self.assertIsNone(table.probe(65))
+        self.assertEqual(30, table.probe(129)[2])
+        # a search at least as deep replaces the depth-preferred entry
+        table.store(193, 6, 40, TranspositionTable.EXACT, None)
+        self.assertIsNone(table.probe(1))
+        self.assertEqual(40, table.probe(193)[2])